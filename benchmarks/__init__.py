@@ -0,0 +1,13 @@
+"""
+Benchmark scripts for the dormitory reservation application.
+
+Each module in this package is a standalone script that seeds a throwaway test database, exercises one
+code path and prints its measurements. Run them from the project root, for example:
+
+    python -m benchmarks.bench_search_availability
+
+benchmarks.bench_suite drives all the reservation pages at once and compares the results with a baseline.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
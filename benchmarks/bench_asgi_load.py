@@ -0,0 +1,176 @@
+"""
+Load test of the rooms and search pages with 1000 concurrent connections, under WSGI and under ASGI.
+
+Each deployment is measured in a child process, because the views are picked when the URLs are loaded:
+- wsgi: the synchronous views behind the WSGI handler, served by a pool of worker threads like a threaded
+  WSGI server; connections beyond the pool size wait in its queue.
+- asgi-sync: the synchronous views behind the ASGI handler, which runs each of them in a worker thread.
+- asgi-async: the views of reservation.async_views behind the ASGI handler (DORMITORY_ASYNC_VIEWS=1).
+The ASGI handler gives every request its own worker thread, and so its own database connection, so the ASGI
+deployments run with DORMITORY_DB_CONNECTIONS=none, as persistent connections would be left open by each
+request, and at most as many requests as there are WSGI threads are handled at once, like the concurrency
+limit of an ASGI server; without it 1000 requests open 1000 connections and PostgreSQL refuses most of them.
+Requests are sent to the handlers in-process, without sockets, so the numbers compare the request handling
+of the deployments and not an HTTP server. Every connection sends its requests one after the other,
+alternating between the rooms page and a search, and the throughput and the p50 and p99 latency, measured
+from the moment a request is sent, are printed.
+
+Usage:
+    python -m benchmarks.bench_asgi_load [connections] [requests per connection] [threads]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlencode
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, wsgi_environ
+
+DEFAULT_CONNECTIONS = 1000
+DEFAULT_REQUESTS = 5
+DEFAULT_THREADS = 32
+ROOMS = 5000
+DEPLOYMENTS = ['wsgi', 'asgi-sync', 'asgi-async']
+PAGES = [
+    ('/rooms', {}),
+    ('/search', {'city': 'Kraków', 'room_type': 'double', 'sort': 'price'}),
+]
+
+
+def asgi_scope(path, params):
+    return {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+        'path': path, 'raw_path': path.encode(), 'query_string': urlencode(params).encode(), 'root_path': '',
+        'headers': [(b'host', b'testserver')], 'client': ('127.0.0.1', 50000), 'server': ('testserver', 80),
+    }
+
+
+async def asgi_request(application, path, params):
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+    disconnected = asyncio.Event()
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    status = None
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await application(asgi_scope(path, params), receive, send)
+    disconnected.set()
+    if status != 200:
+        raise RuntimeError(f'unexpected status {status}')
+
+
+def run_asgi(connection_count, request_count, concurrency):
+    from django.core.asgi import get_asgi_application
+
+    application = get_asgi_application()
+    latencies = []
+
+    async def connection(number, limit):
+        for index in range(request_count):
+            start = time.perf_counter()
+            async with limit:
+                await asgi_request(application, *PAGES[(number + index) % len(PAGES)])
+            latencies.append(time.perf_counter() - start)
+
+    async def main():
+        limit = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(connection(number, limit) for number in range(connection_count)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return latencies, time.perf_counter() - start
+
+
+def run_wsgi(connection_count, request_count, thread_count):
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connections
+
+    handler = WSGIHandler()
+    latencies = []
+
+    def start_response(status, headers):
+        if not status.startswith('200'):
+            raise RuntimeError(f'unexpected status {status}')
+
+    def serve(environ, sent_at):
+        response = handler(environ, start_response)
+        b''.join(response)
+        response.close()
+        latencies.append(time.perf_counter() - sent_at)
+
+    def close_connections(barrier):
+        barrier.wait()
+        connections.close_all()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(thread_count) as pool:
+        # Each connection has one request in the queue at a time; the next is sent when it is answered.
+        pending = {pool.submit(serve, wsgi_environ(*PAGES[number % len(PAGES)]), time.perf_counter()): (number, 1)
+                   for number in range(connection_count)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                number, sent = pending.pop(future)
+                future.result()
+                if sent < request_count:
+                    environ = wsgi_environ(*PAGES[(number + sent) % len(PAGES)])
+                    pending[pool.submit(serve, environ, time.perf_counter())] = (number, sent + 1)
+        seconds = time.perf_counter() - start
+
+        barrier = threading.Barrier(thread_count)
+        for _ in range(thread_count):
+            pool.submit(close_connections, barrier)
+    return latencies, seconds
+
+
+def measure(deployment, connection_count, request_count, thread_count):
+    setup()
+
+    with benchmark_database() as connection:
+        seed_rooms(ROOMS)
+        connection.close()
+        if deployment == 'wsgi':
+            latencies, seconds = run_wsgi(connection_count, request_count, thread_count)
+        else:
+            latencies, seconds = run_asgi(connection_count, request_count, thread_count)
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f'{deployment:>10} {len(latencies) / seconds:>8.0f} {percentiles[49] * 1000:>9.1f} '
+          f'{percentiles[98] * 1000:>9.1f}')
+
+
+def main(connection_count, request_count, thread_count):
+    print(f'{connection_count} connections x {request_count} requests, {ROOMS} rooms, {thread_count} WSGI threads or ASGI requests at once')
+    print(f'{"deployment":>10} {"req/s":>8} {"p50 ms":>9} {"p99 ms":>9}')
+    for deployment in DEPLOYMENTS:
+        environ = dict(os.environ, DORMITORY_ASYNC_VIEWS='1' if deployment == 'asgi-async' else '0')
+        if deployment != 'wsgi':
+            environ['DORMITORY_DB_CONNECTIONS'] = 'none'
+        subprocess.run([sys.executable, '-m', 'benchmarks.bench_asgi_load', '--child', deployment,
+                        str(connection_count), str(request_count), str(thread_count)], env=environ, check=True)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        measure(sys.argv[2], *(int(value) for value in sys.argv[3:6]))
+    else:
+        arguments = [int(value) for value in sys.argv[1:4]]
+        defaults = [DEFAULT_CONNECTIONS, DEFAULT_REQUESTS, DEFAULT_THREADS]
+        main(*(arguments + defaults[len(arguments):]))
@@ -0,0 +1,83 @@
+"""
+Benchmark of the room availability calendar.
+
+Seeds rooms with a year of weekly reservations, builds their occupancy bitmaps and reads the 365-day
+calendar of every room from its bitmap. For comparison it also computes each calendar by scanning the
+room's reservations in the window, and requests it end to end through the JSON view. Prints p50/p99
+latency per room for each variant.
+
+Usage:
+    python -m benchmarks.bench_availability_calendar [rooms]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+from benchmarks.common import setup, benchmark_database, seed_rooms
+
+DEFAULT_ROOMS = 1000
+DAYS = 365
+START = date(2024, 1, 1)
+
+
+def percentiles(samples):
+    cuts = statistics.quantiles(samples, n=100)
+    return cuts[49] * 1000, cuts[98] * 1000
+
+
+def main(room_count):
+    setup()
+
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.test import Client
+    from reservation.models import DormRoom, RoomReservation
+    from reservation.occupancy import room_calendar
+
+    with benchmark_database():
+        user = User.objects.create_user(username='bench', password='bench')
+        seed_rooms(room_count)
+        room_ids = list(DormRoom.objects.values_list('id', flat=True))
+        RoomReservation.objects.bulk_create(
+            (RoomReservation(user=user, room_id=room_id, check_in_date=START + timedelta(days=week * 7 + room_id % 4),
+                             check_out_date=START + timedelta(days=week * 7 + room_id % 4 + 2))
+             for room_id in room_ids for week in range(52)),
+            batch_size=5000
+        )
+        call_command('rebuild_occupancy', stdout=open('/dev/null', 'w'))
+
+        client = Client()
+
+        def view(room_id):
+            client.get(f'/room/{room_id}/availability', {'start': START.isoformat(), 'days': DAYS})
+
+        def bitmap(room_id):
+            return room_calendar(room_id, START, DAYS)
+
+        def scan(room_id):
+            end = START + timedelta(days=DAYS - 1)
+            occupied = set()
+            for check_in, check_out in RoomReservation.objects.overlapping(START, end).filter(
+                    room_id=room_id).values_list('check_in_date', 'check_out_date'):
+                occupied.update(check_in + timedelta(days=day) for day in range((check_out - check_in).days + 1))
+            return [START + timedelta(days=day) in occupied for day in range(DAYS)]
+
+        print(f'{room_count} rooms x {DAYS} days')
+        print(f'{"variant":>8} {"p50 ms":>8} {"p99 ms":>8} {"total s":>8}')
+        for name, func in [('bitmap', bitmap), ('scan', scan), ('view', view)]:
+            samples = []
+            for room_id in room_ids:
+                start = time.perf_counter()
+                func(room_id)
+                samples.append(time.perf_counter() - start)
+            p50, p99 = percentiles(samples)
+            print(f'{name:>8} {p50:>8.3f} {p99:>8.3f} {sum(samples):>8.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROOMS)
@@ -0,0 +1,111 @@
+"""
+Benchmark of booking throughput with the overlap scan and with the per-night inventory.
+
+Seeds rooms with a year, or the given number of weeks, of weekly reservations, then books random three-night stays from several threads
+through book_room(), once with the overlap scan over the room's reservations under a row lock and once with the
+conditional UPDATE of the room's nights (BOOKING_INVENTORY). Each path runs in its own fresh database with the
+same history and the same sequence of stays; the inventory path rebuilds its inventory from the history first.
+Prints the attempts per second, the share that was booked and the p50/p99 latency of an attempt.
+
+Stays are booked in single rooms only, where selling by the bed and blocking the whole room refuse the same
+stays, so both paths do the same work; in shared rooms the inventory path books more of them.
+
+Usage:
+    python -m benchmarks.bench_booking_inventory [rooms] [attempts] [threads] [weeks of history]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from benchmarks.common import setup, benchmark_database, seed_rooms
+
+DEFAULT_ROOMS = 1000
+DEFAULT_ATTEMPTS = 5000
+DEFAULT_THREADS = 8
+START = date(2030, 1, 1)
+DEFAULT_WEEKS = 52
+
+
+def stays(room_ids, count, weeks):
+    picker = random.Random(42)
+    for _ in range(count):
+        check_in_date = START + timedelta(days=picker.randrange(weeks * 7))
+        yield picker.choice(room_ids), check_in_date, check_in_date + timedelta(days=3)
+
+
+def run(path, room_count, attempt_count, thread_count, weeks):
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test import override_settings
+    from reservation.models import DormRoom, RoomReservation
+    from reservation.services import book_room, BookingError
+
+    with benchmark_database(), override_settings(BOOKING_INVENTORY=path == 'inventory'):
+        user = User.objects.create_user(username='bench', password='bench')
+        seed_rooms(room_count)
+        room_ids = list(DormRoom.objects.values_list('id', flat=True))
+        single_room_ids = list(DormRoom.objects.filter(beds=1).values_list('id', flat=True))
+        RoomReservation.objects.bulk_create(
+            (RoomReservation(user=user, room_id=room_id, check_in_date=START + timedelta(days=week * 7 + room_id % 4),
+                             check_out_date=START + timedelta(days=week * 7 + room_id % 4 + 2))
+             for room_id in room_ids for week in range(weeks)),
+            batch_size=5000
+        )
+        call_command('rebuild_occupancy', stdout=open('/dev/null', 'w'))
+        rebuild_seconds = 0
+        if path == 'inventory':
+            start = time.perf_counter()
+            call_command('rebuild_inventory', stdout=open('/dev/null', 'w'))
+            rebuild_seconds = time.perf_counter() - start
+
+        def attempt(stay):
+            room_id, check_in_date, check_out_date = stay
+            start = time.perf_counter()
+            try:
+                book_room(RoomReservation(user=user, room_id=room_id, check_in_date=check_in_date,
+                                          check_out_date=check_out_date))
+                booked = True
+            except BookingError:
+                booked = False
+            return booked, time.perf_counter() - start
+
+        def close_connection(barrier):
+            barrier.wait()
+            connection.close()
+
+        connection.close()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(thread_count) as pool:
+            results = list(pool.map(attempt, stays(single_room_ids, attempt_count, weeks)))
+            seconds = time.perf_counter() - start
+            barrier = threading.Barrier(thread_count)
+            list(pool.map(close_connection, [barrier] * thread_count))
+
+    latencies = statistics.quantiles([latency for _, latency in results], n=100)
+    booked = sum(booked for booked, _ in results)
+    print(f'{path:>9} {attempt_count / seconds:>10.0f} {booked / attempt_count:>7.1%} {latencies[49] * 1000:>8.2f} '
+          f'{latencies[98] * 1000:>8.2f} {rebuild_seconds:>10.2f}')
+
+
+def main(room_count, attempt_count, thread_count, weeks):
+    setup()
+
+    print(f'{room_count} rooms x {weeks} reservations, {attempt_count} attempts from {thread_count} threads')
+    print(f'{"path":>9} {"attempts/s":>10} {"booked":>7} {"p50 ms":>8} {"p99 ms":>8} {"rebuild s":>10}')
+    for path in ['overlap', 'inventory']:
+        run(path, room_count, attempt_count, thread_count, weeks)
+
+
+if __name__ == '__main__':
+    arguments = [int(value) for value in sys.argv[1:5]]
+    defaults = [DEFAULT_ROOMS, DEFAULT_ATTEMPTS, DEFAULT_THREADS, DEFAULT_WEEKS]
+    main(*(arguments + defaults[len(arguments):]))
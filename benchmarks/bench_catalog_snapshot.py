@@ -0,0 +1,52 @@
+"""
+Benchmark of search filtering with the in-memory catalog snapshot versus the ORM.
+
+Seeds a catalog of rooms, builds the columnar snapshot and evaluates a set of typical faceted searches
+both as bit masks over the snapshot and as ORM queries returning the matching room IDs. Prints the snapshot
+build time and the best time per search for both variants.
+
+Usage:
+    python -m benchmarks.bench_catalog_snapshot [rooms]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import sys
+import time
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, timed
+
+DEFAULT_ROOMS = 100000
+SEARCHES = [
+    {'city': 'Kraków'},
+    {'room_type': 'Double', 'mini_kitchenette': 'Yes'},
+    {'city': 'Poznań', 'private_bathroom': 'No', 'max_price': '500 PLN'},
+    {'city': 'Warszawa', 'room_type': 'Triple', 'mini_kitchenette': 'Yes', 'private_bathroom': 'No'},
+]
+
+
+def main(room_count):
+    setup()
+
+    from reservation.catalog import CatalogSnapshot
+    from reservation.search import normalize_filters, filter_rooms
+
+    with benchmark_database():
+        seed_rooms(room_count)
+
+        start = time.perf_counter()
+        snapshot = CatalogSnapshot.from_database(version=0)
+        print(f'{room_count} rooms, snapshot built in {time.perf_counter() - start:.3f} s')
+
+        print(f'{"matches":>8} {"mask ms":>9} {"orm ms":>9}  search')
+        for params in SEARCHES:
+            filters = normalize_filters(params)
+            matches = len(snapshot.filter_ids(filters))
+            mask = timed(lambda: snapshot.filter_ids(filters), repeat=5)
+            orm = timed(lambda: list(filter_rooms(filters).order_by('id').values_list('id', flat=True)), repeat=5)
+            print(f'{matches:>8} {mask * 1000:>9.2f} {orm * 1000:>9.2f}  {params}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROOMS)
@@ -0,0 +1,93 @@
+"""
+Load test of the rooms and search pages with and without reused database connections.
+
+Seeds a catalog of rooms and serves requests through the WSGI handler from a fixed set of long-lived worker
+threads, like the threads of an application server, so connections are opened, reused and closed exactly as
+in production. Each connection mode of dormitory.database is run in turn and the p50 and p99 latency of both
+pages are printed. The pool mode is skipped when Django or the driver cannot keep a pool.
+
+Usage:
+    python -m benchmarks.bench_connection_pool [requests per thread] [threads]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import statistics
+import sys
+import threading
+import time
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, wsgi_environ
+
+DEFAULT_REQUESTS = 200
+DEFAULT_THREADS = 8
+ROOMS = 5000
+PAGES = {
+    'rooms': ('/rooms', {}),
+    'search': ('/search', {'city': 'Kraków', 'room_type': 'double', 'sort': 'price'}),
+}
+
+
+def run_worker(handler, request_count, latencies):
+    from django.db import connections
+
+    def start_response(status, headers):
+        if not status.startswith('200'):
+            raise RuntimeError(f'unexpected status {status}')
+
+    for index in range(request_count):
+        name = 'rooms' if index % 2 == 0 else 'search'
+        start = time.perf_counter()
+        response = handler(wsgi_environ(*PAGES[name]), start_response)
+        b''.join(response)
+        response.close()
+        latencies[name].append(time.perf_counter() - start)
+    connections.close_all()
+
+
+def run_mode(handler, request_count, thread_count):
+    latencies = {name: [] for name in PAGES}
+    threads = [threading.Thread(target=run_worker, args=(handler, request_count, latencies))
+               for _ in range(thread_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start
+
+
+def main(request_count, thread_count):
+    setup()
+
+    from django.core.handlers.wsgi import WSGIHandler
+    from dormitory.database import CONNECTION_MODES, database_settings, pool_supported
+
+    with benchmark_database() as connection:
+        seed_rooms(ROOMS)
+        connection.close()
+        handler = WSGIHandler()
+
+        print(f'{thread_count} threads x {request_count} requests, {ROOMS} rooms')
+        print(f'{"mode":>10} {"page":>7} {"p50 ms":>8} {"p99 ms":>8} {"req/s":>8}')
+        for mode in CONNECTION_MODES:
+            if mode == 'pool' and not pool_supported():
+                print(f'{mode:>10} skipped, needs Django 5.1 with psycopg 3 and psycopg_pool')
+                continue
+            settings = database_settings({'DORMITORY_DB_CONNECTIONS': mode})
+            connection.settings_dict.update(CONN_MAX_AGE=settings['CONN_MAX_AGE'],
+                                            CONN_HEALTH_CHECKS=settings.get('CONN_HEALTH_CHECKS', False),
+                                            OPTIONS=settings.get('OPTIONS', {}))
+
+            run_mode(handler, 10, thread_count)
+            latencies, seconds = run_mode(handler, request_count, thread_count)
+            for name, values in latencies.items():
+                percentiles = statistics.quantiles(values, n=100)
+                print(f'{mode:>10} {name:>7} {percentiles[49] * 1000:>8.2f} {percentiles[98] * 1000:>8.2f} '
+                      f'{request_count * thread_count / seconds:>8.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_THREADS)
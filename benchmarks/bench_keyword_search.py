@@ -0,0 +1,49 @@
+"""
+Benchmark of the keyword search against the previous `city__icontains` filter.
+
+Grows a catalog of rooms through several sizes and, at each size, times a set of keywords both with the
+indexed keyword search (DormRoom.objects.matching) and with the leading-wildcard `city__icontains` lookup the
+search view used before. Prints the number of matches and the best time of each variant. The icontains
+column only searches cities, so keywords naming a street match nothing there.
+
+Usage:
+    python -m benchmarks.bench_keyword_search [rooms ...]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import sys
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, timed
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+KEYWORDS = ['krakow', 'Kraków', 'krupnicza 17', 'swiat 250', 'rynek 4']
+
+
+def main(sizes):
+    setup()
+
+    from django.db import connection
+    from reservation.models import DormRoom
+
+    with benchmark_database():
+        seeded = 0
+        print(f'{"rooms":>8} {"index n":>8} {"index ms":>9} {"ilike n":>8} {"ilike ms":>9}  keyword')
+        for size in sizes:
+            seed_rooms(size - seeded, start=seeded)
+            seeded = size
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE reservation_dormroom')
+
+            for keyword in KEYWORDS:
+                indexed = DormRoom.objects.matching(keyword).values_list('id', flat=True)
+                icontains = DormRoom.objects.filter(city__icontains=keyword).values_list('id', flat=True)
+                indexed_time = timed(lambda: list(indexed.all()), repeat=5)
+                icontains_time = timed(lambda: list(icontains.all()), repeat=5)
+                print(f'{size:>8} {indexed.count():>8} {indexed_time * 1000:>9.2f} {icontains.count():>8} '
+                      f'{icontains_time * 1000:>9.2f}  {keyword}')
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,52 @@
+"""
+Benchmark of rendering a rooms page from cold and warm room card caches.
+
+Seeds a catalog of rooms and renders rooms.html with every room on one page. The cold variant clears the
+card cache before each render, so every card is rendered and stored; the warm variant stitches the page
+from the cached cards. Prints the best wall time of each variant.
+
+Usage:
+    python -m benchmarks.bench_room_cards [rooms]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import sys
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, timed
+
+DEFAULT_ROOMS = 5000
+
+
+def main(room_count):
+    setup()
+
+    from django.conf import settings
+    from django.core.cache import caches
+    from django.shortcuts import render
+    from django.test import RequestFactory
+    from reservation.models import DormRoom
+
+    with benchmark_database():
+        seed_rooms(room_count)
+        rooms = list(DormRoom.objects.order_by('id'))
+        request = RequestFactory().get('/rooms')
+        cache = caches[settings.ROOM_CARD_CACHE_ALIAS]
+
+        def page():
+            return render(request, 'rooms.html', {'room_data': rooms})
+
+        def cold():
+            cache.clear()
+            return page()
+
+        cold()
+        print(f'{room_count} rooms on one page')
+        print(f'{"cache":>6} {"seconds":>10}')
+        for name, func in [('cold', cold), ('warm', page)]:
+            print(f'{name:>6} {timed(func, repeat=5):>10.4f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROOMS)
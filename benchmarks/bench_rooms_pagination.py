@@ -0,0 +1,58 @@
+"""
+Benchmark of the rooms listing, paged versus unpaged.
+
+Seeds a catalog of rooms and renders rooms.html twice: once the way the listing used to work, with every
+room loaded and rendered, and once through the keyset-paginated rooms view. Prints the best wall time,
+the peak traced memory and the response size of each variant.
+
+Usage:
+    python -m benchmarks.bench_rooms_pagination [rooms]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import sys
+import tracemalloc
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, timed
+
+DEFAULT_ROOMS = 10000
+
+
+def measure(func):
+    tracemalloc.start()
+    response = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return timed(func), peak, len(response.content)
+
+
+def main(room_count):
+    setup()
+
+    from django.shortcuts import render
+    from django.test import RequestFactory
+    from reservation.models import DormRoom
+    from reservation.views import rooms
+
+    with benchmark_database():
+        seed_rooms(room_count)
+        factory = RequestFactory()
+
+        def unpaged():
+            request = factory.get('/rooms')
+            return render(request, 'rooms.html', {'room_data': list(DormRoom.objects.all())})
+
+        def paged():
+            return rooms(factory.get('/rooms'))
+
+        print(f'{room_count} rooms')
+        print(f'{"variant":>8} {"seconds":>10} {"peak MiB":>10} {"bytes":>12}')
+        for name, func in [('unpaged', unpaged), ('paged', paged)]:
+            seconds, peak, size = measure(func)
+            print(f'{name:>8} {seconds:>10.4f} {peak / 2 ** 20:>10.2f} {size:>12}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROOMS)
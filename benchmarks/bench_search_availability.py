@@ -0,0 +1,55 @@
+"""
+Benchmark of the date-filtered room search.
+
+Seeds catalogs of growing size, books a share of the rooms and runs the search view with an
+`arrival_departure` filter. Prints the number of SQL queries and the wall time per catalog size; the
+query count is expected to stay the same from the smallest to the largest catalog.
+
+Usage:
+    python -m benchmarks.bench_search_availability [sizes ...]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import sys
+from datetime import date
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, timed
+
+DEFAULT_SIZES = [24, 1000, 10000, 50000]
+
+
+def main(sizes):
+    setup()
+
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+    from reservation.models import DormRoom, RoomReservation
+
+    with benchmark_database():
+        user = User.objects.create_user(username='bench', password='bench')
+        client = Client()
+        data = {'arrival_departure': '2024-07-01 to 2024-07-10'}
+
+        print(f'{"rooms":>8} {"queries":>8} {"seconds":>10}')
+        for size in sizes:
+            DormRoom.objects.all().delete()
+            seed_rooms(size)
+            RoomReservation.objects.bulk_create(
+                RoomReservation(user=user, room_id=room_id, check_in_date=date(2024, 7, 5),
+                                check_out_date=date(2024, 7, 15))
+                for room_id in DormRoom.objects.values_list('id', flat=True)[::2]
+            )
+
+            with CaptureQueriesContext(connection) as queries:
+                client.post('/search', data)
+            query_count = len(queries)
+            seconds = timed(lambda: client.post('/search', data))
+            print(f'{size:>8} {query_count:>8} {seconds:>10.4f}')
+
+
+if __name__ == '__main__':
+    main([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,77 @@
+"""
+Benchmark of the index and rooms pages under the development and production settings profiles.
+
+Settings are read once per process, so every profile is measured in a child process started with its
+DORMITORY_PROFILE. The child seeds a catalog of rooms, serves the pages through the WSGI handler, once without
+and once with a browser-like Accept-Encoding header, and prints the requests per second and the average
+response size. The production profile needs a Redis or Memcached cache: DORMITORY_CACHE_URL, or a Redis server
+on localhost by default.
+
+Usage:
+    python -m benchmarks.bench_settings_profiles [requests per page]
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import setup, benchmark_database, seed_rooms, wsgi_environ
+
+DEFAULT_REQUESTS = 500
+ROOMS = 5000
+PROFILES = ['development', 'production']
+PAGES = ['/', '/rooms']
+ENCODINGS = ['identity', 'gzip, deflate, br']
+
+
+def measure(request_count):
+    setup()
+
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+
+    with benchmark_database(debug=None):
+        seed_rooms(ROOMS)
+        handler = WSGIHandler()
+
+        def request(path, encoding):
+            environ = wsgi_environ(path)
+            environ['HTTP_ACCEPT_ENCODING'] = encoding
+            response = handler(environ, lambda status, headers: None)
+            size = len(b''.join(response))
+            response.close()
+            return size
+
+        for path in PAGES:
+            for encoding in ENCODINGS:
+                for _ in range(20):
+                    request(path, encoding)
+                start = time.perf_counter()
+                size = sum(request(path, encoding) for _ in range(request_count))
+                seconds = time.perf_counter() - start
+                print(f'{settings.PROFILE:>12} {path:>7} {encoding.split(",")[0]:>9} '
+                      f'{request_count / seconds:>8.0f} {size // request_count:>8}')
+
+
+def main(request_count):
+    print(f'{ROOMS} rooms, {request_count} requests per page')
+    print(f'{"profile":>12} {"page":>7} {"accepts":>9} {"req/s":>8} {"bytes":>8}')
+    for profile in PROFILES:
+        environ = dict(os.environ, DORMITORY_PROFILE=profile)
+        environ.setdefault('DORMITORY_SECRET_KEY', 'benchmark-only-secret-key')
+        environ.setdefault('DORMITORY_ALLOWED_HOSTS', 'testserver')
+        if profile == 'production':
+            environ.setdefault('DORMITORY_CACHE_URL', 'redis://localhost:6379/0')
+        subprocess.run([sys.executable, '-m', 'benchmarks.bench_settings_profiles', '--child', str(request_count)],
+                       env=environ, check=True)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        measure(int(sys.argv[2]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_REQUESTS)
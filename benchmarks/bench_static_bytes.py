@@ -0,0 +1,104 @@
+"""
+Report of the bytes a first-time visitor downloads for the rooms page, before and after the static build.
+
+Seeds a catalog of rooms, runs `manage.py build_static` and renders the first page of the rooms listing. Every
+stylesheet, script, icon and room image the HTML references is then counted twice:
+- before: the original files, uncompressed, and the full-size JPEG of every room card;
+- after: the smallest precompressed copy (.br or .gz) of each file and, for room cards, the 400w thumbnail of
+  the first <source> format, as picked by a browser showing the card 400 CSS pixels wide.
+The HTML itself is counted uncompressed before and gzipped after, like GZipMiddleware sends it. Files loaded
+from stylesheets, such as fonts, and files of other sites, such as Google Fonts, are not counted.
+
+Usage:
+    python -m benchmarks.bench_static_bytes
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import gzip
+import io
+from html.parser import HTMLParser
+from pathlib import Path
+
+from benchmarks.common import setup, benchmark_database, seed_rooms
+
+ROOMS = 1000
+
+
+class AssetParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.files = []
+        self.images = []
+        self.sources = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'link' and attrs.get('rel') in ('stylesheet', 'icon', 'apple-touch-icon'):
+            self.add_file(attrs['href'])
+        elif tag == 'script' and attrs.get('src'):
+            self.add_file(attrs['src'])
+        elif tag == 'picture':
+            self.sources = []
+        elif tag == 'source' and self.sources is not None:
+            self.sources.append(attrs['srcset'])
+        elif tag == 'img':
+            self.images.append((attrs['src'], self.sources[0] if self.sources else None))
+
+    def add_file(self, url):
+        if not url.startswith(('http:', 'https:', '//')):
+            self.files.append(url)
+
+    def handle_endtag(self, tag):
+        if tag == 'picture':
+            self.sources = None
+
+
+def main():
+    setup()
+
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.test import RequestFactory
+    from reservation.views import rooms
+
+    with benchmark_database():
+        seed_rooms(ROOMS)
+        call_command('build_static', verbosity=0, stdout=io.StringIO(), stderr=io.StringIO())
+        html = rooms(RequestFactory().get('/rooms')).content
+
+    static_root = Path(settings.STATIC_ROOT)
+
+    def path_of(url):
+        return static_root / url.removeprefix(settings.STATIC_URL).removeprefix('/' + settings.STATIC_URL)
+
+    def smallest(path):
+        sizes = [path.stat().st_size]
+        sizes += [copy.stat().st_size for copy in (Path(f'{path}.br'), Path(f'{path}.gz')) if copy.is_file()]
+        return min(sizes)
+
+    parser = AssetParser()
+    parser.feed(html.decode())
+
+    rows = [('html', len(html), len(gzip.compress(html)))]
+    for url in parser.files:
+        path = path_of(url)
+        rows.append((url, path.stat().st_size, smallest(path)))
+    for src, srcset in parser.images:
+        after = src
+        if srcset:
+            after = next(candidate.split()[0] for candidate in srcset.split(', ') if candidate.endswith(' 400w'))
+        rows.append((src, path_of(src).stat().st_size, path_of(after).stat().st_size))
+
+    print(f'{"file":<60} {"before":>10} {"after":>10}')
+    for name, before, after in rows:
+        print(f'{name[-60:]:<60} {before:>10} {after:>10}')
+    before_total = sum(row[1] for row in rows)
+    after_total = sum(row[2] for row in rows)
+    print(f'{"total (" + str(len(rows)) + " requests)":<60} {before_total:>10} {after_total:>10}')
+    print(f'{after_total / before_total:.1%} of the original bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+"""
+End-to-end benchmark suite of the reservation pages, with JSON results and a baseline comparison mode.
+
+Seeds a synthetic catalog of rooms, users and a reservation history at the requested scale, then drives each
+scenario with concurrent clients, one thread and one logged-in user each, through the full middleware stack:
+- index: the main page.
+- rooms: pages of the room listing, at random cursors.
+- search: searches by city, room type, price sort and dates.
+- reservation: the booking page of a random room, then a booking of a random stay in it, timed together.
+- my_reservation: the reservations page of the client's user.
+For each scenario the throughput, the p50/p95/p99 latency, the SQL queries per request and the number of
+failed requests are reported as JSON, on stdout or in the --output file.
+
+With --baseline, the results are compared with a saved report and the script exits with status 1 when a
+scenario is slower, at p95 or in throughput, by more than --tolerance, makes more queries per request or
+fails requests the baseline did not.
+
+Usage:
+    python -m benchmarks.bench_suite [--rooms N] [--users N] [--reservations N] [--clients N] [--requests N]
+                                     [--scenarios index,rooms,...] [--output FILE] [--baseline FILE]
+                                     [--tolerance FRACTION]
+
+Scales from the default 1000 rooms and 10000 reservations to 1000000 of either. The data is written by
+reservation.synthetic, as by `manage.py generate_data`, with a fixed seed, so two runs at the same scale
+measure the same data.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from benchmarks.common import setup, benchmark_database
+
+SCENARIOS = ['index', 'rooms', 'search', 'reservation', 'my_reservation']
+START = date(2030, 1, 1)
+HISTORY_DAYS = 2 * 365
+SEED = 42
+
+
+def seed(room_count, user_count, reservation_count):
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from reservation.models import DormRoom
+    from reservation.synthetic import generate
+
+    generate(room_count, user_count, reservation_count, start=START - timedelta(days=HISTORY_DAYS // 2),
+             days=HISTORY_DAYS, seed=SEED, use_copy=connection.vendor == 'postgresql')
+    room_ids = list(DormRoom.objects.values_list('id', flat=True))
+    user_ids = list(User.objects.values_list('id', flat=True))
+    return room_ids, user_ids
+
+
+class Scenario:
+    """
+    Requests of one benchmark scenario, each returning the response of a request for a client.
+
+    Attributes:
+    - room_ids (list): IDs of the seeded rooms.
+    - picker (random.Random): Source of the random choices of one client.
+    - cities (tuple): Cities searched for, those of the synthetic catalog.
+    - room_types (tuple): Room types searched for.
+    """
+
+    def __init__(self, room_ids, picker):
+        from reservation.synthetic import CITIES, ROOM_TYPES
+
+        self.room_ids = room_ids
+        self.picker = picker
+        self.cities = CITIES
+        self.room_types = ROOM_TYPES
+
+    def index(self, client):
+        return client.get('/')
+
+    def rooms(self, client):
+        after = self.picker.choice(self.room_ids)
+        return client.get('/rooms', {'after': after} if self.picker.random() < 0.8 else {})
+
+    def search(self, client):
+        params = {'city': self.picker.choice(self.cities), 'sort': self.picker.choice(['price', '-price'])}
+        if self.picker.random() < 0.5:
+            params['room_type'] = self.picker.choice(self.room_types)
+        if self.picker.random() < 0.3:
+            check_in_date = START + timedelta(days=self.picker.randrange(365))
+            params['arrival_departure'] = f'{check_in_date} to {check_in_date + timedelta(days=3)}'
+        return client.get('/search', params)
+
+    def reservation(self, client):
+        room_id = self.picker.choice(self.room_ids)
+        page = client.get(f'/reservation/{room_id}/')
+        if page.status_code != 200:
+            return page
+        check_in_date = START + timedelta(days=self.picker.randrange(365))
+        return client.post(f'/reservation/{room_id}/', {
+            'room': room_id, 'check_in_date': check_in_date.isoformat(),
+            'check_out_date': (check_in_date + timedelta(days=3)).isoformat(), 'number_of_people': 1,
+        })
+
+    def my_reservation(self, client):
+        return client.get('/my_reservation')
+
+
+def run_scenario(name, room_ids, user_ids, client_count, request_count):
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test import Client
+
+    latencies, query_counts, errors = [], [], []
+    barrier = threading.Barrier(client_count)
+
+    def drive(number):
+        client = Client()
+        client.force_login(User.objects.get(id=user_ids[number % len(user_ids)]))
+        scenario = Scenario(room_ids, random.Random(SEED + number))
+        request = getattr(scenario, name)
+        counted = []
+
+        def count(execute, sql, params, many, context):
+            counted.append(sql)
+            return execute(sql, params, many, context)
+
+        barrier.wait()
+        start = time.perf_counter()
+        with connection.execute_wrapper(count):
+            for _ in range(request_count):
+                counted.clear()
+                sent_at = time.perf_counter()
+                response = request(client)
+                latencies.append(time.perf_counter() - sent_at)
+                query_counts.append(len(counted))
+                if response.status_code >= 400:
+                    errors.append(response.status_code)
+        finished = time.perf_counter()
+        connection.close()
+        return start, finished
+
+    with ThreadPoolExecutor(client_count) as pool:
+        spans = list(pool.map(drive, range(client_count)))
+
+    seconds = max(finished for _, finished in spans) - min(start for start, _ in spans)
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        'requests': len(latencies),
+        'throughput': round(len(latencies) / seconds, 1),
+        'p50_ms': round(cuts[49] * 1000, 2),
+        'p95_ms': round(cuts[94] * 1000, 2),
+        'p99_ms': round(cuts[98] * 1000, 2),
+        'queries_per_request': round(statistics.fmean(query_counts), 2),
+        'errors': len(errors),
+    }
+
+
+def compare(report, baseline, tolerance):
+    """
+    Lists the regressions of a report against a baseline report.
+
+    Parameters:
+    - report: dict, results of this run
+    - baseline: dict, results of an earlier run
+    - tolerance: float, allowed slowdown as a fraction of the baseline
+
+    Returns:
+    - list of str, one message per regression; scenarios missing from either report are skipped.
+    """
+
+    regressions = []
+    for name, result in report['results'].items():
+        expected = baseline['results'].get(name)
+        if expected is None:
+            continue
+        if result['p95_ms'] > expected['p95_ms'] * (1 + tolerance):
+            regressions.append(f'{name}: p95 {result["p95_ms"]} ms > baseline {expected["p95_ms"]} ms')
+        if result['throughput'] < expected['throughput'] * (1 - tolerance):
+            regressions.append(f'{name}: {result["throughput"]} req/s < baseline {expected["throughput"]} req/s')
+        if result['queries_per_request'] > expected['queries_per_request'] + 0.01:
+            regressions.append(f'{name}: {result["queries_per_request"]} queries/request > baseline '
+                               f'{expected["queries_per_request"]}')
+        if result['errors'] > expected['errors']:
+            regressions.append(f'{name}: {result["errors"]} failed requests > baseline {expected["errors"]}')
+    return regressions
+
+
+def main(options):
+    setup()
+
+    config = {name: getattr(options, name) for name in ['rooms', 'users', 'reservations', 'clients', 'requests']}
+    report = {'config': config, 'results': {}}
+    with benchmark_database() as connection:
+        start = time.perf_counter()
+        room_ids, user_ids = seed(options.rooms, options.users, options.reservations)
+        config['seed_seconds'] = round(time.perf_counter() - start, 2)
+        connection.close()
+
+        for name in options.scenarios:
+            report['results'][name] = run_scenario(name, room_ids, user_ids, options.clients, options.requests)
+            print(f'{name}: {report["results"][name]}', file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, 'w') as output:
+            output.write(text + '\n')
+    else:
+        print(text)
+
+    if options.baseline:
+        with open(options.baseline) as baseline:
+            regressions = compare(report, json.load(baseline), options.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_suite', description=__doc__.split('\n')[1])
+    parser.add_argument('--rooms', type=int, default=1000, help='Rooms in the catalog.')
+    parser.add_argument('--users', type=int, default=100, help='Users owning the reservations.')
+    parser.add_argument('--reservations', type=int, default=10000, help='Reservations in the history.')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent clients per scenario.')
+    parser.add_argument('--requests', type=int, default=50, help='Requests sent by each client.')
+    parser.add_argument('--scenarios', type=lambda value: value.split(','), default=SCENARIOS,
+                        help=f'Comma-separated scenarios, out of {",".join(SCENARIOS)}.')
+    parser.add_argument('--output', help='File to write the JSON report to, instead of stdout.')
+    parser.add_argument('--baseline', help='JSON report to compare with; exits with status 1 on a regression.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed slowdown against the baseline, as a fraction (default 0.2).')
+    options = parser.parse_args(arguments)
+    unknown = set(options.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+    return options
+
+
+if __name__ == '__main__':
+    main(parse_arguments(sys.argv[1:]))
@@ -0,0 +1,79 @@
+"""
+Helpers shared by the benchmark scripts.
+
+Functions:
+- setup(): Configures Django for a standalone benchmark script.
+- benchmark_database(debug): Context manager creating and destroying a throwaway test database.
+- seed_rooms(count, batch_size, start): Bulk-creates a synthetic catalog of dormitory rooms.
+- timed(func, repeat): Runs a callable several times and returns the best wall time in seconds.
+- wsgi_environ(path, params): Builds the WSGI environ of a GET request.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import io
+import os
+import time
+from contextlib import contextmanager
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+import django
+
+CITIES = ['Warszawa', 'Kraków', 'Poznań', 'Szczecin']
+STREETS = ['Nowy Świat', 'Krupnicza', 'Stary Rynek', 'Krzywoustego']
+ROOM_TYPES = ['single', 'double', 'triple']
+PRICES = [300, 400, 500, 700]
+
+
+def setup():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dormitory.settings')
+    django.setup()
+
+
+@contextmanager
+def benchmark_database(debug=False):
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    # debug=None keeps the DEBUG value of the settings profile.
+    setup_test_environment(debug=debug)
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def seed_rooms(count, batch_size=5000, start=0):
+    from reservation.models import DormRoom
+
+    rooms = [
+        DormRoom(city=CITIES[i % len(CITIES)],
+                 street=f'{STREETS[i % len(STREETS)]} {i // len(STREETS) % 1000 + 1}',
+                 room_type=ROOM_TYPES[i % len(ROOM_TYPES)], mini_kitchenette=i % 2 == 0,
+                 private_bathroom=i % 3 == 0, price=PRICES[i % len(PRICES)],
+                 image_name=f'room-{i % 24 + 1}.jpg')
+        for i in range(start, start + count)
+    ]
+    DormRoom.objects.bulk_create(rooms, batch_size=batch_size)
+
+
+def timed(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def wsgi_environ(path, params=None):
+    environ = {'PATH_INFO': path, 'QUERY_STRING': urlencode(params or {}), 'HTTP_HOST': 'testserver',
+               'wsgi.input': io.BytesIO()}
+    setup_testing_defaults(environ)
+    return environ
@@ -0,0 +1,61 @@
+"""
+Cache settings of the dormitory project, read from a cache URL.
+
+Functions:
+- cache_settings(url, max_entries, shared): Builds the settings of a cache from a URL such as redis://host:6379/0.
+
+Supported URLs:
+- locmem:// : a cache private to each process.
+- file:///path : files in a directory, shared by the processes of one host.
+- redis://host:port/db : a Redis server, needs the redis package.
+- memcached://host:port : a Memcached server, needs the pymemcache package.
+
+The search result cache invalidates entries by bumping version counters stored in this cache, so a site served
+by several processes needs a backend they share. The counters are bumped with incr(), which the file backend
+implements as a get followed by a set: two processes bumping at once can both write the same value, and one of
+the invalidations is lost. The file backend also culls by listing and deleting files on writes, which gets
+slow with many entries. Shared caches are therefore Redis or Memcached, whose incr() is atomic.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+
+BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+}
+SHARED_BACKENDS = ('redis', 'memcached')
+MAX_ENTRIES = 1000
+
+
+def cache_settings(url, max_entries=MAX_ENTRIES, shared=False):
+    """
+    Builds the settings of a cache from its URL.
+
+    Parameters:
+    - url: str, cache URL
+    - max_entries: int, entries kept by locmem and file caches before the oldest are culled
+    - shared: bool, whether several server processes share the cache, which requires an atomic incr()
+
+    Returns:
+    - Dictionary for an entry of CACHES.
+
+    Raises:
+    - ValueError: If the URL scheme is not supported.
+    - ImproperlyConfigured: If a shared cache does not use one of SHARED_BACKENDS.
+    """
+
+    scheme, separator, location = url.partition('://')
+    if shared and scheme not in SHARED_BACKENDS:
+        raise ImproperlyConfigured(f'A shared cache needs a redis:// or memcached:// URL, not {url!r}')
+    if not separator or scheme not in BACKENDS:
+        raise ValueError(f'Unsupported cache URL {url!r}, expected one of {", ".join(BACKENDS)}')
+
+    settings = {'BACKEND': BACKENDS[scheme], 'LOCATION': url if scheme == 'redis' else location}
+    if scheme in ('locmem', 'file'):
+        settings['OPTIONS'] = {'MAX_ENTRIES': max_entries}
+    return settings
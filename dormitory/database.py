@@ -0,0 +1,110 @@
+"""
+Database connection settings of the dormitory project, read from environment variables.
+
+Functions:
+- pool_supported(): Whether Django and the installed driver can keep a psycopg connection pool.
+- database_settings(environ): Builds the settings of the default PostgreSQL database.
+- replica_settings(default, environ): Builds the settings of the read replicas of the default database.
+
+DORMITORY_DB_CONNECTIONS selects how connections are reused:
+- 'none': a new connection for every request, as Django does by default.
+- 'persistent' (default): every worker thread keeps its connection for DORMITORY_DB_CONN_MAX_AGE seconds.
+- 'pool': a psycopg pool of DORMITORY_DB_POOL_MIN_SIZE to DORMITORY_DB_POOL_MAX_SIZE connections shared by the
+  threads of a process, waiting at most DORMITORY_DB_POOL_TIMEOUT seconds for a free one. Pools need Django 5.1
+  with psycopg 3 and psycopg_pool; without them the setting is refused rather than silently ignored.
+
+DORMITORY_DB_HEALTH_CHECKS=0 turns off the check of a reused connection before the first query of a request.
+
+DORMITORY_DB_REPLICAS lists the read replicas as comma-separated host[:port] pairs, named replica1, replica2, ...
+in DATABASES; reservation.routers.ReadReplicaRouter sends reads to them.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import importlib.util
+import django
+from django.core.exceptions import ImproperlyConfigured
+
+CONNECTION_MODES = ('none', 'persistent', 'pool')
+
+
+def pool_supported():
+    return (django.VERSION >= (5, 1) and importlib.util.find_spec('psycopg') is not None
+            and importlib.util.find_spec('psycopg_pool') is not None)
+
+
+def database_settings(environ):
+    """
+    Builds the settings of the default database.
+
+    Parameters:
+    - environ: mapping of environment variables, usually os.environ
+
+    Returns:
+    - Dictionary for DATABASES['default'].
+
+    Raises:
+    - ValueError: If DORMITORY_DB_CONNECTIONS names an unknown mode.
+    - ImproperlyConfigured: If a pool is requested but Django or the driver cannot keep one.
+    """
+
+    settings = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': environ.get('DORMITORY_DB_NAME', 'dorm_db'),
+        'USER': environ.get('DORMITORY_DB_USER', 'postgres'),
+        'PASSWORD': environ.get('DORMITORY_DB_PASSWORD', 'password'),
+        'HOST': environ.get('DORMITORY_DB_HOST', 'localhost'),
+        'PORT': environ.get('DORMITORY_DB_PORT', '5432'),
+        'CONN_MAX_AGE': 0,
+        'CONN_HEALTH_CHECKS': environ.get('DORMITORY_DB_HEALTH_CHECKS', '1') != '0',
+    }
+
+    mode = environ.get('DORMITORY_DB_CONNECTIONS', 'persistent')
+    if mode not in CONNECTION_MODES:
+        raise ValueError(f'DORMITORY_DB_CONNECTIONS must be one of {", ".join(CONNECTION_MODES)}, not {mode!r}')
+    if mode == 'pool' and not pool_supported():
+        raise ImproperlyConfigured('DORMITORY_DB_CONNECTIONS=pool needs Django 5.1 with psycopg 3 and psycopg_pool; '
+                                   "use 'persistent' connections instead")
+
+    if mode == 'persistent':
+        settings['CONN_MAX_AGE'] = int(environ.get('DORMITORY_DB_CONN_MAX_AGE', 60))
+    elif mode == 'pool':
+        # Django refuses persistent connections together with a pool, which checks connections on its own.
+        pool = {
+            'min_size': int(environ.get('DORMITORY_DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(environ.get('DORMITORY_DB_POOL_MAX_SIZE', 10)),
+            'timeout': float(environ.get('DORMITORY_DB_POOL_TIMEOUT', 10)),
+        }
+        if settings.pop('CONN_HEALTH_CHECKS'):
+            from psycopg_pool import ConnectionPool
+            pool['check'] = ConnectionPool.check_connection
+        settings['OPTIONS'] = {'pool': pool}
+
+    return settings
+
+
+def replica_settings(default, environ):
+    """
+    Builds the settings of the read replicas, which share the name, credentials and connection reuse of the
+    default database. Tests read the replicas through the test database, as mirrors of the default one.
+
+    Parameters:
+    - default: dictionary, settings of the default database
+    - environ: mapping of environment variables, usually os.environ
+
+    Returns:
+    - Dictionary mapping the aliases replica1, replica2, ... to their settings, in the order of DORMITORY_DB_REPLICAS.
+    """
+
+    replicas = {}
+    hosts = [host.strip() for host in environ.get('DORMITORY_DB_REPLICAS', '').split(',') if host.strip()]
+    for number, host in enumerate(hosts, start=1):
+        host, _, port = host.partition(':')
+        replicas[f'replica{number}'] = {
+            **default,
+            'HOST': host,
+            'PORT': port or default['PORT'],
+            'TEST': {'MIRROR': 'default'},
+        }
+    return replicas
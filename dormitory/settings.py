@@ -4,52 +4,84 @@ Django settings for the dormitory project.
 Settings are divided into different sections such as database configuration, template configuration,
 static files, and application-specific configurations.
 
+DORMITORY_PROFILE selects the settings profile:
+- 'development' (default): DEBUG, django_extensions and a cache private to the process.
+- 'production': no DEBUG, the secret key and allowed hosts read from DORMITORY_SECRET_KEY and
+  DORMITORY_ALLOWED_HOSTS, compressed responses with ETags, a Redis or Memcached cache shared by the server
+  processes, which DORMITORY_CACHE_URL must name, fingerprinted static files built by
+  `manage.py build_static`, and /metrics only served with DORMITORY_METRICS_TOKEN.
+Both profiles read the cache from DORMITORY_CACHE_URL, see dormitory/caches.py.
+
 Author: [ASF]
 Creation Date: [13.11.2023]
 """
 
 from pathlib import Path
 import os
+from django.core.exceptions import ImproperlyConfigured
+from dormitory.caches import cache_settings
+from dormitory.database import database_settings, replica_settings
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-SECRET_KEY = 'django-insecure-s&4c$e9=i=f8onn@qh-$jnq3dbo2vbkj^@eiz51(0gtu94t8u)'
+PROFILE = os.environ.get('DORMITORY_PROFILE', 'development')
+if PROFILE not in ('development', 'production'):
+    raise ImproperlyConfigured(f"DORMITORY_PROFILE must be 'development' or 'production', not {PROFILE!r}")
+PRODUCTION = PROFILE == 'production'
+
+if PRODUCTION:
+    SECRET_KEY = os.environ.get('DORMITORY_SECRET_KEY')
+    if not SECRET_KEY:
+        raise ImproperlyConfigured('The production profile needs DORMITORY_SECRET_KEY')
+else:
+    SECRET_KEY = 'django-insecure-s&4c$e9=i=f8onn@qh-$jnq3dbo2vbkj^@eiz51(0gtu94t8u)'
 
-DEBUG = True
+DEBUG = not PRODUCTION
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = [host for host in os.environ.get('DORMITORY_ALLOWED_HOSTS', '').split(',') if host]
+if PRODUCTION and not ALLOWED_HOSTS:
+    raise ImproperlyConfigured('The production profile needs DORMITORY_ALLOWED_HOSTS')
 
 INSTALLED_APPS = [
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
-    'django_extensions',
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'reservation',
 ]
+if not PRODUCTION:
+    INSTALLED_APPS.insert(3, 'django_extensions')
 
 MIDDLEWARE = [
+    'reservation.middleware.ViewStatsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'reservation.middleware.PrimaryPinMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
+if PRODUCTION:
+    # GZip compresses what the others produce, and the ETag is computed before compression. GZipMiddleware
+    # pads responses against BREACH and CSRF tokens are masked per request, so pages with forms are safe too.
+    MIDDLEWARE[2:2] = [
+        'django.middleware.gzip.GZipMiddleware',
+        'django.middleware.http.ConditionalGetMiddleware',
+    ]
 
 ROOT_URLCONF = 'dormitory.urls'
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [BASE_DIR, 'templates'],
-        'APP_DIRS': True,
+        'DIRS': [BASE_DIR / 'templates'],
+        'APP_DIRS': not PRODUCTION,
         'OPTIONS': {
             'context_processors': [
-                'django.template.context_processors.debug',
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
@@ -57,19 +89,40 @@ TEMPLATES = [
         },
     },
 ]
+if PRODUCTION:
+    # Compiled templates are kept for the life of the process; templates change only with a deployment.
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+else:
+    TEMPLATES[0]['OPTIONS']['context_processors'].insert(0, 'django.template.context_processors.debug')
 
 WSGI_APPLICATION = 'dormitory.wsgi.application'
 
+# Production processes share the search version counters, which need an atomic incr(), see dormitory/caches.py.
+# Room card fragments only depend on their key, so each process may keep its own copy.
+CACHES = {
+    'default': cache_settings(os.environ.get('DORMITORY_CACHE_URL', '' if PRODUCTION else 'locmem://'),
+                              shared=PRODUCTION),
+    'fragments': cache_settings(os.environ.get('DORMITORY_FRAGMENT_CACHE_URL', 'locmem://fragments'),
+                                max_entries=10000),
+}
+
+# Connection reuse and pool sizes come from DORMITORY_DB_* environment variables, see dormitory/database.py.
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'dorm_db',
-        'USER': 'postgres',
-        'PASSWORD': 'password',
-        'HOST': 'localhost',
-        'PORT': '5432',
-    },
+    'default': database_settings(os.environ),
 }
+# Read replicas come from DORMITORY_DB_REPLICAS; without any, every query goes to the default database.
+DATABASES.update(replica_settings(DATABASES['default'], os.environ))
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['reservation.routers.ReadReplicaRouter']
+# Sessions read from the primary for this long after a change, so users see their own bookings.
+REPLICA_PIN_SECONDS = int(os.environ.get('DORMITORY_REPLICA_PIN_SECONDS', 10))
+# A replica that refused a connection gets no reads for this long.
+REPLICA_RETRY_SECONDS = int(os.environ.get('DORMITORY_REPLICA_RETRY_SECONDS', 30))
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -96,6 +149,54 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = (os.path.join(BASE_DIR, 'static'),)
+STATIC_ROOT = os.environ.get('DORMITORY_STATIC_ROOT', BASE_DIR / 'staticfiles')
+
+# In production, `manage.py build_static` fingerprints the collected files, see reservation/assets.py.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': ('django.contrib.staticfiles.storage.ManifestStaticFilesStorage' if PRODUCTION
+                    else 'django.contrib.staticfiles.storage.StaticFilesStorage'),
+    },
+}
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+PAGE_SIZE = int(os.environ.get('DORMITORY_PAGE_SIZE', 24))
+MAX_PAGE_SIZE = 100
+
+SEARCH_CACHE_ALIAS = 'default'
+SEARCH_CACHE_TIMEOUT = 300
+
+ROOM_CARD_CACHE_ALIAS = 'fragments'
+ROOM_CARD_CACHE_TIMEOUT = 24 * 60 * 60
+
+ROOM_THUMBNAIL_DIR = 'assets/img/thumbs'
+ROOM_IMAGE_WIDTHS = (400, 800)
+ROOM_IMAGE_FORMATS = ('avif', 'webp')
+# Shown instead of room images missing from the static files, such as those not collected in production.
+ROOM_PLACEHOLDER_IMAGE = 'room-1.jpg'
+
+CATALOG_SNAPSHOT = os.environ.get('DORMITORY_CATALOG_SNAPSHOT') == '1'
+
+# Serve the read-heavy pages with reservation.async_views; only worth it under an ASGI server.
+ASYNC_VIEWS = os.environ.get('DORMITORY_ASYNC_VIEWS') == '1'
+
+# Book rooms by the bed through the per-night inventory; run rebuild_inventory before turning it on.
+BOOKING_INVENTORY = os.environ.get('DORMITORY_BOOKING_INVENTORY') == '1'
+
+AVAILABILITY_DAYS = 365
+MAX_AVAILABILITY_DAYS = 730
+
+# Per-view statistics are served at /metrics to the holders of the token, sent as 'Authorization: Bearer
+# <token>', or without a token to these addresses only. Behind a reverse proxy every client has the proxy's
+# address, so the production profile allows no address by default.
+METRICS_TOKEN = os.environ.get('DORMITORY_METRICS_TOKEN', '')
+DEFAULT_METRICS_ALLOWED_IPS = '' if PRODUCTION else '127.0.0.1,::1'
+METRICS_ALLOWED_IPS = [address for address in os.environ.get('DORMITORY_METRICS_ALLOWED_IPS',
+                                                             DEFAULT_METRICS_ALLOWED_IPS).split(',') if address]
+# Queries slower than this are logged; 0 turns the slow query log off.
+SLOW_QUERY_MS = int(os.environ.get('DORMITORY_SLOW_QUERY_MS', 200))
+
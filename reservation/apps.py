@@ -1,15 +1,22 @@
 """
 Django application configuration for the room reservation application.
 
-Configures the default auto field for models and sets the application name.
+Configures the default auto field for models, sets the application name and connects the signal handlers,
+including the post_migrate check of the SQLite keyword index triggers.
 
 Author: [ASF]
 Creation Date: [13.11.2023]
 """
 
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ReservationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reservation'
+
+    def ready(self):
+        from reservation import signals  # noqa: F401
+        from reservation.fulltext import restore_search_triggers
+        post_migrate.connect(restore_search_triggers, sender=self)
@@ -0,0 +1,166 @@
+"""
+Module containing the static asset build: room image thumbnails and precompressed files.
+
+Functions:
+- room_image_path(image_name): Returns the static path of a full-size room image.
+- thumbnail_path(image_name, width, image_format): Returns the static path of a room image thumbnail.
+- static_url(path): Returns the URL of a static file, or None when the storage cannot serve it.
+- room_image_url(image_name): Returns the URL of a full-size room image, or of the placeholder image.
+- room_image_sources(image_name): Returns the MIME type and srcset of each built thumbnail format of an image.
+- generate_thumbnails(image_names, directory): Writes the resized thumbnails of room images.
+- precompress(directory): Writes gzip and brotli copies of the compressible files of a directory.
+
+Thumbnails are written next to the source images, in ROOM_THUMBNAIL_DIR of the first STATICFILES_DIRS
+directory, so collectstatic fingerprints them like every other file. Room cards only offer the formats whose
+thumbnails exist in every width, so a site built without Pillow keeps serving the original JPEGs. With the
+fingerprinting storage of the production profile a file exists only if it is in the manifest: the strict
+manifest raises ValueError for anything else, so room images missing from it are replaced by
+ROOM_PLACEHOLDER_IMAGE and their thumbnails are not offered, instead of failing the whole page.
+
+Pillow, and the brotli package for .br files, are optional: without them the build skips that step.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import gzip
+import os
+from functools import lru_cache
+from pathlib import Path
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp'}
+THUMBNAIL_QUALITY = {'avif': 50, 'webp': 75}
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.map', '.svg', '.json', '.txt', '.xml', '.html', '.ico', '.ttf', '.eot'}
+MIN_COMPRESS_SIZE = 1024
+
+
+def room_image_path(image_name):
+    return f'assets/img/{image_name}'
+
+
+def thumbnail_path(image_name, width, image_format):
+    return f'{settings.ROOM_THUMBNAIL_DIR}/{Path(image_name).stem}-{width}.{image_format}'
+
+
+def static_url(path):
+    try:
+        if hasattr(staticfiles_storage, 'stored_name'):
+            # Manifest storage: only collected files have a fingerprinted name, even if the finders see others.
+            staticfiles_storage.stored_name(path)
+        elif not (staticfiles_storage.exists(path) or finders.find(path)):
+            return None
+        return static(path)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def room_image_url(image_name):
+    return (static_url(room_image_path(image_name))
+            or static_url(room_image_path(settings.ROOM_PLACEHOLDER_IMAGE)) or '')
+
+
+@lru_cache(maxsize=None)
+def room_image_sources(image_name):
+    """
+    Returns the <source> elements of a room image, best format first.
+
+    Parameters:
+    - image_name: str, file name of the room image
+
+    Returns:
+    - List of (MIME type, srcset) tuples, empty when no thumbnails were built.
+    """
+
+    sources = []
+    for image_format in settings.ROOM_IMAGE_FORMATS:
+        paths = [(thumbnail_path(image_name, width, image_format), width) for width in settings.ROOM_IMAGE_WIDTHS]
+        urls = [static_url(path) for path, _ in paths]
+        if all(urls):
+            srcset = ', '.join(f'{url} {width}w' for url, (_, width) in zip(urls, paths))
+            sources.append((MIME_TYPES[image_format], srcset))
+    return sources
+
+
+def generate_thumbnails(image_names, directory):
+    """
+    Writes a thumbnail of every room image in every configured width and format, skipping up-to-date files.
+
+    Parameters:
+    - image_names: iterable of room image file names
+    - directory: Path of the static directory holding assets/img
+
+    Returns:
+    - Tuple of the written thumbnail paths and the formats skipped because Pillow cannot encode them.
+    """
+
+    from PIL import Image, features
+
+    formats = [image_format for image_format in settings.ROOM_IMAGE_FORMATS if features.check(image_format)]
+    skipped = [image_format for image_format in settings.ROOM_IMAGE_FORMATS if image_format not in formats]
+    written = []
+    for image_name in sorted(set(image_names)):
+        source = directory / room_image_path(image_name)
+        if not source.is_file():
+            continue
+        with Image.open(source) as image:
+            image = image.convert('RGB')
+            for width in settings.ROOM_IMAGE_WIDTHS:
+                resized = None
+                for image_format in formats:
+                    target = directory / thumbnail_path(image_name, width, image_format)
+                    if target.is_file() and target.stat().st_mtime >= source.stat().st_mtime:
+                        continue
+                    if resized is None:
+                        height = round(image.height * width / image.width)
+                        resized = image.resize((width, height), Image.LANCZOS) if width < image.width else image
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    resized.save(target, image_format.upper(), quality=THUMBNAIL_QUALITY[image_format])
+                    written.append(target)
+    room_image_sources.cache_clear()
+    room_image_url.cache_clear()
+    return written, skipped
+
+
+def precompress(directory):
+    """
+    Writes .gz, and .br when brotli is installed, next to every compressible file larger than 1 KiB.
+
+    Copies that would not be smaller than the original are not written, so a web server serving precompressed
+    files (nginx gzip_static and brotli_static) falls back to the original.
+
+    Parameters:
+    - directory: Path of the collected static files
+
+    Returns:
+    - Tuple of the number of compressed files, their total size and the total size of their smallest copies.
+    """
+
+    count = original_bytes = compressed_bytes = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = Path(root) / name
+            if path.suffix not in COMPRESSIBLE_EXTENSIONS or path.stat().st_size < MIN_COMPRESS_SIZE:
+                continue
+            data = path.read_bytes()
+            copies = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                copies['.br'] = brotli.compress(data, quality=11)
+            sizes = [len(data)]
+            for suffix, compressed in copies.items():
+                if len(compressed) < len(data):
+                    path.with_name(name + suffix).write_bytes(compressed)
+                    sizes.append(len(compressed))
+            count += 1
+            original_bytes += len(data)
+            compressed_bytes += min(sizes)
+    return count, original_bytes, compressed_bytes
@@ -0,0 +1,163 @@
+"""
+Module containing asynchronous versions of the read-heavy views, for deployments served over ASGI.
+
+Views:
+- index(request): Renders the main page with a random selection of rooms.
+- my_reservation_view(request): Renders the page displaying user's reservations, both current and past.
+- search_view(request): Handles room search based on user input.
+- rooms(request): Renders the page with all available rooms, paginated by room ID.
+
+Functions:
+- aget_user(request): Loads the user of a request from the session outside the event loop.
+
+The views render the same pages as their counterparts in reservation.views, but read the database with the
+async ORM and the caches with the async cache API, so an ASGI server runs them on its event loop instead of
+handing every request to a worker thread. They are routed instead of the synchronous views when the
+ASYNC_VIEWS setting is enabled, see reservation.urls; under WSGI the synchronous views are faster. ASGI
+deployments should run with DORMITORY_DB_CONNECTIONS=none, because the ASGI handler gives every request its
+own worker thread and a persistent connection would be left open by each of them.
+
+Templates must not run queries in an async view, so every queryset is evaluated before rendering and the
+user, which AuthenticationMiddleware loads lazily from the session, is loaded first with aget_user() by the
+views whose templates show it.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.shortcuts import render, redirect
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import urlencode
+from reservation.models import DormRoom, RoomReservation
+from reservation.pagination import KeysetPaginator
+from reservation.search import (normalize_filters, search_paginator, asearch_page, asearch_last_modified,
+                                search_etag, catalog_snapshot)
+from random import sample
+
+
+async def aget_user(request):
+    """
+    Loads the user of a request from the session outside the event loop.
+
+    Parameters:
+    - request: HttpRequest object
+
+    Returns:
+    - The User, or AnonymousUser, which also replaces the lazy request.user.
+    """
+
+    request.user = await sync_to_async(get_user)(request)
+    return request.user
+
+
+async def index(request):
+    """
+    View for rendering the index page with a random selection of dormitory rooms.
+
+    Parameters:
+    - request: HttpRequest object
+
+    Returns:
+    - Rendered HTML page with a random selection of rooms.
+    """
+
+    await aget_user(request)
+    if settings.CATALOG_SNAPSHOT:
+        room_ids = (await sync_to_async(catalog_snapshot)()).sorted_ids
+        picked = sample(room_ids, min(5, len(room_ids)))
+        rooms_by_id = await DormRoom.objects.ain_bulk(picked)
+        random_rooms = [rooms_by_id[room_id] for room_id in picked if room_id in rooms_by_id]
+    else:
+        random_rooms = await DormRoom.objects.arandom_sample(5)
+
+    return render(request, 'index.html', {'room_data': random_rooms})
+
+
+async def my_reservation_view(request):
+    """
+        View for rendering user's reservations.
+
+        Parameters:
+        - request: HttpRequest object
+
+        Returns:
+        - Rendered HTML page displaying one page of the user's open reservations, by check-in date, and one page of
+          closed reservations, newest first.
+        - Redirect to the login page for anonymous users.
+        """
+
+    user = await aget_user(request)
+    if user.is_authenticated:
+        reservations = RoomReservation.objects.filter(user=user).select_related('room')
+        open_page = await KeysetPaginator(key=('check_in_date', 'id'), prefix='open_').apaginate_request(
+            reservations.filter(is_open=True), request)
+        page = await KeysetPaginator(key='-id').apaginate_request(reservations.filter(is_open=False), request)
+
+        return render(request, 'my_reservation.html',
+                      {'open_reservations': open_page.object_list,
+                       'open_page': open_page,
+                       'closed_reservations': page.object_list,
+                       'page': page})
+    else:
+        return redirect('login')
+
+
+async def search_view(request):
+    """
+       View for handling room search based on user input.
+
+       Behaves like reservation.views.search_view: POST requests redirect to the equivalent GET URL, and
+       responses carry an ETag and answer conditional requests with 304.
+
+       Parameters:
+       - request: HttpRequest object
+
+       Returns:
+       - Redirect to the GET search URL for POST requests.
+       - Rendered HTML search results page, or an empty 304 response.
+       """
+
+    if request.method == 'POST':
+        params = request.POST.copy()
+        params.pop('csrfmiddlewaretoken', None)
+        query = urlencode({name: value for name, value in params.items() if value})
+        return redirect(f"{reverse('search')}?{query}")
+
+    user = await aget_user(request)
+    filters = normalize_filters(request.GET)
+    paginator = search_paginator(filters)
+    params, after, before = paginator.read_request(request, DormRoom)
+    page = await asearch_page(filters, after, before, paginator.page_size)
+
+    last_modified = await asearch_last_modified(filters)
+    etag = search_etag(filters, page, last_modified, variant=(request.GET.urlencode(), user.is_authenticated))
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        page = paginator.link(await paginator.aload(page, DormRoom.objects.all()), params)
+        response = render(request, 'search.html', {'room_data': page.object_list, 'page': page})
+
+    response['ETag'] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+async def rooms(request):
+    """
+        View for rendering the rooms page with all available rooms, one keyset-paginated page at a time.
+
+        Parameters:
+        - request: HttpRequest object
+
+        Returns:
+        - Rendered HTML rooms page.
+        """
+
+    await aget_user(request)
+    room_ids = (await sync_to_async(catalog_snapshot)()).sorted_ids if settings.CATALOG_SNAPSHOT else None
+    page = await KeysetPaginator().apaginate_request(DormRoom.objects.all(), request, ids=room_ids)
+    return render(request, 'rooms.html', {'room_data': page.object_list, 'page': page})
@@ -0,0 +1,70 @@
+"""
+Module containing the cached room cards of the rooms and search pages.
+
+Functions:
+- render_room_cards(rooms): Returns the HTML of the cards of several rooms, rendering only the uncached ones.
+- invalidate_room_card(room_id): Drops the cached card of one room.
+
+Each card is rendered from room_card.html and cached in the cache configured by ROOM_CARD_CACHE_ALIAS under
+the ID of its room, together with the room's updated_at stamp. A page fetches all of its cards with one
+get_many, renders the missing or outdated ones and stores them with one set_many. Saving or deleting a room
+drops its card, and a card cached by another process is recognized as outdated by its stamp, so editing a
+room never touches the cards of other rooms.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+
+def _cache():
+    return caches[settings.ROOM_CARD_CACHE_ALIAS]
+
+
+def _card_key(room_id):
+    return f'room_card:{room_id}'
+
+
+def _stamp(room):
+    return room.updated_at.isoformat() if room.updated_at else None
+
+
+def render_room_cards(rooms):
+    """
+    Returns the HTML of the cards of several rooms, in the order of the rooms.
+
+    Parameters:
+    - rooms: iterable of DormRoom objects
+
+    Returns:
+    - Safe string with the concatenated cards.
+    """
+
+    rooms = list(rooms)
+    cached = _cache().get_many([_card_key(room.id) for room in rooms])
+    template = None
+    rendered = {}
+    cards = []
+    for room in rooms:
+        key = _card_key(room.id)
+        stamp = _stamp(room)
+        entry = cached.get(key)
+        if entry is not None and entry[0] == stamp:
+            cards.append(entry[1])
+            continue
+        template = template or get_template('room_card.html')
+        html = template.render({'room': room})
+        rendered[key] = (stamp, html)
+        cards.append(html)
+
+    if rendered:
+        _cache().set_many(rendered, settings.ROOM_CARD_CACHE_TIMEOUT)
+    return mark_safe(''.join(cards))
+
+
+def invalidate_room_card(room_id):
+    _cache().delete(_card_key(room_id))
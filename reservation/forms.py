@@ -46,7 +46,7 @@ class RoomReservationForm(forms.ModelForm):
 
             if room_id:
                 self.room = DormRoom.objects.get(id=room_id)
-                max_people = self.room.get_beds()
+                max_people = self.room.beds
                 self.fields['number_of_people'].widget.attrs['min'] = 1
                 self.fields['number_of_people'].widget.attrs['max'] = max_people
                 self.fields['number_of_people'].label = f'Number of People (max {max_people})'
@@ -61,7 +61,7 @@ class RoomReservationForm(forms.ModelForm):
         if check_in_date and check_out_date and check_out_date < check_in_date:
             self.add_error('check_out_date', "Check-out date must be after check-in date")
 
-        if hasattr(self, 'room') and number_of_people and number_of_people > self.room.get_beds():
+        if hasattr(self, 'room') and number_of_people and number_of_people > self.room.beds:
             self.add_error('number_of_people', "Number of people exceeds the room capacity")
 
         return cleaned_data
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Module containing the accent-insensitive keyword search over room cities and streets.
+
+Functions:
+- fold_text(value): Lowercases a text and strips its accents, so "Kraków" and "krakow" compare equal.
+- keyword_terms(keyword): Splits a keyword into the folded terms it is matched by.
+- match_keyword(queryset, keyword): Filters a room queryset to the rooms whose city or street match every term.
+- restore_search_triggers(using, **kwargs): Re-creates missing SQLite keyword index triggers after migrations.
+
+Rooms store the folded city and street in DormRoom.search_text, and every term of a keyword must match the
+start of a word in it, so "krak dlu" finds a room on Długa in Kraków. On PostgreSQL the terms are a prefix
+tsquery answered by a GIN index over to_tsvector('simple', search_text), which needs no extension. On SQLite
+they are a MATCH against an FTS5 table kept in sync by triggers. Migrations 0006 and 0007 create the index
+with their own copy of the SQL. SQLite drops the triggers whenever a migration rebuilds the room table, so
+restore_search_triggers() runs after every migrate and puts back any that are missing. Other backends fall
+back to substring matching on search_text.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import re
+import unicodedata
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models.expressions import RawSQL
+
+SEARCH_FTS_TABLE = 'reservation_dormroom_fts'
+SEARCH_FTS_TRIGGERS = [f'{SEARCH_FTS_TABLE}_{action}' for action in ('insert', 'delete', 'update')]
+
+# Letters with a stroke have no decomposed form, so unicodedata cannot strip them.
+_UNDECOMPOSABLE = str.maketrans({'ł': 'l', 'đ': 'd', 'ø': 'o', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe'})
+_TERM = re.compile(r'\w+')
+
+SQLITE_SEARCH_TRIGGERS_SQL = [
+    f"CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS_TABLE}_insert AFTER INSERT ON reservation_dormroom BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS_TABLE}_delete AFTER DELETE ON reservation_dormroom BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, search_text) "
+    f"VALUES ('delete', old.id, old.search_text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS_TABLE}_update AFTER UPDATE ON reservation_dormroom BEGIN "
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}, rowid, search_text) "
+    f"VALUES ('delete', old.id, old.search_text); "
+    f"INSERT INTO {SEARCH_FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text); END",
+    f"INSERT INTO {SEARCH_FTS_TABLE}({SEARCH_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def fold_text(value):
+    decomposed = unicodedata.normalize('NFKD', value.casefold().translate(_UNDECOMPOSABLE))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def keyword_terms(keyword):
+    return _TERM.findall(fold_text(keyword or ''))
+
+
+def match_keyword(queryset, keyword):
+    """
+    Filters rooms to those matching every term of a keyword.
+
+    Parameters:
+    - queryset: DormRoom queryset
+    - keyword: str, free text typed by the user
+
+    Returns:
+    - Filtered queryset; empty when the keyword has no terms.
+    """
+
+    terms = keyword_terms(keyword)
+    if not terms:
+        return queryset.none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        query = SearchQuery(' & '.join(f'{term}:*' for term in terms), config='simple', search_type='raw')
+        return queryset.alias(search=SearchVector('search_text', config='simple')).filter(search=query)
+    if vendor == 'sqlite':
+        query = ' '.join(f'"{term}"*' for term in terms)
+        return queryset.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {SEARCH_FTS_TABLE} WHERE {SEARCH_FTS_TABLE} MATCH %s', [query]))
+
+    for term in terms:
+        queryset = queryset.filter(search_text__contains=term)
+    return queryset
+
+
+def restore_search_triggers(using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Re-creates the SQLite triggers of the keyword index when a migration has dropped them, and rebuilds the
+    index content, which missed the room writes made without them. Connected to the post_migrate signal.
+
+    Parameters:
+    - using: str, alias of the migrated database
+
+    Returns:
+    - True if the triggers were restored, False if they were all present or the database has no FTS table.
+    """
+
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name IN (%s, %s, %s, %s)",
+                       [SEARCH_FTS_TABLE, *SEARCH_FTS_TRIGGERS])
+        names = {name for name, in cursor.fetchall()}
+        if SEARCH_FTS_TABLE not in names or names.issuperset(SEARCH_FTS_TRIGGERS):
+            return False
+        for statement in SQLITE_SEARCH_TRIGGERS_SQL:
+            cursor.execute(statement)
+    return True
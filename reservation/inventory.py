@@ -0,0 +1,133 @@
+"""
+Module maintaining the per-night bed inventory used by bookings when the BOOKING_INVENTORY setting is enabled.
+
+Functions:
+- stay_nights(check_in_date, check_out_date): Returns the nights of a stay.
+- beds_free(room, check_in_date, check_out_date): Returns the number of beds free on every night of a stay.
+- take_beds(room, check_in_date, check_out_date, beds): Takes beds on every night of a stay, if all are free.
+- release_beds(room, check_in_date, check_out_date, beds): Gives back the beds of a removed stay.
+- rebuild_room(room): Recomputes a room's inventory from its open reservations.
+- room_calendar(room_id, start_date, days): Returns one flag per day of the requested window, set on full nights.
+
+Every room has one RoomNight row per night with a booking, holding the number of beds still free; nights
+without a row are entirely free and their rows are created on first use. A booking takes its beds with one
+conditional UPDATE over the nights of the stay, `... SET beds_free = beds_free - n WHERE beds_free >= n`, so
+the availability check and the decrement are a single statement touching one row per night, whatever the
+number of reservations, and rooms are sold by the bed rather than blocked as a whole. If fewer rows than
+nights were updated, a night was full and the caller's transaction must be rolled back. Stays that are
+already full when read are refused before any row is written.
+
+A stay covers its days from check-in to check-out inclusive, like the overlap check of
+RoomReservationQuerySet.overlapping(), so both booking paths agree on which stays collide. Inventory is
+updated by book_room(), by the reservation and room signals and by the bulk writes of reservation.transfer
+and reservation.synthetic; after loading reservations by other means or before enabling BOOKING_INVENTORY, run
+the rebuild_inventory management command. With BOOKING_INVENTORY the search and the availability calendar
+read the free beds too, so partly booked shared rooms stay on offer.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from collections import Counter
+from datetime import timedelta
+from django.db import models, transaction
+from django.db.models import Count, F, Min
+from django.db.models.functions import Least
+from reservation.models import RoomNight, RoomReservation
+
+
+def stay_nights(check_in_date, check_out_date):
+    check_in_date, check_out_date = (models.DateField().to_python(day) for day in (check_in_date, check_out_date))
+    return [check_in_date + timedelta(days=day) for day in range((check_out_date - check_in_date).days + 1)]
+
+
+def _nights(room, check_in_date, check_out_date):
+    return RoomNight.objects.filter(room=room, night__range=(check_in_date, check_out_date))
+
+
+def _ensure_nights(room, nights):
+    RoomNight.objects.bulk_create([RoomNight(room=room, night=night, beds_free=room.beds) for night in nights],
+                                  ignore_conflicts=True)
+
+
+def beds_free(room, check_in_date, check_out_date):
+    """
+    Returns the number of beds that are free on every night of a stay.
+
+    Parameters:
+    - room: DormRoom
+    - check_in_date: date, first night of the stay
+    - check_out_date: date, last day of the stay
+
+    Returns:
+    - int, the smallest number of free beds over the nights of the stay.
+    """
+
+    fewest = _nights(room, check_in_date, check_out_date).aggregate(fewest=Min('beds_free'))['fewest']
+    return room.beds if fewest is None else fewest
+
+
+def take_beds(room, check_in_date, check_out_date, beds):
+    """
+    Takes beds on every night of a stay with one conditional UPDATE.
+
+    Must run inside a transaction, which the caller rolls back when False is returned, because the nights that
+    still had enough beds have been decremented.
+
+    Parameters:
+    - room: DormRoom
+    - check_in_date: date, first night of the stay
+    - check_out_date: date, last day of the stay
+    - beds: int, number of beds to take
+
+    Returns:
+    - True if every night had enough free beds, False otherwise.
+    """
+
+    nights = stay_nights(check_in_date, check_out_date)
+    stay = _nights(room, check_in_date, check_out_date)
+    # A plain read refuses most full stays without writing; the UPDATE checks the beds again under the row locks.
+    booked = stay.aggregate(count=Count('night'), fewest=Min('beds_free'))
+    if booked['fewest'] is not None and booked['fewest'] < beds:
+        return False
+    if booked['count'] < len(nights):
+        _ensure_nights(room, nights)
+
+    taken = stay.filter(beds_free__gte=beds).update(beds_free=F('beds_free') - beds)
+    return taken == len(nights)
+
+
+def release_beds(room, check_in_date, check_out_date, beds):
+    _nights(room, check_in_date, check_out_date).update(beds_free=Least(F('beds_free') + beds, room.beds))
+
+
+def rebuild_room(room):
+    """
+    Recomputes the inventory of a room from its open reservations.
+
+    Parameters:
+    - room: DormRoom
+
+    Returns:
+    - int, number of nights with at least one bed taken.
+    """
+
+    with transaction.atomic():
+        taken = Counter()
+        stays = RoomReservation.objects.filter(room=room, is_open=True)
+        for check_in_date, check_out_date, people in stays.values_list('check_in_date', 'check_out_date',
+                                                                       'number_of_people'):
+            for night in stay_nights(check_in_date, check_out_date):
+                taken[night] += people
+
+        RoomNight.objects.filter(room=room).delete()
+        RoomNight.objects.bulk_create(RoomNight(room=room, night=night, beds_free=max(room.beds - people, 0))
+                                      for night, people in taken.items())
+    return len(taken)
+
+
+def room_calendar(room_id, start_date, days):
+    last_date = start_date + timedelta(days=days - 1)
+    full = set(RoomNight.objects.filter(room_id=room_id, night__range=(start_date, last_date), beds_free=0)
+               .values_list('night', flat=True))
+    return [start_date + timedelta(days=day) in full for day in range(days)]
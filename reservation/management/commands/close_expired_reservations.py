@@ -0,0 +1,50 @@
+"""
+Management command closing the reservations whose stay has ended.
+
+Usage:
+    python manage.py close_expired_reservations [--batch-size N] [--interval SECONDS]
+
+Sets is_open to False on every open reservation with a check-out date before today, one batch of at most
+`--batch-size` rows per UPDATE, and reports the rows closed per second. Schedule it daily, for example from
+cron, or pass `--interval` to keep it running as a worker that repeats the run every SECONDS seconds. Runs can
+be interrupted and restarted at any time and are safe to run while bookings are made, see
+reservation.services.close_expired_reservations().
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import time
+from django.core.management.base import BaseCommand, CommandError
+from reservation.services import close_expired_reservations
+
+
+class Command(BaseCommand):
+    help = 'Closes open reservations whose check-out date has passed.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000, help='Reservations closed per UPDATE.')
+        parser.add_argument('--interval', type=int, help='Repeat the run every INTERVAL seconds.')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive.')
+
+        while True:
+            self.close_expired(options['batch_size'])
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def close_expired(self, batch_size):
+        start = time.perf_counter()
+        closed = 0
+        for count in close_expired_reservations(batch_size=batch_size):
+            closed += count
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f'Closed {closed} reservations ({closed / elapsed:.0f} rows/s).')
+
+        elapsed = time.perf_counter() - start
+        rate = closed / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Closed {closed} expired reservations in {elapsed:.1f} s ({rate:.0f} rows/s).'))
@@ -0,0 +1,44 @@
+"""
+Management command exporting room reservations to a CSV or JSON Lines file.
+
+Usage:
+    python manage.py export_reservations [path] [--format csv|jsonl] [--open-only] [--chunk-size N]
+
+Streams the reservations in ID order with `.iterator(chunk_size=...)`, so memory use stays constant whatever
+the size of the table. Writes to standard output when no path is given. The output can be loaded back with
+import_reservations.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from reservation.models import RoomReservation
+from reservation.transfer import FORMATS, export_reservations
+
+
+class Command(BaseCommand):
+    help = 'Exports reservations to a CSV or JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', help='File to write; standard output when omitted.')
+        parser.add_argument('--format', choices=FORMATS, help='File format; guessed from the file extension.')
+        parser.add_argument('--open-only', action='store_true', help='Export only open reservations.')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows fetched per query.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('jsonl' if path and path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be positive.')
+
+        queryset = RoomReservation.objects.all()
+        if options['open_only']:
+            queryset = queryset.filter(is_open=True)
+
+        if path is None:
+            count = export_reservations(self.stdout, file_format, queryset, chunk_size=options['chunk_size'])
+        else:
+            with open(path, 'w', newline='', encoding='utf-8') as stream:
+                count = export_reservations(stream, file_format, queryset, chunk_size=options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'Exported {count} reservations to {path}.'))
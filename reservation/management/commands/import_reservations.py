@@ -0,0 +1,55 @@
+"""
+Management command importing room reservations in bulk from a CSV or JSON Lines file.
+
+Usage:
+    python manage.py import_reservations path [--format csv|jsonl] [--chunk-size N]
+
+Reads the file as a stream, `--chunk-size` rows at a time, and inserts the valid reservations of every chunk
+with one bulk_create in its own transaction, see reservation.transfer. Each row needs the username,
+room_id, check_in_date, check_out_date (YYYY-MM-DD) and number_of_people fields; other fields, such as those
+written by export_reservations, are ignored. Use `-` as the path to read from standard input. Rejected rows
+are listed on standard error with their line number and do not stop the import.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import sys
+import time
+from contextlib import ExitStack
+from django.core.management.base import BaseCommand, CommandError
+from reservation.transfer import FORMATS, read_rows, import_reservations
+
+
+class Command(BaseCommand):
+    help = 'Imports reservations from a CSV or JSON Lines file in chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import, or - for standard input.')
+        parser.add_argument('--format', choices=FORMATS, help='File format; guessed from the file extension.')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows validated and inserted together.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be positive.')
+
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            if path == '-':
+                stream = sys.stdin
+            else:
+                try:
+                    stream = stack.enter_context(open(path, newline='', encoding='utf-8'))
+                except OSError as error:
+                    raise CommandError(f'Cannot open {path}: {error}')
+            result = import_reservations(read_rows(stream, file_format), chunk_size=options['chunk_size'])
+        elapsed = time.perf_counter() - start
+
+        for line_number, reason in result.rejected:
+            self.stderr.write(f'Line {line_number}: {reason}')
+        rate = result.imported / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {result.imported} reservations, rejected {len(result.rejected)} rows '
+            f'in {elapsed:.1f} s ({rate:.0f} rows/s).'))
@@ -0,0 +1,35 @@
+"""
+Management command rebuilding the per-night bed inventory used by bookings.
+
+Usage:
+    python manage.py rebuild_inventory [room_id ...]
+
+Recomputes the free beds of every night of the given rooms, or of every room, from their open reservations.
+Run it before enabling the BOOKING_INVENTORY setting and after loading reservations in bulk, which bypasses
+the signals that keep the inventory up to date.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.core.management.base import BaseCommand
+from reservation.models import DormRoom
+from reservation.inventory import rebuild_room
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the per-night bed inventory of the given rooms, or of all rooms.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('room_ids', nargs='*', type=int, help='IDs of the rooms to rebuild.')
+
+    def handle(self, *args, **options):
+        rooms = DormRoom.objects.all()
+        if options['room_ids']:
+            rooms = rooms.filter(id__in=options['room_ids'])
+
+        count = nights = 0
+        for room in rooms.iterator():
+            nights += rebuild_room(room)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt inventory of {count} rooms, {nights} booked nights.'))
@@ -0,0 +1,32 @@
+"""
+Management command rebuilding the occupancy bitmaps of the availability calendar.
+
+Usage:
+    python manage.py rebuild_occupancy [room_id ...]
+
+Recomputes the bitmap of the given rooms, or of every room, from their open reservations. Run it after
+loading reservations in bulk, which bypasses the signals that keep the bitmaps up to date.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.core.management.base import BaseCommand
+from reservation.models import DormRoom
+from reservation.occupancy import rebuild_room
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the occupancy bitmaps of the given rooms, or of all rooms.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('room_ids', nargs='*', type=int, help='IDs of the rooms to rebuild.')
+
+    def handle(self, *args, **options):
+        room_ids = options['room_ids'] or DormRoom.objects.values_list('id', flat=True).iterator()
+
+        count = 0
+        for room_id in room_ids:
+            rebuild_room(room_id)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt occupancy of {count} rooms.'))
@@ -0,0 +1,104 @@
+"""
+Management command seeding the default dormitory room catalog.
+
+Usage:
+    python manage.py seed_rooms
+
+The 24 rooms of the fictional dormitory network are inserted with a single bulk_create when the room table
+is empty; running the command again leaves an existing catalog untouched.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.core.management.base import BaseCommand
+from reservation.models import DormRoom
+from reservation.search import invalidate_rooms
+
+INITIAL_ROOMS = [
+    {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 500.00, 'image_name': 'room-1.jpg'},
+    {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 500.00, 'image_name': 'room-2.jpg'},
+    {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': True,
+     'price': 700.00, 'image_name': 'room-3.jpg'},
+    {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': True,
+     'price': 700.00, 'image_name': 'room-4.jpg'},
+    {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': True,
+     'private_bathroom': True,
+     'price': 700.00, 'image_name': 'room-5.jpg'},
+    {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'double', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 400.00, 'image_name': 'room-6.jpg'},
+    {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'double', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 400.00, 'image_name': 'room-7.jpg'},
+    {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 500.00, 'image_name': 'room-8.jpg'},
+    {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'double', 'mini_kitchenette': True,
+     'private_bathroom': False,
+     'price': 400.00, 'image_name': 'room-9.jpg'},
+    {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'triple', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 300.00, 'image_name': 'room-10.jpg'},
+    {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': True,
+     'price': 700.00, 'image_name': 'room-11.jpg'},
+    {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'double', 'mini_kitchenette': False,
+     'private_bathroom': True,
+     'price': 400.00, 'image_name': 'room-12.jpg'},
+    {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 500.00, 'image_name': 'room-13.jpg'},
+    {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 500.00, 'image_name': 'room-14.jpg'},
+    {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': True,
+     'private_bathroom': True,
+     'price': 700.00, 'image_name': 'room-15.jpg'},
+    {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': True,
+     'private_bathroom': True,
+     'price': 700.00, 'image_name': 'room-16.jpg'},
+    {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 500.00, 'image_name': 'room-17.jpg'},
+    {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 500.00, 'image_name': 'room-18.jpg'},
+    {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'double', 'mini_kitchenette': True,
+     'private_bathroom': True,
+     'price': 400.00, 'image_name': 'room-19.jpg'},
+    {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'double', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 400.00, 'image_name': 'room-20.jpg'},
+    {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'triple', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 300.00, 'image_name': 'room-21.jpg'},
+    {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'triple', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 300.00, 'image_name': 'room-22.jpg'},
+    {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'triple', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 300.00, 'image_name': 'room-23.jpg'},
+    {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'triple', 'mini_kitchenette': False,
+     'private_bathroom': False,
+     'price': 300.00, 'image_name': 'room-24.jpg'},
+]
+
+
+class Command(BaseCommand):
+    help = 'Seeds the default dormitory room catalog if no rooms exist yet.'
+
+    def handle(self, *args, **options):
+        if DormRoom.objects.exists():
+            self.stdout.write('Rooms already exist, nothing to seed.')
+            return
+
+        rooms = DormRoom.objects.bulk_create(DormRoom(**data) for data in INITIAL_ROOMS)
+        invalidate_rooms()
+        self.stdout.write(self.style.SUCCESS(f'Seeded {len(rooms)} rooms.'))
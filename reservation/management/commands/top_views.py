@@ -0,0 +1,60 @@
+"""
+Management command listing the views that spend the most time, from the per-view statistics of a server.
+
+Usage:
+    python manage.py top_views [--url URL] [--token TOKEN] [--sort sql|time|queries|requests|slow] [--limit N]
+
+Reads the Prometheus text served by the metrics view of a running server process, by default
+http://localhost:8000/metrics, or a saved copy with a file:// URL, and prints for the top views the request
+count, the mean and estimated p95 wall time, the queries per request and the share of the time spent in SQL.
+The metrics view is asked with the METRICS_TOKEN setting as a bearer token, unless another --token is given.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from reservation.metrics import parse_exposition
+
+SORT_KEYS = {
+    'sql': lambda stat: stat.query_seconds,
+    'time': lambda stat: stat.request_seconds,
+    'queries': lambda stat: stat.queries,
+    'requests': lambda stat: stat.requests,
+    'slow': lambda stat: stat.slow_queries,
+}
+
+
+class Command(BaseCommand):
+    help = 'Lists the views with the most SQL time, wall time, queries, requests or slow queries.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://localhost:8000/metrics',
+                            help='URL of the metrics view, or file:// URL of a saved copy.')
+        parser.add_argument('--token', help='Bearer token of the metrics view, by default the METRICS_TOKEN setting.')
+        parser.add_argument('--sort', choices=sorted(SORT_KEYS), default='sql', help='Total to rank the views by.')
+        parser.add_argument('--limit', type=int, default=10, help='Number of views to list.')
+
+    def handle(self, *args, **options):
+        token = options['token'] or settings.METRICS_TOKEN
+        request = Request(options['url'], headers={'Authorization': f'Bearer {token}'} if token else {})
+        try:
+            with urlopen(request, timeout=10) as response:
+                text = response.read().decode()
+        except (URLError, OSError) as error:
+            raise CommandError(f'Cannot read {options["url"]}: {error}')
+
+        stats = parse_exposition(text)
+        ranked = sorted(stats.items(), key=lambda item: SORT_KEYS[options['sort']](item[1]), reverse=True)
+
+        self.stdout.write(f'{"view":<20} {"requests":>9} {"mean ms":>9} {"p95 ms":>9} {"queries/req":>11} '
+                          f'{"sql ms":>10} {"sql %":>6} {"slow":>5}')
+        for view, stat in ranked[:options['limit']]:
+            requests = stat.requests or 1
+            sql_share = stat.query_seconds / stat.request_seconds if stat.request_seconds else 0
+            self.stdout.write(f'{view:<20} {stat.requests:>9} {stat.request_seconds / requests * 1000:>9.1f} '
+                              f'{(stat.quantile(0.95) or 0) * 1000:>9.1f} {stat.queries / requests:>11.1f} '
+                              f'{stat.query_seconds * 1000:>10.1f} {sql_share:>6.0%} {stat.slow_queries:>5}')
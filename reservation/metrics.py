@@ -0,0 +1,266 @@
+"""
+Module collecting per-view request and SQL statistics and exposing them in the Prometheus text format.
+
+Classes:
+- ViewStat: Counters and histograms of the requests of one view.
+- ViewStats: Thread-safe table of ViewStat by URL name, kept in memory by each server process.
+- QueryRecorder: Database execute wrapper counting and timing the queries of one request.
+
+Functions:
+- view_name(request): Returns the URL name a request was resolved to.
+- render_exposition(stats): Formats a snapshot of the statistics in the Prometheus text format.
+- parse_exposition(text): Reads the statistics back from the Prometheus text format.
+
+Each view keeps a fixed number of counters: the request duration and the number of queries per request are
+counted in histograms with the fixed buckets REQUEST_SECONDS_BUCKETS and QUERY_COUNT_BUCKETS, and the SQL
+time and slow queries in plain totals, so the memory used does not grow with traffic, only with the number
+of URL names. The statistics are filled by reservation.middleware.ViewStatsMiddleware and served by the
+metrics view; queries slower than the SLOW_QUERY_MS setting are logged to the 'reservation.sql' logger.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+REQUEST_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+UNRESOLVED_VIEW = 'unresolved'
+METRIC_PREFIX = 'dormitory_view'
+
+logger = logging.getLogger('reservation.sql')
+
+SAMPLE_PATTERN = re.compile(r'^(?P<name>\w+)\{view="(?P<view>(?:[^"\\]|\\.)*)"(?:,le="(?P<le>[^"]*)")?\} '
+                            r'(?P<value>\S+)$')
+
+
+class ViewStat:
+    """
+    Counters and histograms of the requests of one view.
+
+    Attributes:
+    - request_buckets (list): Number of requests per bucket of REQUEST_SECONDS_BUCKETS, plus one for slower ones.
+    - request_seconds (float): Total wall time of the requests.
+    - query_buckets (list): Number of requests per bucket of QUERY_COUNT_BUCKETS, plus one for more queries.
+    - queries (int): Total number of SQL queries.
+    - query_seconds (float): Total time spent in SQL queries.
+    - slow_queries (int): Number of queries slower than the SLOW_QUERY_MS setting.
+
+    Methods:
+    - requests: Number of requests.
+    - record(seconds, queries, query_seconds, slow_queries): Adds one request.
+    - quantile(q): Estimates a quantile of the request duration from the histogram.
+    """
+
+    def __init__(self):
+        self.request_buckets = [0] * (len(REQUEST_SECONDS_BUCKETS) + 1)
+        self.request_seconds = 0.0
+        self.query_buckets = [0] * (len(QUERY_COUNT_BUCKETS) + 1)
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.slow_queries = 0
+
+    @property
+    def requests(self):
+        return sum(self.request_buckets)
+
+    def record(self, seconds, queries, query_seconds, slow_queries):
+        self.request_buckets[bisect_left(REQUEST_SECONDS_BUCKETS, seconds)] += 1
+        self.request_seconds += seconds
+        self.query_buckets[bisect_left(QUERY_COUNT_BUCKETS, queries)] += 1
+        self.queries += queries
+        self.query_seconds += query_seconds
+        self.slow_queries += slow_queries
+
+    def quantile(self, q):
+        """
+        Estimates a quantile of the request duration by interpolating inside its histogram bucket.
+
+        Parameters:
+        - q: float between 0 and 1
+
+        Returns:
+        - float, seconds, or None without requests; requests above the last bucket count as its upper bound.
+        """
+
+        rank = q * self.requests
+        if not rank:
+            return None
+        seen = 0
+        for index, count in enumerate(self.request_buckets):
+            if count and seen + count >= rank:
+                lower = REQUEST_SECONDS_BUCKETS[index - 1] if index else 0.0
+                upper = REQUEST_SECONDS_BUCKETS[min(index, len(REQUEST_SECONDS_BUCKETS) - 1)]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return REQUEST_SECONDS_BUCKETS[-1]
+
+    def copy(self):
+        stat = ViewStat()
+        stat.__dict__.update(self.__dict__, request_buckets=list(self.request_buckets),
+                             query_buckets=list(self.query_buckets))
+        return stat
+
+
+class ViewStats:
+    """
+    Thread-safe table of ViewStat by URL name.
+
+    Methods:
+    - record(view, seconds, queries, query_seconds, slow_queries): Adds one request of a view.
+    - snapshot(): Returns a copy of the statistics of every view.
+    - reset(): Forgets all statistics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = defaultdict(ViewStat)
+
+    def record(self, view, seconds, queries, query_seconds, slow_queries):
+        with self._lock:
+            self._views[view].record(seconds, queries, query_seconds, slow_queries)
+
+    def snapshot(self):
+        with self._lock:
+            return {view: stat.copy() for view, stat in self._views.items()}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+view_stats = ViewStats()
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper counting and timing the queries of one request.
+
+    Install it with connection.execute_wrapper(); it only sees the queries of that connection in the current
+    thread.
+
+    Attributes:
+    - request: HttpRequest whose queries are recorded, used to name the view in the slow query log.
+    - threshold (float): Seconds from which a query is logged as slow, or None to log none.
+    - queries (int): Number of queries executed.
+    - seconds (float): Time spent in the queries.
+    - slow_queries (int): Number of queries logged as slow.
+    """
+
+    def __init__(self, request, threshold):
+        self.request = request
+        self.threshold = threshold
+        self.queries = 0
+        self.seconds = 0.0
+        self.slow_queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.queries += 1
+            self.seconds += duration
+            if self.threshold is not None and duration >= self.threshold:
+                self.slow_queries += 1
+                logger.warning('Slow query in %s (%.1f ms): %s', view_name(self.request), duration * 1000, sql)
+
+
+def view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match else UNRESOLVED_VIEW
+
+
+def _label(view):
+    return view.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _unlabel(value):
+    return re.sub(r'\\(.)', lambda match: '\n' if match.group(1) == 'n' else match.group(1), value)
+
+
+def _histogram(lines, name, bounds, stats, buckets, total):
+    for view, stat in stats.items():
+        cumulative = 0
+        for bound, count in zip(list(bounds) + ['+Inf'], getattr(stat, buckets)):
+            cumulative += count
+            lines.append(f'{name}_bucket{{view="{_label(view)}",le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{view="{_label(view)}"}} {getattr(stat, total)}')
+        lines.append(f'{name}_count{{view="{_label(view)}"}} {stat.requests}')
+
+
+def render_exposition(stats):
+    """
+    Formats statistics in the Prometheus text exposition format.
+
+    Parameters:
+    - stats: dict of ViewStat by URL name, as returned by ViewStats.snapshot()
+
+    Returns:
+    - str, one histogram of the request duration, one of the queries per request and two counters.
+    """
+
+    lines = [f'# HELP {METRIC_PREFIX}_request_seconds Wall time of the requests, by URL name.',
+             f'# TYPE {METRIC_PREFIX}_request_seconds histogram']
+    _histogram(lines, f'{METRIC_PREFIX}_request_seconds', REQUEST_SECONDS_BUCKETS, stats, 'request_buckets',
+               'request_seconds')
+    lines += [f'# HELP {METRIC_PREFIX}_queries SQL queries per request, by URL name.',
+              f'# TYPE {METRIC_PREFIX}_queries histogram']
+    _histogram(lines, f'{METRIC_PREFIX}_queries', QUERY_COUNT_BUCKETS, stats, 'query_buckets', 'queries')
+    for name, attribute, description in [('query_seconds_total', 'query_seconds', 'Time spent in SQL queries'),
+                                         ('slow_queries_total', 'slow_queries', 'Slow SQL queries')]:
+        lines += [f'# HELP {METRIC_PREFIX}_{name} {description}, by URL name.',
+                  f'# TYPE {METRIC_PREFIX}_{name} counter']
+        lines += [f'{METRIC_PREFIX}_{name}{{view="{_label(view)}"}} {getattr(stat, attribute)}'
+                  for view, stat in stats.items()]
+    return '\n'.join(lines) + '\n'
+
+
+def parse_exposition(text):
+    """
+    Reads statistics back from the output of render_exposition().
+
+    Parameters:
+    - text: str in the Prometheus text exposition format; unknown metrics are ignored
+
+    Returns:
+    - dict of ViewStat by URL name.
+    """
+
+    stats = defaultdict(ViewStat)
+    cumulative = {}
+    fields = {
+        f'{METRIC_PREFIX}_request_seconds_sum': ('request_seconds', float),
+        f'{METRIC_PREFIX}_queries_sum': ('queries', int),
+        f'{METRIC_PREFIX}_query_seconds_total': ('query_seconds', float),
+        f'{METRIC_PREFIX}_slow_queries_total': ('slow_queries', int),
+    }
+    histograms = {
+        f'{METRIC_PREFIX}_request_seconds_bucket': ('request_buckets', REQUEST_SECONDS_BUCKETS),
+        f'{METRIC_PREFIX}_queries_bucket': ('query_buckets', QUERY_COUNT_BUCKETS),
+    }
+
+    for line in text.splitlines():
+        sample = SAMPLE_PATTERN.match(line)
+        if not sample:
+            continue
+        name, view, value = sample['name'], _unlabel(sample['view']), sample['value']
+        stat = stats[view]
+        if name in fields:
+            attribute, convert = fields[name]
+            setattr(stat, attribute, convert(float(value)))
+        elif name in histograms and sample['le'] is not None:
+            attribute, bounds = histograms[name]
+            labels = [str(bound) for bound in bounds] + ['+Inf']
+            index = labels.index(sample['le'])
+            count = int(float(value))
+            previous = cumulative.get((name, view), 0)
+            getattr(stat, attribute)[index] = count - previous
+            cumulative[name, view] = count
+    return dict(stats)
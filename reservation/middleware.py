@@ -0,0 +1,122 @@
+"""
+Module containing the middleware of the room reservation application.
+
+Classes:
+- ViewStatsMiddleware: Records the wall time and the SQL queries of every request by URL name.
+- PrimaryPinMiddleware: Reads from the primary database for a while after a user changes something.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import time
+from contextlib import ExitStack
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from reservation.metrics import QueryRecorder, view_name, view_stats
+from reservation.routers import pin_session, session_pinned, use_primary, use_replica
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+
+
+class ViewStatsMiddleware:
+    """
+    Middleware recording, for each resolved URL name, the request count and wall time and the number and time of
+    the SQL queries, in reservation.metrics.view_stats.
+
+    Queries are counted with execute_wrapper() on the connections to the default database and the read
+    replicas, which belong to one thread. Under ASGI the middleware runs in the event loop, and the async ORM
+    of reservation.async_views and the synchronous views run their queries in the request's thread-sensitive
+    executor thread, so the wrappers are installed on that thread's connections.
+    It is both sync and async capable, so Django does not adapt the middleware chain around it, and it should
+    come first in MIDDLEWARE, so the time includes the other middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.slow_query_seconds = settings.SLOW_QUERY_MS / 1000 if settings.SLOW_QUERY_MS else None
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def record_queries(self, recorder):
+        stack = ExitStack()
+        for alias in [DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS]:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        return stack
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        recorder = QueryRecorder(request, self.slow_query_seconds)
+        start = time.perf_counter()
+        with self.record_queries(recorder):
+            response = self.get_response(request)
+        view_stats.record(view_name(request), time.perf_counter() - start, recorder.queries, recorder.seconds,
+                          recorder.slow_queries)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder(request, self.slow_query_seconds)
+        start = time.perf_counter()
+        # sync_to_async() is thread-sensitive by default, so this is the thread that runs the request's queries.
+        stack = await sync_to_async(self.record_queries)(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        view_stats.record(view_name(request), time.perf_counter() - start, recorder.queries, recorder.seconds,
+                          recorder.slow_queries)
+        return response
+
+
+class PrimaryPinMiddleware:
+    """
+    Middleware giving users read-your-writes consistency with the read replicas of reservation.routers.
+
+    After a successful POST, PUT, PATCH or DELETE by a logged-in user, such as a booking, the session is pinned
+    to the primary database for REPLICA_PIN_SECONDS, and the reads of its requests skip the replicas until then,
+    so the my_reservation page shows the new booking before the replicas have it. The reads of other requests
+    all go to one replica, see reservation.routers.use_replica(). It must come after AuthenticationMiddleware
+    and does nothing without replicas. It is both sync and async capable; the async branch loads the session
+    and the user in a thread, as they are read with the synchronous ORM.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def pin_writer(request):
+        if request.user.is_authenticated:
+            pin_session(request)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        with use_primary() if session_pinned(request) else use_replica():
+            response = self.get_response(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            self.pin_writer(request)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+
+        with use_primary() if await sync_to_async(session_pinned)(request) else use_replica():
+            response = await self.get_response(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            await sync_to_async(self.pin_writer)(request)
+        return response
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.6 on 2026-10-18 00:37
+
+from django.db import migrations, models
+
+
+STAY_GIST_INDEX = 'reservation_stay_gist_idx'
+
+
+def create_stay_gist_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {STAY_GIST_INDEX} ON reservation_roomreservation "
+        f"USING gist (daterange(check_in_date, check_out_date, '[]')) WHERE is_open"
+    )
+
+
+def drop_stay_gist_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {STAY_GIST_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='roomreservation',
+            index=models.Index(fields=['room', 'is_open', 'check_in_date', 'check_out_date'], name='reservation_room_stay_idx'),
+        ),
+        migrations.RunPython(create_stay_gist_index, drop_stay_gist_index),
+    ]
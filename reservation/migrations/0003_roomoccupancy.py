@@ -0,0 +1,21 @@
+# Generated by Django 4.2.6 on 2026-10-18 00:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0002_roomreservation_stay_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomOccupancy',
+            fields=[
+                ('room', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='occupancy', serialize=False, to='reservation.dormroom')),
+                ('bitmap', models.BinaryField(default=bytes)),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.6 on 2026-10-18 00:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0003_roomoccupancy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dormroom',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='roomreservation',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
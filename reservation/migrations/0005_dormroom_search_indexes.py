@@ -0,0 +1,29 @@
+# Generated by Django 4.2.6 on 2026-10-18 01:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0004_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dormroom',
+            index=models.Index(fields=['price', 'id'], name='dormroom_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dormroom',
+            index=models.Index(fields=['city', 'id'], name='dormroom_city_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dormroom',
+            index=models.Index(fields=['city', 'price', 'id'], name='dormroom_city_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dormroom',
+            index=models.Index(fields=['city', 'room_type', 'price', 'id'], name='dormroom_city_type_price_idx'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.6 on 2026-10-18 01:20
+
+import unicodedata
+from django.db import migrations, models
+
+# Frozen copies of reservation.fulltext as of this migration, so later changes to the app do not alter it.
+UNDECOMPOSABLE = str.maketrans({'ł': 'l', 'đ': 'd', 'ø': 'o', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe'})
+
+POSTGRESQL_CREATE_INDEX = [
+    "CREATE INDEX IF NOT EXISTS dormroom_search_text_gin_idx ON reservation_dormroom "
+    "USING gin (to_tsvector('simple'::regconfig, COALESCE(search_text, '')))",
+]
+POSTGRESQL_DROP_INDEX = [
+    'DROP INDEX IF EXISTS dormroom_search_text_gin_idx',
+]
+SQLITE_CREATE_INDEX = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS reservation_dormroom_fts USING fts5("
+    "search_text, content='reservation_dormroom', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS reservation_dormroom_fts_insert AFTER INSERT ON reservation_dormroom BEGIN "
+    "INSERT INTO reservation_dormroom_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+    "CREATE TRIGGER IF NOT EXISTS reservation_dormroom_fts_delete AFTER DELETE ON reservation_dormroom BEGIN "
+    "INSERT INTO reservation_dormroom_fts(reservation_dormroom_fts, rowid, search_text) "
+    "VALUES ('delete', old.id, old.search_text); END",
+    "CREATE TRIGGER IF NOT EXISTS reservation_dormroom_fts_update AFTER UPDATE ON reservation_dormroom BEGIN "
+    "INSERT INTO reservation_dormroom_fts(reservation_dormroom_fts, rowid, search_text) "
+    "VALUES ('delete', old.id, old.search_text); "
+    "INSERT INTO reservation_dormroom_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+    "INSERT INTO reservation_dormroom_fts(reservation_dormroom_fts) VALUES ('rebuild')",
+]
+SQLITE_DROP_INDEX = [
+    'DROP TRIGGER IF EXISTS reservation_dormroom_fts_insert',
+    'DROP TRIGGER IF EXISTS reservation_dormroom_fts_delete',
+    'DROP TRIGGER IF EXISTS reservation_dormroom_fts_update',
+    'DROP TABLE IF EXISTS reservation_dormroom_fts',
+]
+
+
+def fold_text(value):
+    decomposed = unicodedata.normalize('NFKD', value.casefold().translate(UNDECOMPOSABLE))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def run_for_vendor(postgresql, sqlite):
+    def run(apps, schema_editor):
+        statements = {'postgresql': postgresql, 'sqlite': sqlite}.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+def backfill_search_text(apps, schema_editor):
+    DormRoom = apps.get_model('reservation', 'DormRoom')
+    batch = []
+    for room in DormRoom.objects.only('id', 'city', 'street').iterator(chunk_size=2000):
+        room.search_text = fold_text(f'{room.city} {room.street}')
+        batch.append(room)
+        if len(batch) == 2000:
+            DormRoom.objects.bulk_update(batch, ['search_text'])
+            batch = []
+    DormRoom.objects.bulk_update(batch, ['search_text'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0005_dormroom_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dormroom',
+            name='search_text',
+            field=models.CharField(default='', editable=False, max_length=60),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(run_for_vendor(POSTGRESQL_CREATE_INDEX, SQLITE_CREATE_INDEX),
+                             run_for_vendor(POSTGRESQL_DROP_INDEX, SQLITE_DROP_INDEX)),
+    ]
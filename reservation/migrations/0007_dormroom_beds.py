@@ -0,0 +1,55 @@
+# Generated by Django 4.2.6 on 2026-10-18 01:40
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+# SQLite adds the column by rebuilding the table, which drops the triggers of the keyword index. Frozen copy of
+# the triggers of 0006_dormroom_search_text; the FTS table itself survives, only its content is rebuilt.
+SQLITE_SEARCH_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS reservation_dormroom_fts_insert AFTER INSERT ON reservation_dormroom BEGIN "
+    "INSERT INTO reservation_dormroom_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+    "CREATE TRIGGER IF NOT EXISTS reservation_dormroom_fts_delete AFTER DELETE ON reservation_dormroom BEGIN "
+    "INSERT INTO reservation_dormroom_fts(reservation_dormroom_fts, rowid, search_text) "
+    "VALUES ('delete', old.id, old.search_text); END",
+    "CREATE TRIGGER IF NOT EXISTS reservation_dormroom_fts_update AFTER UPDATE ON reservation_dormroom BEGIN "
+    "INSERT INTO reservation_dormroom_fts(reservation_dormroom_fts, rowid, search_text) "
+    "VALUES ('delete', old.id, old.search_text); "
+    "INSERT INTO reservation_dormroom_fts(rowid, search_text) VALUES (new.id, new.search_text); END",
+    "INSERT INTO reservation_dormroom_fts(reservation_dormroom_fts) VALUES ('rebuild')",
+]
+
+
+def backfill_beds(apps, schema_editor):
+    DormRoom = apps.get_model('reservation', 'DormRoom')
+    DormRoom.objects.update(beds=Case(
+        When(room_type='single', then=Value(1)),
+        When(room_type='double', then=Value(2)),
+        default=Value(3),
+    ))
+
+
+def recreate_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in SQLITE_SEARCH_TRIGGERS:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0006_dormroom_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dormroom',
+            name='beds',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.RunPython(backfill_beds, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='dormroom',
+            index=models.Index(fields=['beds', 'id'], name='dormroom_beds_idx'),
+        ),
+        migrations.RunPython(recreate_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.6 on 2026-10-18 02:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0007_dormroom_beds'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='roomreservation',
+            index=models.Index(condition=models.Q(('is_open', True)), fields=['check_out_date', 'id'], name='reservation_open_checkout_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roomreservation',
+            index=models.Index(fields=['user', 'is_open', 'id'], name='reservation_user_open_idx'),
+        ),
+    ]
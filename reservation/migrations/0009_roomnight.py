@@ -0,0 +1,27 @@
+# Generated by Django 4.2.6 on 2026-10-18 02:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0008_reservation_open_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomNight',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('night', models.DateField()),
+                ('beds_free', models.PositiveSmallIntegerField()),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='nights', to='reservation.dormroom')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='roomnight',
+            constraint=models.UniqueConstraint(fields=('room', 'night'), name='roomnight_room_night_unique'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.6 on 2026-10-18 03:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reservation', '0009_roomnight'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dormroom',
+            name='search_text',
+            field=models.TextField(default='', editable=False),
+        ),
+    ]
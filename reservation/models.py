@@ -4,6 +4,12 @@ Module containing Django models for room reservations in the application.
 Models:
 - DormRoom: Represents a dormitory room with various attributes.
 - RoomReservation: Represents a reservation made by a user for a dormitory room.
+- RoomOccupancy: Stores a per-room bitmap of the days taken by open reservations.
+- RoomNight: Stores the number of free beds of a room on one night.
+
+QuerySets:
+- DormRoomQuerySet: Set-based room lookups, such as availability for a date range.
+- RoomReservationQuerySet: Reservation lookups, such as open stays overlapping a date range.
 
 The DormRoom model includes methods to retrieve information about the room, such as the number of beds,
 bathroom type, and kitchenette availability. It also provides a method to check the availability of the room
@@ -16,8 +22,123 @@ Author: [ASF]
 Creation Date: [13.11.2023]
 """
 
+from random import sample, shuffle
+from django.conf import settings
 from django.db import models
+from django.db.models import Exists, OuterRef, Max, Min
 from django.contrib.auth.models import User
+from reservation.fulltext import fold_text, match_keyword
+
+BEDS_BY_ROOM_TYPE = {'single': 1, 'double': 2, 'triple': 3}
+
+
+class DormRoomQuerySet(models.QuerySet):
+    """
+    QuerySet for dormitory rooms.
+
+    Methods:
+    - available_between(start_date, end_date, beds): Rooms free for the given dates; with BOOKING_INVENTORY, rooms
+      with at least `beds` beds free on every night of them.
+    - random_sample(count): Up to `count` random rooms, read by sampling primary keys instead of the whole table.
+    - arandom_sample(count): The same, read with the async ORM.
+    - matching(keyword): Rooms whose city or street match every term of the keyword, ignoring case and accents.
+    - bulk_create(objs, **kwargs): Fills in the search text and bed count of each room before inserting them.
+    """
+
+    sample_attempts = 3
+
+    def available_between(self, start_date, end_date, beds=1):
+        if settings.BOOKING_INVENTORY:
+            # Shared rooms are sold by the bed, so a room is only taken on the nights without enough free beds.
+            full_nights = RoomNight.objects.filter(room=OuterRef('pk'), night__range=(start_date, end_date),
+                                                   beds_free__lt=beds)
+            return self.filter(~Exists(full_nights), beds__gte=beds)
+
+        reservations = RoomReservation.objects.overlapping(start_date, end_date).filter(room=OuterRef('pk'))
+        return self.filter(~Exists(reservations))
+
+    def matching(self, keyword):
+        return match_keyword(self, keyword)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for room in objs:
+            room.search_text = room.build_search_text()
+            room.beds = room.count_beds()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def _sample_ids(self, bounds, count):
+        """
+        Picks the IDs of up to `count` random rooms, shared by random_sample() and arandom_sample().
+
+        IDs are drawn from the range between the lowest and highest ID, a few times as many as still missing, and
+        kept if the room exists; after sample_attempts rounds the rest is picked with ORDER BY RANDOM().
+        The queries are left to the caller: each ID queryset is yielded and the IDs it returned are sent back.
+
+        Parameters:
+        - bounds: dict with the lowest and highest room ID as 'low' and 'high'
+        - count: int, number of rooms wanted
+
+        Returns:
+        - Generator returning the list of picked IDs.
+        """
+
+        if bounds['low'] is None:
+            return []
+
+        id_range = range(bounds['low'], bounds['high'] + 1)
+        picked = []
+        for _ in range(self.sample_attempts):
+            missing = count - len(picked)
+            if not missing:
+                break
+            candidates = [room_id for room_id in sample(id_range, min(len(id_range), missing * 4))
+                          if room_id not in picked]
+            existing = set((yield self.filter(id__in=candidates).values_list('id', flat=True)))
+            picked += [room_id for room_id in candidates if room_id in existing][:missing]
+
+        if len(picked) < count:
+            rest = self.exclude(id__in=picked).order_by('?').values_list('id', flat=True)[:count - len(picked)]
+            picked += (yield rest)
+        return picked
+
+    def random_sample(self, count):
+        steps = self._sample_ids(self.aggregate(low=Min('id'), high=Max('id')), count)
+        ids = None
+        try:
+            while True:
+                ids = list(steps.send(ids))
+        except StopIteration as done:
+            picked = done.value
+
+        rooms = list(self.in_bulk(picked).values())
+        shuffle(rooms)
+        return rooms
+
+    async def arandom_sample(self, count):
+        steps = self._sample_ids(await self.aaggregate(low=Min('id'), high=Max('id')), count)
+        ids = None
+        try:
+            while True:
+                ids = [room_id async for room_id in steps.send(ids)]
+        except StopIteration as done:
+            picked = done.value
+
+        rooms = list((await self.ain_bulk(picked)).values())
+        shuffle(rooms)
+        return rooms
+
+
+class RoomReservationQuerySet(models.QuerySet):
+    """
+    QuerySet for room reservations.
+
+    Methods:
+    - overlapping(start_date, end_date): Open reservations whose stay overlaps the given dates.
+    """
+
+    def overlapping(self, start_date, end_date):
+        return self.filter(is_open=True, check_in_date__lte=end_date, check_out_date__gte=start_date)
 
 
 class DormRoom(models.Model):
@@ -32,10 +153,17 @@ class DormRoom(models.Model):
     - private_bathroom (bool): Indicates if the room has a private bathroom.
     - price (Decimal): The price of the room.
     - image_name (str): The filename of the room's image.
+    - updated_at (DateTime): When the room was last modified.
+    - search_text (str): City and street folded to lowercase without accents, matched by keyword searches. Folding
+      can lengthen them, e.g. ß becomes ss, so the column has no length limit.
+    - beds (int): Number of beds, derived from the room type when the room is saved.
 
     Methods:
     - __str__(): Returns a string representation of the room.
-    - get_beds(): Returns the number of beds in the room based on its type.
+    - save(): Refreshes the search text and bed count and saves the room.
+    - build_search_text(): Returns the folded city and street.
+    - count_beds(): Returns the number of beds of the room type.
+    - get_beds(): Returns the stored number of beds in the room.
     - get_bathroom_type(): Returns the type of bathroom in the room (private or shared).
     - get_mini_kitchenette(): Returns "Yes" if the room has a mini kitchenette, "No" otherwise.
     - is_available(start_date, end_date): Checks if the room is available for reservation between specified dates.
@@ -49,17 +177,45 @@ class DormRoom(models.Model):
     private_bathroom = models.BooleanField()
     price = models.DecimalField(max_digits=10, decimal_places=2)
     image_name = models.CharField(max_length=100, default='room-1.jpg')
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    search_text = models.TextField(default='', editable=False)
+    beds = models.PositiveSmallIntegerField(default=1, editable=False)
+
+    objects = DormRoomQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['price', 'id'], name='dormroom_price_idx'),
+            models.Index(fields=['city', 'id'], name='dormroom_city_idx'),
+            models.Index(fields=['city', 'price', 'id'], name='dormroom_city_price_idx'),
+            models.Index(fields=['city', 'room_type', 'price', 'id'], name='dormroom_city_type_price_idx'),
+            models.Index(fields=['beds', 'id'], name='dormroom_beds_idx'),
+        ]
 
     def __str__(self):
         return f'{self.city} - Room {self.id}'
 
+    def save(self, *args, **kwargs):
+        self.search_text = self.build_search_text()
+        self.beds = self.count_beds()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if {'city', 'street'} & update_fields:
+                update_fields.add('search_text')
+            if 'room_type' in update_fields:
+                update_fields.add('beds')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
+    def build_search_text(self):
+        return fold_text(f'{self.city} {self.street}')
+
+    def count_beds(self):
+        return BEDS_BY_ROOM_TYPE.get(self.room_type, 3)
+
     def get_beds(self):
-        if self.room_type == 'single':
-            return 1
-        elif self.room_type == 'double':
-            return 2
-        else:
-            return 3
+        return self.beds
 
     def get_bathroom_type(self):
         if self.private_bathroom:
@@ -74,12 +230,7 @@ class DormRoom(models.Model):
             return "No"
 
     def is_available(self, start_date, end_date):
-        reservations = RoomReservation.objects.filter(
-            room=self,
-            check_in_date__gte=start_date,
-            check_out_date__lte=end_date
-        )
-        return not reservations.exists()
+        return not RoomReservation.objects.overlapping(start_date, end_date).filter(room=self).exists()
 
 
 class RoomReservation(models.Model):
@@ -93,6 +244,7 @@ class RoomReservation(models.Model):
        - check_out_date (Date): The date when the reservation ends.
        - is_open (bool): Indicates whether the reservation is open or closed.
        - number_of_people (int): The number of people the reservation is for.
+       - updated_at (DateTime): When the reservation was last modified.
 
        Methods:
        - __str__(): Returns a string representation of the reservation.
@@ -105,9 +257,65 @@ class RoomReservation(models.Model):
     check_out_date = models.DateField()
     is_open = models.BooleanField(default=True)
     number_of_people = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = RoomReservationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['room', 'is_open', 'check_in_date', 'check_out_date'],
+                         name='reservation_room_stay_idx'),
+            models.Index(fields=['check_out_date', 'id'], condition=models.Q(is_open=True),
+                         name='reservation_open_checkout_idx'),
+            models.Index(fields=['user', 'is_open', 'id'], name='reservation_user_open_idx'),
+        ]
 
     def __str__(self):
         return f'Reservation for {self.room.city} - Room {self.room.id}'
 
     def is_open_reservation(self):
         return self.is_open
+
+
+class RoomOccupancy(models.Model):
+    """
+       Model storing the occupancy calendar of a dormitory room as a bitmap.
+
+       Bit i of the bitmap is set when day OCCUPANCY_EPOCH + i is covered by an open reservation of the room. The
+       bitmap is kept up to date by the reservation signals, see reservation.occupancy.
+
+       Attributes:
+       - room (DormRoom): The dormitory room the calendar belongs to.
+       - bitmap (bytes): One bit per day since OCCUPANCY_EPOCH, least significant bit first.
+       """
+
+    room = models.OneToOneField(DormRoom, on_delete=models.CASCADE, primary_key=True, related_name='occupancy')
+    bitmap = models.BinaryField(default=bytes)
+
+    def __str__(self):
+        return f'Occupancy of {self.room_id}'
+
+
+class RoomNight(models.Model):
+    """
+       Model storing the number of beds of a dormitory room that are still free on one night.
+
+       Rows are created on the first booking of a night and decremented by bookings, see reservation.inventory.
+
+       Attributes:
+       - room (DormRoom): The dormitory room.
+       - night (Date): The night.
+       - beds_free (int): Number of beds not taken by open reservations on that night.
+       """
+
+    room = models.ForeignKey(DormRoom, on_delete=models.CASCADE, related_name='nights')
+    night = models.DateField()
+    beds_free = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['room', 'night'], name='roomnight_room_night_unique'),
+        ]
+
+    def __str__(self):
+        return f'Room {self.room_id} on {self.night}: {self.beds_free} beds free'
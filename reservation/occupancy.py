@@ -0,0 +1,88 @@
+"""
+Module maintaining the per-room occupancy bitmaps used by the availability calendar.
+
+Functions:
+- mark_stay(room_id, check_in_date, check_out_date): Marks the days of a new open stay as occupied.
+- release_stay(room_id, check_in_date, check_out_date): Frees the days of a removed stay, keeping other stays.
+- rebuild_room(room_id): Recomputes a room's bitmap from its open reservations.
+- room_calendar(room_id, start_date, days): Returns one occupied flag per day of the requested window.
+
+Every room has one RoomOccupancy row whose bitmap holds one bit per day since OCCUPANCY_EPOCH. The bitmap is
+handled as a Python integer, so marking or reading a stay is a couple of shifts and masks and a calendar
+request reads a single row instead of scanning the room's reservations. Bitmaps are updated by the
+reservation signals; code that writes reservations in bulk, bypassing signals, must call rebuild_room().
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from datetime import date
+from django.db import models, transaction
+from reservation.models import RoomOccupancy, RoomReservation
+
+OCCUPANCY_EPOCH = date(2020, 1, 1)
+
+
+def _day_index(day):
+    return (models.DateField().to_python(day) - OCCUPANCY_EPOCH).days
+
+
+def _stay_mask(check_in_date, check_out_date):
+    first = max(_day_index(check_in_date), 0)
+    last = _day_index(check_out_date)
+    if last < first:
+        return 0
+    return ((1 << (last - first + 1)) - 1) << first
+
+
+def _to_int(bitmap):
+    return int.from_bytes(bitmap, 'little')
+
+
+def _to_bytes(value):
+    return value.to_bytes((value.bit_length() + 7) // 8, 'little')
+
+
+def _save(occupancy, value):
+    occupancy.bitmap = _to_bytes(value)
+    occupancy.save(update_fields=['bitmap'])
+
+
+def mark_stay(room_id, check_in_date, check_out_date):
+    with transaction.atomic():
+        occupancy, _ = RoomOccupancy.objects.select_for_update().get_or_create(room_id=room_id)
+        _save(occupancy, _to_int(occupancy.bitmap) | _stay_mask(check_in_date, check_out_date))
+
+
+def release_stay(room_id, check_in_date, check_out_date):
+    with transaction.atomic():
+        occupancy = RoomOccupancy.objects.select_for_update().filter(room_id=room_id).first()
+        if occupancy is None:
+            return
+
+        value = _to_int(occupancy.bitmap) & ~_stay_mask(check_in_date, check_out_date)
+        remaining = RoomReservation.objects.overlapping(check_in_date, check_out_date).filter(room_id=room_id)
+        for stay in remaining.values_list('check_in_date', 'check_out_date'):
+            value |= _stay_mask(*stay)
+        _save(occupancy, value)
+
+
+def rebuild_room(room_id):
+    with transaction.atomic():
+        occupancy, _ = RoomOccupancy.objects.select_for_update().get_or_create(room_id=room_id)
+        value = 0
+        stays = RoomReservation.objects.filter(room_id=room_id, is_open=True)
+        for stay in stays.values_list('check_in_date', 'check_out_date'):
+            value |= _stay_mask(*stay)
+        _save(occupancy, value)
+    return value
+
+
+def room_calendar(room_id, start_date, days):
+    bitmap = RoomOccupancy.objects.filter(room_id=room_id).values_list('bitmap', flat=True).first()
+    value = rebuild_room(room_id) if bitmap is None else _to_int(bitmap)
+
+    offset = _day_index(start_date)
+    window = value >> offset if offset >= 0 else value << -offset
+    bits = format(window & ((1 << days) - 1), f'0{days}b')
+    return [bit == '1' for bit in reversed(bits)]
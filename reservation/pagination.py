@@ -0,0 +1,292 @@
+"""
+Module containing keyset (cursor) pagination for room listings in the application.
+
+Classes:
+- KeysetPage: One page of results together with the cursors of the neighbouring pages.
+- KeysetPaginator: Splits a queryset into pages by comparing the ordering key with a cursor.
+
+Unlike offset pagination, every page is read with `WHERE id > cursor ORDER BY id LIMIT n`, so the cost of a
+page does not depend on how deep into the listing it is and only page_size + 1 rows are fetched. Listings
+sorted by another column are ordered by that column and the primary key, and the cursor holds both values:
+the page after (price, id) = (500, 7) is read with `WHERE price >= 500 AND (price > 500 OR id > 7)
+ORDER BY price, id`, which a composite (price, id) index answers with one range scan.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from bisect import bisect_left, bisect_right
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class KeysetPage:
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+    - object_list (list): The objects on this page.
+    - next_cursor: Cursor of the following page, or None on the last page.
+    - previous_cursor: Cursor of the preceding page, or None on the first page.
+    - next_query (str): Query string of the link to the following page.
+    - previous_query (str): Query string of the link to the preceding page.
+    """
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.next_query = ''
+        self.previous_query = ''
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginator splitting a queryset into pages ordered by a unique key.
+
+    Attributes:
+    - page_size (int): Number of objects per page.
+    - key (str or tuple): Field, or fields, the pages are ordered by; prefix a field with '-' for descending
+      order. The fields together must be unique, so composite keys end with the primary key. Cursors of a
+      single field key are values of that field, cursors of a composite key are tuples with one value per field.
+    - prefix (str): Prefix of the query string parameters, so that several listings on one page keep their own
+      cursors, e.g. 'open_' reads open_after, open_before and open_page_size.
+
+    Methods:
+    - paginate(queryset, after=None, before=None): Returns the page following `after` or preceding `before`.
+    - paginate_keys(queryset, after=None, before=None): The same, reading only the key columns, with the values
+      of the last key field, the primary key, as the objects of the page.
+    - paginate_rows(rows, after=None, before=None): Pages through a list of key values already in key order,
+      such as the sorted IDs of a catalog snapshot, with the last value of each row as the objects of the page.
+    - load(page, queryset): Replaces the primary keys of a page with the objects read from `queryset`.
+    - read_request(request, model, params=None): Reads the cursors and page size from the request's query
+      string, or from `params` when given.
+    - link(page, params): Builds the query strings of the neighbouring pages.
+    - paginate_request(queryset, request, params=None, ids=None): Reads the request, pages through the
+      queryset, or through the `ids` rows when given, and links the neighbouring pages.
+    - apaginate(), apaginate_keys(), aload(), apaginate_request(): The same, reading with the async ORM.
+    """
+
+    def __init__(self, page_size=None, key='id', prefix=''):
+        self.page_size = page_size or settings.PAGE_SIZE
+        self.key = key
+        self.prefix = prefix
+
+    @property
+    def keys(self):
+        return (self.key,) if isinstance(self.key, str) else tuple(self.key)
+
+    @property
+    def fields(self):
+        return tuple(key.lstrip('-') for key in self.keys)
+
+    def paginate(self, queryset, after=None, before=None):
+        rows = list(self._query(queryset, after, before))
+        return self._page(rows, after, before, self._object_cursor)
+
+    async def apaginate(self, queryset, after=None, before=None):
+        rows = [row async for row in self._query(queryset, after, before)]
+        return self._page(rows, after, before, self._object_cursor)
+
+    def key_query(self, queryset, after=None, before=None):
+        """
+        Returns the query of the key columns of the page following `after` or preceding `before`.
+
+        Parameters:
+        - queryset: QuerySet to paginate
+        - after: cursor of the preceding page, or None
+        - before: cursor of the following page, or None
+
+        Returns:
+        - Sliced values_list QuerySet fetching page_size + 1 rows.
+        """
+
+        return self._query(queryset.values_list(*self.fields), after, before)
+
+    def paginate_keys(self, queryset, after=None, before=None):
+        rows = list(self.key_query(queryset, after, before))
+        return self._key_page(self._page(rows, after, before, self._row_cursor))
+
+    async def apaginate_keys(self, queryset, after=None, before=None):
+        rows = [row async for row in self.key_query(queryset, after, before)]
+        return self._key_page(self._page(rows, after, before, self._row_cursor))
+
+    def paginate_rows(self, rows, after=None, before=None):
+        order = self._ascending_rows(rows)
+        if before is not None:
+            end = bisect_left(order, self._ascending(before))
+            start = max(0, end - self.page_size)
+        else:
+            start = bisect_right(order, self._ascending(after)) if after is not None else 0
+            end = start + self.page_size
+
+        page_rows = rows[start:end]
+        next_cursor = page_rows[-1] if page_rows and end < len(rows) else None
+        previous_cursor = page_rows[0] if page_rows and start > 0 else None
+        return KeysetPage([self._last_value(row) for row in page_rows], next_cursor, previous_cursor)
+
+    @staticmethod
+    def load(page, queryset):
+        objects = queryset.in_bulk(page.object_list)
+        page.object_list = [objects[object_id] for object_id in page.object_list if object_id in objects]
+        return page
+
+    @staticmethod
+    async def aload(page, queryset):
+        objects = await queryset.ain_bulk(page.object_list)
+        page.object_list = [objects[object_id] for object_id in page.object_list if object_id in objects]
+        return page
+
+    def paginate_request(self, queryset, request, params=None, ids=None):
+        params, after, before = self.read_request(request, queryset.model, params)
+        if ids is None:
+            page = self.paginate(queryset, after=after, before=before)
+        else:
+            page = self.load(self.paginate_rows(ids, after=after, before=before), queryset)
+        return self.link(page, params)
+
+    async def apaginate_request(self, queryset, request, params=None, ids=None):
+        params, after, before = self.read_request(request, queryset.model, params)
+        if ids is None:
+            page = await self.apaginate(queryset, after=after, before=before)
+        else:
+            page = await self.aload(self.paginate_rows(ids, after=after, before=before), queryset)
+        return self.link(page, params)
+
+    def read_request(self, request, model, params=None):
+        params = request.GET if params is None else params
+        page_size = self._parse_int(params.get(f'{self.prefix}page_size'))
+        if page_size:
+            self.page_size = max(1, min(page_size, settings.MAX_PAGE_SIZE))
+        after = self._parse_cursor(model, params.get(f'{self.prefix}after'))
+        before = self._parse_cursor(model, params.get(f'{self.prefix}before'))
+        return params, after, before
+
+    def link(self, page, params):
+        after, before = f'{self.prefix}after', f'{self.prefix}before'
+        query = params.copy()
+        query.pop(after, None)
+        query.pop(before, None)
+        if page.has_next():
+            query[after] = self._format_cursor(page.next_cursor)
+            page.next_query = query.urlencode()
+            query.pop(after)
+        if page.has_previous():
+            query[before] = self._format_cursor(page.previous_cursor)
+            page.previous_query = query.urlencode()
+        return page
+
+    def _query(self, queryset, after, before):
+        if before is not None:
+            queryset = queryset.filter(self._beyond(before, backward=True))
+            return queryset.order_by(*self._reversed_keys())[:self.page_size + 1]
+        if after is not None:
+            queryset = queryset.filter(self._beyond(after, backward=False))
+        return queryset.order_by(*self.keys)[:self.page_size + 1]
+
+    def _reversed_keys(self):
+        return [key[1:] if key.startswith('-') else f'-{key}' for key in self.keys]
+
+    def _beyond(self, cursor, backward):
+        # (a, b) > (x, y) is expanded to a >= x AND (a > x OR b > y), so the leading column bounds an index
+        # range scan; PostgreSQL row comparisons would not allow mixing ascending and descending columns.
+        values = self._values(cursor)
+        condition = None
+        for key, value in reversed(list(zip(self.keys, values))):
+            field = key.lstrip('-')
+            lookup = 'lt' if key.startswith('-') != backward else 'gt'
+            strict = Q(**{f'{field}__{lookup}': value})
+            condition = strict if condition is None else strict | (Q(**{field: value}) & condition)
+        if len(self.keys) > 1:
+            field = self.fields[0]
+            lookup = 'lte' if self.keys[0].startswith('-') != backward else 'gte'
+            condition = Q(**{f'{field}__{lookup}': values[0]}) & condition
+        return condition
+
+    def _page(self, rows, after, before, cursor_of):
+        if before is not None:
+            has_previous = len(rows) > self.page_size
+            object_list = rows[:self.page_size][::-1]
+            has_next = True
+        else:
+            has_next = len(rows) > self.page_size
+            object_list = rows[:self.page_size]
+            has_previous = after is not None
+
+        next_cursor = cursor_of(object_list[-1]) if has_next and object_list else None
+        previous_cursor = cursor_of(object_list[0]) if has_previous and object_list else None
+        return KeysetPage(object_list, next_cursor, previous_cursor)
+
+    def _object_cursor(self, obj):
+        return self._cursor(tuple(getattr(obj, field) for field in self.fields))
+
+    def _row_cursor(self, row):
+        return self._cursor(tuple(row))
+
+    @staticmethod
+    def _key_page(page):
+        page.object_list = [row[-1] for row in page.object_list]
+        return page
+
+    @staticmethod
+    def _cursor(values):
+        return values[0] if len(values) == 1 else values
+
+    @staticmethod
+    def _values(cursor):
+        return cursor if isinstance(cursor, tuple) else (cursor,)
+
+    @staticmethod
+    def _last_value(row):
+        return row[-1] if isinstance(row, tuple) else row
+
+    def _descending(self):
+        return any(key.startswith('-') for key in self.keys)
+
+    def _ascending(self, cursor):
+        if not self._descending():
+            return cursor
+        # Only numeric columns are listed in descending order from memory; their negation sorts ascending.
+        return tuple(-value if key.startswith('-') else value for key, value in zip(self.keys, self._values(cursor)))
+
+    def _ascending_rows(self, rows):
+        return [self._ascending(row) for row in rows] if self._descending() else rows
+
+    def _format_cursor(self, cursor):
+        return ','.join(str(value) for value in self._values(cursor))
+
+    def _parse_cursor(self, model, value):
+        if not value:
+            return None
+        # Only the leading column, such as a city, can contain commas; the following ones are numbers.
+        parts = value.rsplit(',', len(self.fields) - 1)
+        if len(parts) != len(self.fields):
+            return None
+        try:
+            values = tuple(model._meta.get_field(field).to_python(part) for field, part in zip(self.fields, parts))
+        except ValidationError:
+            return None
+        return self._cursor(values)
+
+    @staticmethod
+    def _parse_int(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
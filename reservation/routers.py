@@ -0,0 +1,193 @@
+"""
+Module routing the reads of the room reservation application to the read replicas of the database.
+
+Classes:
+- ReplicaHealth: Remembers the replicas that refused a connection and for how long to skip them.
+- ReadScope: Database that the reads of one request go to, chosen on its first read.
+- ReadReplicaRouter: Database router sending the reads of each request to one replica in turn and every write
+  to the primary.
+
+Functions:
+- use_primary(): Context manager reading from the primary database inside it.
+- use_replica(): Context manager reading from a single replica inside it.
+- pin_session(request): Reads the session's requests from the primary for REPLICA_PIN_SECONDS.
+- session_pinned(request): Whether the session's requests should read from the primary.
+
+The replicas are the DATABASE_REPLICAS aliases, built from DORMITORY_DB_REPLICAS by dormitory/database.py.
+Only the models of REPLICATED_APPS are read from them: sessions and users are read on every request right after
+being written, at login, so they stay on the primary. Reads inside a transaction of the primary, such as those
+of reservation.services.book_room and the SELECT ... FOR UPDATE locks, stay on the primary too, so bookings are
+always checked against current data. Search results cached from a lagging replica may miss the latest bookings
+until the replica catches up or the cache entry expires.
+
+The replica is chosen per request rather than per query, so the queries of a page see the same replica and
+the same point of its replication lag. PrimaryPinMiddleware wraps each request in use_replica() or
+use_primary(), which set the same ContextVar. The ReadScope it holds is a mutable object, so the choice made by
+the first read is seen by the following ones even when they run in the sync_to_async threads of async views,
+which work on a copy of the context.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.exceptions import SynchronousOnlyOperation
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger('reservation.replicas')
+
+REPLICATED_APPS = {'reservation'}
+PIN_SESSION_KEY = 'primary_until'
+
+
+class ReadScope:
+    """
+    Database that the reads of one request go to.
+
+    Attributes:
+    - alias (str): Alias of the database, or None until the first read chooses a replica.
+    """
+
+    def __init__(self, alias=None):
+        self.alias = alias
+
+
+_read_scope = ContextVar('read_scope', default=None)
+
+
+@contextmanager
+def _reading_from(scope):
+    token = _read_scope.set(scope)
+    try:
+        yield
+    finally:
+        _read_scope.reset(token)
+
+
+def use_primary():
+    return _reading_from(ReadScope(DEFAULT_DB_ALIAS))
+
+
+def use_replica():
+    return _reading_from(ReadScope())
+
+
+def pin_session(request):
+    request.session[PIN_SESSION_KEY] = time.time() + settings.REPLICA_PIN_SECONDS
+
+
+def session_pinned(request):
+    # Without a session cookie the session is not loaded, so the response does not get Vary: Cookie for it.
+    if settings.SESSION_COOKIE_NAME not in request.COOKIES:
+        return False
+    return request.session.get(PIN_SESSION_KEY, 0) > time.time()
+
+
+class ReplicaHealth:
+    """
+    Thread-safe record of the replicas that refused a connection, each skipped for REPLICA_RETRY_SECONDS.
+
+    Attributes:
+    - down_until (dict): Maps the aliases of failed replicas to the time.monotonic() they may be tried again.
+    """
+
+    def __init__(self):
+        self.down_until = {}
+        self.lock = threading.Lock()
+
+    def available(self, alias):
+        """
+        Checks whether a replica can take reads, connecting to it if this thread has no connection yet.
+
+        A connection already open is trusted; Django's CONN_HEALTH_CHECKS closes broken ones at the start of the
+        next request, and the reconnection is checked here.
+
+        Parameters:
+        - alias: str, alias of the replica in DATABASES
+
+        Returns:
+        - False while the replica is marked down or when connecting to it fails, True otherwise.
+        """
+
+        with self.lock:
+            down_until = self.down_until.get(alias)
+            if down_until is not None:
+                if time.monotonic() < down_until:
+                    return False
+                del self.down_until[alias]
+
+        try:
+            connections[alias].ensure_connection()
+        except SynchronousOnlyOperation:
+            # In an event loop the connection is opened by the thread running the query.
+            return True
+        except DatabaseError as error:
+            self.mark_down(alias)
+            logger.warning('Replica %s is unavailable for %d s: %s', alias, settings.REPLICA_RETRY_SECONDS, error)
+            return False
+        return True
+
+    def mark_down(self, alias):
+        with self.lock:
+            self.down_until[alias] = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+
+    def reset(self):
+        with self.lock:
+            self.down_until.clear()
+
+
+replica_health = ReplicaHealth()
+
+
+class ReadReplicaRouter:
+    """
+    Database router reading the models of REPLICATED_APPS from the DATABASE_REPLICAS in turn, skipping those
+    replica_health reports as down, and falling back to the primary when none is available.
+
+    Inside use_replica() the replica chosen by the first read serves the following ones, as long as it stays
+    available; outside of it every read chooses again. Writes, reads inside use_primary() and reads inside a
+    transaction of the primary go to the primary. Migrations only run on the primary; the replicas copy its
+    schema.
+    """
+
+    def __init__(self):
+        # next() on a count is atomic under the GIL, so threads share the turns without a lock.
+        self.turns = itertools.count()
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or model._meta.app_label not in REPLICATED_APPS:
+            return None
+        scope = _read_scope.get()
+        if (scope is not None and scope.alias == DEFAULT_DB_ALIAS) or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        if scope is not None and scope.alias is not None and replica_health.available(scope.alias):
+            return scope.alias
+
+        alias = self.choose_replica(replicas)
+        if scope is not None:
+            scope.alias = alias
+        return alias
+
+    def choose_replica(self, replicas):
+        for _ in range(len(replicas)):
+            alias = replicas[next(self.turns) % len(replicas)]
+            if replica_health.available(alias):
+                return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
@@ -0,0 +1,364 @@
+"""
+Module containing the room search used by the search view.
+
+Classes:
+- SearchFilters: Normalized search filters; equal form submissions produce equal tuples.
+
+Functions:
+- normalize_filters(params): Builds SearchFilters from the submitted form or query string.
+- filter_rooms(filters): Returns the queryset of rooms matching the filters.
+- sort_rooms(queryset, sort): Orders a room queryset by one of the SORT_ORDERS keys.
+- search_paginator(filters, page_size=None): Returns the keyset paginator ordering results by filters.sort.
+- search_queryset(filters, after=None, before=None, page_size=None): Returns the query of a result page run on a
+  cache miss.
+- search_page(filters, after=None, before=None, page_size=None): Returns one page of the IDs of the matching
+  rooms in result order, served from the result cache.
+- asearch_page(filters, after=None, before=None, page_size=None): The same, through the async cache API and the
+  async ORM.
+- invalidate_rooms(): Invalidates every cached result; called when a room is written.
+- invalidate_reservations(): Invalidates the cached results with a date filter; called when a reservation is written.
+- search_cache_stats(): Returns the hit and miss counts and the hit ratio of the result cache.
+- catalog_snapshot(): Returns the in-memory catalog snapshot for the current room version.
+- search_last_modified(filters): Returns the latest modification time of the data a search depends on.
+- asearch_last_modified(filters): The same, read with the async ORM.
+- search_etag(filters, page, last_modified, variant): Returns the entity tag of a search result page.
+
+Results are cached one page at a time, as the room IDs and cursors of the page, in the cache configured by
+SEARCH_CACHE_ALIAS, keyed by the normalized filter tuple, the page cursor and size, and by version counters
+stored in the same cache. Writing a room bumps the room version, which orphans every entry; writing a
+reservation bumps the reservation version, which only orphans the entries of date-filtered searches.
+Orphaned entries expire after SEARCH_CACHE_TIMEOUT seconds or are evicted by the cache backend's LRU
+culling. A counter missing from the cache, for example after eviction, restarts from the current time in
+nanoseconds, so it never returns to a value used before. With the default local-memory cache the counters
+are per process, so deployments running several processes should point SEARCH_CACHE_ALIAS at a shared cache.
+
+The keyword is folded to lowercase without accents and matched against room cities and streets, see
+reservation.fulltext. Prices are filtered as an inclusive min_price/max_price range, `guests` keeps the
+rooms with at least that many beds, and results can be sorted by price, city or capacity. Each sort order
+ends with the primary key, so the order is total and the composite indexes on DormRoom, such as
+(city, room_type, price, id) and (beds, id), return the rows already ordered instead of sorting them. Pages
+are read with a keyset cursor on the sort column and the primary key, see reservation.pagination, so every
+page, however deep, is one index range scan that stops after page_size + 1 rows.
+
+With the CATALOG_SNAPSHOT setting enabled, cache misses that only filter on catalog columns are answered
+from the in-memory snapshot, see reservation.catalog.
+
+Every lookup sends the `search_cache_accessed` signal with `hit=True` or `hit=False`, so hit ratios can be
+reported to an external metrics system.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import decimal
+import hashlib
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Max
+from django.dispatch import Signal
+from reservation.models import DormRoom, RoomReservation
+from reservation.catalog import get_snapshot
+from reservation.fulltext import keyword_terms
+from reservation.pagination import KeysetPage, KeysetPaginator
+
+ROOM_TYPES = ('single', 'double', 'triple')
+ROOMS_VERSION_KEY = 'search:rooms-version'
+RESERVATIONS_VERSION_KEY = 'search:reservations-version'
+
+SORT_ORDERS = {
+    'price': ('price', 'id'),
+    '-price': ('-price', '-id'),
+    'city': ('city', 'id'),
+    'capacity': ('beds', 'id'),
+}
+
+SearchFilters = namedtuple('SearchFilters', ['keyword', 'start_date', 'end_date', 'city', 'room_type',
+                                             'mini_kitchenette', 'private_bathroom', 'min_price', 'max_price',
+                                             'guests', 'sort'])
+
+search_cache_accessed = Signal()
+
+_stats = {'hits': 0, 'misses': 0}
+_stats_lock = threading.Lock()
+
+
+def _parse_dates(value):
+    try:
+        dates = [datetime.strptime(part.strip(), '%Y-%m-%d').date() for part in value.split(' to ')]
+    except ValueError:
+        return None, None
+    return dates[0], dates[-1]
+
+
+def _parse_choice(value):
+    return {'Yes': True, 'No': False}.get(value)
+
+
+def _parse_price(value):
+    if not value or value == 'Unlimited':
+        return None
+    try:
+        return decimal.Decimal(value.replace(' PLN', '').replace(',', ''))
+    except decimal.InvalidOperation:
+        return None
+
+
+def _parse_guests(value):
+    try:
+        guests = int(value)
+    except (TypeError, ValueError):
+        return None
+    return guests if guests > 0 else None
+
+
+def normalize_filters(params):
+    """
+    Builds normalized search filters from request parameters.
+
+    Parameters:
+    - params: QueryDict or dict with the search form fields
+
+    Returns:
+    - SearchFilters with unset or invalid fields as None.
+    """
+
+    keyword = ' '.join(keyword_terms(params.get('keyword'))) or None
+    start_date, end_date = _parse_dates(params['arrival_departure']) if params.get('arrival_departure') \
+        else (None, None)
+    room_type = (params.get('room_type') or '').lower()
+    sort = params.get('sort')
+    # Bookmarked searches from before price ranges carry the old single price as the upper bound.
+    max_price = params.get('max_price') or params.get('price')
+
+    return SearchFilters(
+        keyword=keyword,
+        start_date=start_date,
+        end_date=end_date,
+        city=(params.get('city') or '').strip() or None,
+        room_type=room_type if room_type in ROOM_TYPES else None,
+        mini_kitchenette=_parse_choice(params.get('mini_kitchenette')),
+        private_bathroom=_parse_choice(params.get('private_bathroom')),
+        min_price=_parse_price(params.get('min_price')),
+        max_price=_parse_price(max_price),
+        guests=_parse_guests(params.get('guests')),
+        sort=sort if sort in SORT_ORDERS else None,
+    )
+
+
+def filter_rooms(filters):
+    filtered_data = DormRoom.objects.all()
+
+    if filters.keyword:
+        filtered_data = filtered_data.matching(filters.keyword)
+
+    if filters.start_date:
+        filtered_data = filtered_data.available_between(filters.start_date, filters.end_date, filters.guests or 1)
+
+    if filters.city:
+        filtered_data = filtered_data.filter(city=filters.city)
+
+    if filters.room_type:
+        filtered_data = filtered_data.filter(room_type=filters.room_type)
+
+    if filters.mini_kitchenette is not None:
+        filtered_data = filtered_data.filter(mini_kitchenette=filters.mini_kitchenette)
+
+    if filters.private_bathroom is not None:
+        filtered_data = filtered_data.filter(private_bathroom=filters.private_bathroom)
+
+    if filters.guests is not None:
+        filtered_data = filtered_data.filter(beds__gte=filters.guests)
+
+    if filters.min_price is not None:
+        filtered_data = filtered_data.filter(price__gte=filters.min_price)
+
+    if filters.max_price is not None:
+        filtered_data = filtered_data.filter(price__lte=filters.max_price)
+
+    return filtered_data
+
+
+def sort_rooms(queryset, sort):
+    """
+    Orders a room queryset for display.
+
+    Parameters:
+    - queryset: DormRoom queryset
+    - sort: key of SORT_ORDERS, or None for ascending IDs
+
+    Returns:
+    - Ordered queryset.
+    """
+
+    return queryset.order_by(*SORT_ORDERS.get(sort, ('id',)))
+
+
+def search_paginator(filters, page_size=None):
+    return KeysetPaginator(page_size=page_size, key=SORT_ORDERS.get(filters.sort, 'id'))
+
+
+def search_queryset(filters, after=None, before=None, page_size=None):
+    return search_paginator(filters, page_size).key_query(filter_rooms(filters), after, before)
+
+
+def _cache():
+    return caches[settings.SEARCH_CACHE_ALIAS]
+
+
+def _new_version():
+    return time.time_ns()
+
+
+def _versions():
+    keys = [ROOMS_VERSION_KEY, RESERVATIONS_VERSION_KEY]
+    versions = _cache().get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            _cache().add(key, _new_version(), None)
+        versions.update(_cache().get_many(missing))
+    return versions[ROOMS_VERSION_KEY], versions[RESERVATIONS_VERSION_KEY]
+
+
+async def _aversions():
+    keys = [ROOMS_VERSION_KEY, RESERVATIONS_VERSION_KEY]
+    versions = await _cache().aget_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            await _cache().aadd(key, _new_version(), None)
+        versions.update(await _cache().aget_many(missing))
+    return versions[ROOMS_VERSION_KEY], versions[RESERVATIONS_VERSION_KEY]
+
+
+def _cache_key(filters, page, rooms_version, reservations_version):
+    reservations_version = reservations_version if filters.start_date else '-'
+    digest = hashlib.md5(repr((tuple(filters), page)).encode()).hexdigest()
+    return f'search:{rooms_version}:{reservations_version}:{digest}'
+
+
+def _record(hit):
+    with _stats_lock:
+        _stats['hits' if hit else 'misses'] += 1
+    search_cache_accessed.send(sender=SearchFilters, hit=hit)
+
+
+def search_page(filters, after=None, before=None, page_size=None):
+    """
+    Returns one page of the IDs of the rooms matching the filters, ordered by filters.sort or by ascending ID.
+
+    Parameters:
+    - filters: SearchFilters
+    - after: cursor of the preceding page, as read by search_paginator(filters).read_request(), or None
+    - before: cursor of the following page, or None
+    - page_size: int, or None for the PAGE_SIZE setting
+
+    Returns:
+    - KeysetPage of room IDs, read from the result cache when possible.
+    """
+
+    paginator = search_paginator(filters, page_size)
+    rooms_version, reservations_version = _versions()
+    key = _cache_key(filters, (after, before, paginator.page_size), rooms_version, reservations_version)
+    cached = _cache().get(key)
+    _record(cached is not None)
+    if cached is not None:
+        return KeysetPage(*cached)
+
+    snapshot = get_snapshot(rooms_version) if settings.CATALOG_SNAPSHOT else None
+    if snapshot is not None and snapshot.supports(filters):
+        page = paginator.paginate_rows(snapshot.filter_rows(filters), after, before)
+    else:
+        page = paginator.paginate_keys(filter_rooms(filters), after, before)
+    _cache().set(key, (page.object_list, page.next_cursor, page.previous_cursor), settings.SEARCH_CACHE_TIMEOUT)
+    return page
+
+
+async def asearch_page(filters, after=None, before=None, page_size=None):
+    if settings.CATALOG_SNAPSHOT:
+        # The snapshot is built and kept in process memory by synchronous code.
+        return await sync_to_async(search_page)(filters, after, before, page_size)
+
+    paginator = search_paginator(filters, page_size)
+    rooms_version, reservations_version = await _aversions()
+    key = _cache_key(filters, (after, before, paginator.page_size), rooms_version, reservations_version)
+    cached = await _cache().aget(key)
+    _record(cached is not None)
+    if cached is not None:
+        return KeysetPage(*cached)
+
+    page = await paginator.apaginate_keys(filter_rooms(filters), after, before)
+    await _cache().aset(key, (page.object_list, page.next_cursor, page.previous_cursor),
+                        settings.SEARCH_CACHE_TIMEOUT)
+    return page
+
+
+def _bump(key):
+    try:
+        _cache().incr(key)
+    except ValueError:
+        _cache().add(key, _new_version(), None)
+
+
+def invalidate_rooms():
+    _bump(ROOMS_VERSION_KEY)
+
+
+def invalidate_reservations():
+    _bump(RESERVATIONS_VERSION_KEY)
+
+
+def catalog_snapshot():
+    return get_snapshot(_versions()[0])
+
+
+def search_cache_stats():
+    with _stats_lock:
+        hits, misses = _stats['hits'], _stats['misses']
+    lookups = hits + misses
+    return {'hits': hits, 'misses': misses, 'hit_ratio': hits / lookups if lookups else 0.0}
+
+
+def search_last_modified(filters):
+    stamps = [DormRoom.objects.aggregate(updated_at=Max('updated_at'))['updated_at']]
+    if filters.start_date:
+        stamps.append(RoomReservation.objects.aggregate(updated_at=Max('updated_at'))['updated_at'])
+    stamps = [stamp for stamp in stamps if stamp is not None]
+    return max(stamps) if stamps else None
+
+
+async def asearch_last_modified(filters):
+    stamps = [(await DormRoom.objects.aaggregate(updated_at=Max('updated_at')))['updated_at']]
+    if filters.start_date:
+        stamps.append((await RoomReservation.objects.aaggregate(updated_at=Max('updated_at')))['updated_at'])
+    stamps = [stamp for stamp in stamps if stamp is not None]
+    return max(stamps) if stamps else None
+
+
+def search_etag(filters, page, last_modified, variant=''):
+    """
+    Returns the entity tag of a search result page.
+
+    The tag covers the filters, the room IDs and cursors of the page and the modification time of the data, so
+    it changes when a room is edited, added or deleted and when a reservation changes the availability of a
+    room. The modification time alone would miss deletions, so search pages are validated by this tag only.
+
+    Parameters:
+    - filters: SearchFilters
+    - page: KeysetPage of room IDs returned by search_page()
+    - last_modified: datetime returned by search_last_modified(), or None
+    - variant: anything else the rendered page depends on, such as the query string and whether the visitor
+      is logged in
+
+    Returns:
+    - Quoted entity tag.
+    """
+
+    payload = repr((tuple(filters), page.object_list, page.next_cursor, page.previous_cursor,
+                    last_modified and last_modified.isoformat(), variant))
+    return f'"{hashlib.md5(payload.encode()).hexdigest()}"'
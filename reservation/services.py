@@ -0,0 +1,118 @@
+"""
+Module containing the booking service for room reservations in the application.
+
+Functions:
+- book_room(reservation): Saves a reservation after checking room availability and capacity.
+- close_expired_reservations(today, batch_size): Closes the open reservations whose stay has ended, in batches.
+
+Exceptions:
+- BookingError: Raised when a reservation cannot be booked; its message is meant to be shown to the user.
+
+The availability check and the insert run in one transaction while the room row is locked with
+select_for_update, so concurrent bookings of the same room are serialized and cannot both pass the check.
+With the BOOKING_INVENTORY setting, the check is instead the conditional decrement of the free beds of every
+night of the stay, see reservation.inventory: rooms are sold by the bed and the room row is not locked, the
+night rows locked by the UPDATE serialize bookings of the same nights.
+
+Expired reservations are closed by repeating one UPDATE of at most batch_size rows, each in its own short
+transaction, until no open reservation has a check-out date before today. The rows are found through the
+partial index on open reservations and the UPDATE repeats the filter, so a row changed by a concurrent
+request between the lookup and the update is re-checked rather than overwritten. Progress is kept in the
+data itself: an interrupted run leaves the remaining rows open and the next run continues with them.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Subquery
+from django.utils import timezone
+from reservation.models import DormRoom, RoomReservation
+from reservation import inventory, search
+
+ROOM_TAKEN_MESSAGE = 'Room already taken'
+ROOM_TOO_SMALL_MESSAGE = 'Room is too small for the specified number of guests'
+
+
+class BookingError(Exception):
+    """
+    Exception raised when a reservation cannot be booked.
+    """
+
+
+def book_room(reservation):
+    """
+    Saves a reservation if its room is free for the stay and big enough for the guests.
+
+    Parameters:
+    - reservation: RoomReservation, unsaved reservation with room, dates and number of people set
+
+    Returns:
+    - The saved reservation.
+
+    Raises:
+    - BookingError: If the room is already taken for the dates or is too small for the guests.
+    """
+
+    if settings.BOOKING_INVENTORY:
+        return _book_beds(reservation)
+
+    with transaction.atomic():
+        room = DormRoom.objects.select_for_update().get(pk=reservation.room_id)
+
+        if RoomReservation.objects.overlapping(reservation.check_in_date,
+                                               reservation.check_out_date).filter(room=room).exists():
+            raise BookingError(ROOM_TAKEN_MESSAGE)
+
+        if reservation.number_of_people > room.beds:
+            raise BookingError(ROOM_TOO_SMALL_MESSAGE)
+
+        reservation.save()
+
+    return reservation
+
+
+def _book_beds(reservation):
+    with transaction.atomic():
+        room = DormRoom.objects.get(pk=reservation.room_id)
+
+        if reservation.number_of_people > room.beds:
+            raise BookingError(ROOM_TOO_SMALL_MESSAGE)
+
+        if reservation.is_open:
+            if not inventory.take_beds(room, reservation.check_in_date, reservation.check_out_date,
+                                       reservation.number_of_people):
+                raise BookingError(ROOM_TAKEN_MESSAGE)
+            # The beds are taken, so the signal handlers must not count the new reservation again.
+            reservation.beds_taken = True
+
+        reservation.save()
+
+    return reservation
+
+
+def close_expired_reservations(today=None, batch_size=5000):
+    """
+    Closes the open reservations whose check-out date is before today, one batch at a time.
+
+    Parameters:
+    - today: date, defaults to the current date
+    - batch_size: int, maximum number of reservations closed by one UPDATE
+
+    Returns:
+    - Iterator yielding the number of reservations closed by each batch.
+    """
+
+    today = today or timezone.now().date()
+    expired = RoomReservation.objects.filter(is_open=True, check_out_date__lt=today)
+    # Ordered like the partial index, so each batch reads the first entries of the index and closed rows drop out.
+    batch = expired.order_by('check_out_date', 'id').values('id')
+    while True:
+        with transaction.atomic():
+            count = expired.filter(id__in=Subquery(batch[:batch_size])).update(is_open=False,
+                                                                             updated_at=timezone.now())
+        if not count:
+            return
+        search.invalidate_reservations()
+        yield count
@@ -0,0 +1,79 @@
+"""
+Module containing the signal handlers of the room reservation application.
+
+Handlers:
+- update_occupancy_on_save: Updates the room's occupancy bitmap after a reservation is saved.
+- update_occupancy_on_delete: Updates the room's occupancy bitmap after a reservation is deleted.
+- update_inventory_on_save: Updates the room's bed inventory after a reservation not booked through it is saved.
+- update_inventory_on_delete: Gives the beds of a deleted open reservation back to the room's inventory.
+- rebuild_inventory_on_room_change: Rebuilds a room's bed inventory after the room is changed.
+- invalidate_search_on_room_change: Invalidates the cached search results after a room is saved or deleted.
+- invalidate_card_on_room_change: Drops the cached card of a room after it is saved or deleted.
+- invalidate_search_on_reservation_change: Invalidates the cached date searches after a reservation is saved or
+  deleted.
+
+The inventory handlers only run with the BOOKING_INVENTORY setting. The handlers are connected when the
+application registry is ready, see ReservationConfig.ready().
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from reservation.models import DormRoom, RoomReservation
+from reservation import cards, inventory, occupancy, search
+
+
+@receiver(post_save, sender=RoomReservation)
+def update_occupancy_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if not created:
+        occupancy.rebuild_room(instance.room_id)
+    elif instance.is_open:
+        occupancy.mark_stay(instance.room_id, instance.check_in_date, instance.check_out_date)
+
+
+@receiver(post_delete, sender=RoomReservation)
+def update_occupancy_on_delete(sender, instance, **kwargs):
+    occupancy.release_stay(instance.room_id, instance.check_in_date, instance.check_out_date)
+
+
+@receiver(post_save, sender=RoomReservation)
+def update_inventory_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw or not settings.BOOKING_INVENTORY or (created and getattr(instance, 'beds_taken', False)):
+        return
+    inventory.rebuild_room(instance.room)
+
+
+@receiver(post_delete, sender=RoomReservation)
+def update_inventory_on_delete(sender, instance, **kwargs):
+    if settings.BOOKING_INVENTORY and instance.is_open:
+        inventory.release_beds(instance.room, instance.check_in_date, instance.check_out_date,
+                               instance.number_of_people)
+
+
+@receiver(post_save, sender=DormRoom)
+def rebuild_inventory_on_room_change(sender, instance, created, raw=False, **kwargs):
+    if not raw and not created and settings.BOOKING_INVENTORY:
+        inventory.rebuild_room(instance)
+
+
+@receiver(post_save, sender=DormRoom)
+@receiver(post_delete, sender=DormRoom)
+def invalidate_search_on_room_change(sender, **kwargs):
+    search.invalidate_rooms()
+
+
+@receiver(post_save, sender=DormRoom)
+@receiver(post_delete, sender=DormRoom)
+def invalidate_card_on_room_change(sender, instance, **kwargs):
+    cards.invalidate_room_card(instance.id)
+
+
+@receiver(post_save, sender=RoomReservation)
+@receiver(post_delete, sender=RoomReservation)
+def invalidate_search_on_reservation_change(sender, **kwargs):
+    search.invalidate_reservations()
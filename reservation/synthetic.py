@@ -0,0 +1,210 @@
+"""
+Module generating deterministic synthetic rooms, users and reservation histories for scale testing.
+
+Classes:
+- Stay: Fields of one generated reservation.
+- GeneratedData: Numbers of rows written by generate().
+
+Functions:
+- season_weight(day): Relative booking demand on a day of the year.
+- generate_rooms(count, cities, room_types, picker): Yields unsaved rooms spread over the cities and room types.
+- generate_stays(rooms, user_ids, count, start, days, today, picker): Yields non-overlapping stays of the
+  rooms with seasonal peaks.
+- generate(rooms, users, reservations, ...): Writes a whole synthetic data set in batches.
+
+Every value comes from one random.Random seeded with `seed`, so the same arguments on an empty database give
+the same rows. Reservations are spread evenly over the rooms; each room's stays follow each other with gaps
+that shrink in the busy months of SEASON_WEIGHTS (the start of both semesters and the summer schools) and
+never overlap, using the inclusive dates of RoomReservationQuerySet.overlapping().
+
+Rows are written with bulk_create, `batch_size` at a time, or, with `use_copy` on PostgreSQL, reservations are
+streamed with COPY, which skips the per-row INSERT overhead for the largest table. Both bypass the model
+signals: the cached searches are invalidated at the end, the occupancy bitmaps of new rooms are built on
+first use, and with BOOKING_INVENTORY the bed inventory of the rooms with open stays is rebuilt at the end.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import io
+import random
+from collections import namedtuple
+from datetime import date, timedelta
+from itertools import islice
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+from reservation.models import BEDS_BY_ROOM_TYPE, DormRoom, RoomReservation
+from reservation import inventory, search
+
+CITIES = ('Warszawa', 'Kraków', 'Poznań', 'Szczecin', 'Gdańsk', 'Wrocław')
+ROOM_TYPES = tuple(BEDS_BY_ROOM_TYPE)
+STREETS = ('Nowy Świat', 'Krupnicza', 'Stary Rynek', 'Krzywoustego', 'Długa', 'Piastowska', 'Akademicka',
+           'Słoneczna')
+BASE_PRICES = {'single': 600, 'double': 450, 'triple': 350}
+# Relative demand by month: the start of the winter and summer semesters and the summer schools are busiest.
+SEASON_WEIGHTS = (0.8, 1.4, 1.2, 0.7, 0.7, 0.9, 1.3, 1.3, 1.8, 1.5, 0.8, 0.6)
+USER_PASSWORD = 'synthetic'
+
+Stay = namedtuple('Stay', ['user_id', 'room_id', 'check_in_date', 'check_out_date', 'is_open', 'number_of_people'])
+GeneratedData = namedtuple('GeneratedData', ['rooms', 'users', 'reservations'])
+
+
+def season_weight(day):
+    return SEASON_WEIGHTS[day.month - 1]
+
+
+def generate_rooms(count, cities, room_types, picker):
+    for number in range(count):
+        room_type = picker.choice(room_types)
+        yield DormRoom(city=picker.choice(cities), street=f'{picker.choice(STREETS)} {picker.randint(1, 200)}',
+                       room_type=room_type, mini_kitchenette=picker.random() < 0.4,
+                       private_bathroom=picker.random() < 0.3,
+                       price=BASE_PRICES.get(room_type, 400) + 10 * picker.randint(-10, 10),
+                       image_name=f'room-{number % 24 + 1}.jpg')
+
+
+def generate_stays(rooms, user_ids, count, start, days, today, picker):
+    """
+    Yields non-overlapping stays of the rooms, `count` in total, spread evenly over the rooms.
+
+    Each room's stays start at a random offset and follow each other with a mean spacing of days / stays per
+    room; gaps are divided by season_weight(), so busy months are more densely booked. A room with more stays
+    than fit in the window continues past its end.
+
+    Parameters:
+    - rooms: list of (room ID, beds) pairs
+    - user_ids: list of IDs of the users making the reservations
+    - count: int, number of reservations
+    - start: date, beginning of the history
+    - days: int, length of the history in days
+    - today: date, stays ending before it are closed
+    - picker: random.Random
+
+    Returns:
+    - Iterator of Stay tuples, which are cheaper to build than model instances.
+    """
+
+    for index, (room_id, beds) in enumerate(rooms):
+        stays = count // len(rooms) + (index < count % len(rooms))
+        if not stays:
+            continue
+        spacing = max(2.0, days / stays)
+        longest = max(1, min(14, int(spacing) // 2))
+        day = start + timedelta(days=picker.randrange(max(1, int(spacing))))
+        for _ in range(stays):
+            check_out_date = day + timedelta(days=picker.randint(0, longest - 1))
+            yield Stay(picker.choice(user_ids), room_id, day, check_out_date, check_out_date >= today,
+                       picker.randint(1, beds))
+            gap = picker.expovariate(1 / max(1.0, spacing - (longest + 1) / 2)) / season_weight(check_out_date)
+            day = check_out_date + timedelta(days=1 + int(gap))
+
+
+def _batches(objects, batch_size):
+    objects = iter(objects)
+    while batch := list(islice(objects, batch_size)):
+        yield batch
+
+
+def _copy_reservations(batch, updated_at):
+    table = RoomReservation._meta.db_table
+    columns = ['user_id', 'room_id', 'check_in_date', 'check_out_date', 'is_open', 'number_of_people',
+               'updated_at']
+    data = io.StringIO()
+    updated_at = updated_at.isoformat()
+    for stay in batch:
+        data.write(f'{stay.user_id}\t{stay.room_id}\t{stay.check_in_date}\t{stay.check_out_date}\t'
+                   f'{"t" if stay.is_open else "f"}\t{stay.number_of_people}\t{updated_at}\n')
+    data.seek(0)
+
+    sql = f'COPY {connection.ops.quote_name(table)} ({", ".join(columns)}) FROM STDIN'
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        if hasattr(raw, 'copy_expert'):
+            raw.copy_expert(sql, data)
+        else:
+            with raw.copy(sql) as copy:
+                copy.write(data.getvalue())
+
+
+def generate(rooms, users, reservations, cities=CITIES, room_types=ROOM_TYPES, start=date(2024, 1, 1),
+             days=2 * 365, seed=0, batch_size=10000, use_copy=False, progress=None):
+    """
+    Writes a synthetic data set of rooms, users and reservations.
+
+    Parameters:
+    - rooms: int, number of rooms
+    - users: int, number of users, named synthetic<N> with the password USER_PASSWORD; existing ones are kept
+    - reservations: int, number of reservations of the new rooms, made by these users, or by all users if 0
+    - cities: sequence of city names
+    - room_types: sequence of room types
+    - start: date, beginning of the reservation history
+    - days: int, length of the reservation history in days
+    - seed: int, seed of the random values
+    - batch_size: int, rows written per statement
+    - use_copy: bool, write reservations with COPY; PostgreSQL only
+    - progress: optional callable receiving the table name and the number of rows written so far
+
+    Returns:
+    - GeneratedData with the number of rows written to each table.
+    """
+
+    if use_copy and connection.vendor != 'postgresql':
+        raise ValueError('COPY is only available on PostgreSQL')
+    picker = random.Random(seed)
+    progress = progress or (lambda table, written: None)
+
+    written = 0
+    first_room_id = (DormRoom.objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+    for batch in _batches(generate_rooms(rooms, cities, room_types, picker), batch_size):
+        DormRoom.objects.bulk_create(batch)
+        written += len(batch)
+        progress('rooms', written)
+    room_beds = list(DormRoom.objects.filter(id__gte=first_room_id).order_by('id').values_list('id', 'beds'))
+
+    usernames = [f'synthetic{number}' for number in range(users)]
+    synthetic_users = User.objects.filter(username__regex=r'^synthetic[0-9]+$')
+    existing_users = set(synthetic_users.values_list('username', flat=True))
+    password = make_password(USER_PASSWORD)
+    new_users = (User(username=username, email=f'{username}@example.com', password=password)
+                 for username in usernames if username not in existing_users)
+    created_users = 0
+    for batch in _batches(new_users, batch_size):
+        User.objects.bulk_create(batch)
+        created_users += len(batch)
+        progress('users', created_users)
+    if users:
+        wanted = set(usernames)
+        user_ids = [user_id for user_id, username in synthetic_users.order_by('id').values_list('id', 'username')
+                    if username in wanted]
+    else:
+        user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+
+    written = 0
+    open_room_ids = set()
+    if reservations and room_beds and user_ids:
+        today = timezone.now().date()
+        updated_at = timezone.now()
+        stays = generate_stays(room_beds, user_ids, reservations, start, days, today, picker)
+        for batch in _batches(stays, batch_size):
+            with transaction.atomic():
+                if use_copy:
+                    _copy_reservations(batch, updated_at)
+                else:
+                    RoomReservation.objects.bulk_create(RoomReservation(**stay._asdict()) for stay in batch)
+            open_room_ids.update(stay.room_id for stay in batch if stay.is_open)
+            written += len(batch)
+            progress('reservations', written)
+
+    if settings.BOOKING_INVENTORY:
+        # Bookings check the stays against the inventory, which the bulk writes bypassed.
+        rooms = DormRoom.objects.filter(id__in=open_room_ids).order_by('id')
+        for rebuilt, room in enumerate(rooms.iterator(chunk_size=batch_size), 1):
+            inventory.rebuild_room(room)
+            progress('inventory', rebuilt)
+
+    search.invalidate_rooms()
+    search.invalidate_reservations()
+    return GeneratedData(len(room_beds), created_users, written)
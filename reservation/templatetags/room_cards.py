@@ -0,0 +1,34 @@
+"""
+Template tags of the room reservation application.
+
+Tags:
+- room_cards(rooms): Renders the cards of a list of rooms from the card cache, see reservation.cards.
+
+Filters:
+- room_image_sources(image_name): The (MIME type, srcset) pairs of the built thumbnails of a room image.
+- room_image_url(image_name): The static URL of a full-size room image, or of the placeholder image.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django import template
+from reservation.assets import room_image_sources as image_sources, room_image_url as image_url
+from reservation.cards import render_room_cards
+
+register = template.Library()
+
+
+@register.simple_tag
+def room_cards(rooms):
+    return render_room_cards(rooms)
+
+
+@register.filter
+def room_image_sources(image_name):
+    return image_sources(image_name)
+
+
+@register.filter
+def room_image_url(image_name):
+    return image_url(image_name)
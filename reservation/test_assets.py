@@ -0,0 +1,187 @@
+"""
+Module containing Django test cases for the static asset build.
+
+Classes:
+- TemporaryStaticTestCase: Base test case working in a temporary directory.
+- PrecompressTest: Test case for writing compressed copies of static files.
+- RoomImageSourcesTest: Test case for offering the built thumbnails of room images.
+- ManifestRoomImagesTest: Test case for the room image URLs under the fingerprinting storage of production.
+- GenerateThumbnailsTest: Test case for resizing room images into thumbnails (needs Pillow).
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from unittest import skipUnless
+from django.test import SimpleTestCase, override_settings
+from reservation.assets import precompress, room_image_sources, room_image_url, thumbnail_path, generate_thumbnails
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class TemporaryStaticTestCase(SimpleTestCase):
+    """
+        Base test case working in a temporary directory with an empty thumbnail lookup cache.
+
+        Methods:
+        - setUp: Create the temporary directory and clear the cached image URLs and sources.
+        """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        for cached in (room_image_sources, room_image_url):
+            cached.cache_clear()
+            self.addCleanup(cached.cache_clear)
+
+
+class PrecompressTest(TemporaryStaticTestCase):
+    """
+        Test case for writing compressed copies of static files.
+
+        Methods:
+        - test_compresses_text_files: Test if large text files get a gzip copy with the same content.
+        - test_skips_small_and_binary_files: Test if small files and images are left alone.
+        """
+
+    def test_compresses_text_files(self):
+        content = b'.room-card { display: block; }\n' * 100
+        (self.directory / 'style.css').write_bytes(content)
+
+        count, original_bytes, compressed_bytes = precompress(self.directory)
+
+        self.assertEqual((count, original_bytes), (1, len(content)))
+        self.assertLess(compressed_bytes, original_bytes)
+        self.assertEqual(gzip.decompress((self.directory / 'style.css.gz').read_bytes()), content)
+
+    def test_skips_small_and_binary_files(self):
+        (self.directory / 'small.js').write_bytes(b'main();')
+        (self.directory / 'room.jpg').write_bytes(b'\xff' * 4096)
+
+        self.assertEqual(precompress(self.directory), (0, 0, 0))
+        self.assertEqual(sorted(path.name for path in self.directory.iterdir()), ['room.jpg', 'small.js'])
+
+
+@override_settings(ROOM_IMAGE_WIDTHS=(400, 800), ROOM_IMAGE_FORMATS=('avif', 'webp'), STATIC_URL='/static/')
+class RoomImageSourcesTest(TemporaryStaticTestCase):
+    """
+        Test case for offering the built thumbnails of room images.
+
+        Methods:
+        - setUp: Point the static files at an empty temporary directory.
+        - build(image_format, widths): Create empty thumbnail files of one format.
+        - test_no_thumbnails: Test if an image without thumbnails has no sources.
+        - test_complete_formats_only: Test if only formats built in every width are offered.
+        """
+
+    def setUp(self):
+        super().setUp()
+        static_settings = override_settings(STATICFILES_DIRS=[str(self.directory)],
+                                            STATIC_ROOT=str(self.directory / 'collected'))
+        static_settings.enable()
+        self.addCleanup(static_settings.disable)
+
+    def build(self, image_format, widths):
+        for width in widths:
+            path = self.directory / thumbnail_path('room-1.jpg', width, image_format)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b'')
+
+    def test_no_thumbnails(self):
+        self.assertEqual(room_image_sources('room-1.jpg'), [])
+
+    def test_complete_formats_only(self):
+        self.build('webp', (400, 800))
+        self.build('avif', (400,))
+
+        self.assertEqual(room_image_sources('room-1.jpg'), [
+            ('image/webp', '/static/assets/img/thumbs/room-1-400.webp 400w, '
+                           '/static/assets/img/thumbs/room-1-800.webp 800w'),
+        ])
+
+
+@override_settings(ROOM_IMAGE_WIDTHS=(400, 800), ROOM_IMAGE_FORMATS=('webp',), STATIC_URL='/static/',
+                   ROOM_PLACEHOLDER_IMAGE='room-1.jpg')
+class ManifestRoomImagesTest(TemporaryStaticTestCase):
+    """
+        Test case for the room image URLs under the strict ManifestStaticFilesStorage of the production profile.
+
+        Methods:
+        - setUp: Use the manifest storage, with thumbnails on disk that the finders see.
+        - collect(*paths): Write a manifest listing the given static files.
+        - test_image_url: Test if a collected image gets its fingerprinted URL.
+        - test_missing_image_placeholder: Test if an image missing from the manifest gets the placeholder URL.
+        - test_uncollected_thumbnails: Test if thumbnails only the finders see are not offered.
+        - test_collected_thumbnails: Test if collected thumbnails are offered with their fingerprinted URLs.
+        """
+
+    def setUp(self):
+        super().setUp()
+        storage = {'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'}
+        storages = {'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'}, 'staticfiles': storage}
+        static_settings = override_settings(STATICFILES_DIRS=[str(self.directory / 'static')],
+                                            STATIC_ROOT=str(self.directory / 'collected'), STORAGES=storages)
+        static_settings.enable()
+        self.addCleanup(static_settings.disable)
+        for width in (400, 800):
+            path = self.directory / 'static' / thumbnail_path('room-1.jpg', width, 'webp')
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b'')
+
+    def collect(self, *paths):
+        manifest = {'version': '1.1', 'paths': {path: path.replace('.', '.0123abcd.') for path in paths}}
+        (self.directory / 'collected').mkdir(exist_ok=True)
+        (self.directory / 'collected/staticfiles.json').write_text(json.dumps(manifest))
+
+    def test_image_url(self):
+        self.collect('assets/img/room-1.jpg', 'assets/img/room-2.jpg')
+
+        self.assertEqual(room_image_url('room-2.jpg'), '/static/assets/img/room-2.0123abcd.jpg')
+
+    def test_missing_image_placeholder(self):
+        self.collect('assets/img/room-1.jpg')
+
+        self.assertEqual(room_image_url('room-99.jpg'), '/static/assets/img/room-1.0123abcd.jpg')
+
+    def test_uncollected_thumbnails(self):
+        self.collect('assets/img/room-1.jpg', thumbnail_path('room-1.jpg', 400, 'webp'))
+        self.assertEqual(room_image_sources('room-1.jpg'), [])
+
+    def test_collected_thumbnails(self):
+        self.collect('assets/img/room-1.jpg', *(thumbnail_path('room-1.jpg', width, 'webp') for width in (400, 800)))
+        self.assertEqual(room_image_sources('room-1.jpg'), [
+            ('image/webp', '/static/assets/img/thumbs/room-1-400.0123abcd.webp 400w, '
+                           '/static/assets/img/thumbs/room-1-800.0123abcd.webp 800w'),
+        ])
+
+
+@skipUnless(Image, 'Thumbnails require Pillow')
+@override_settings(ROOM_IMAGE_WIDTHS=(400, 800), ROOM_IMAGE_FORMATS=('webp',))
+class GenerateThumbnailsTest(TemporaryStaticTestCase):
+    """
+        Test case for resizing room images into thumbnails.
+
+        Methods:
+        - test_generate_thumbnails: Test if every width is written once, without upscaling small images.
+        """
+
+    def test_generate_thumbnails(self):
+        (self.directory / 'assets/img').mkdir(parents=True)
+        Image.new('RGB', (600, 300), 'white').save(self.directory / 'assets/img/room-1.jpg')
+
+        written, skipped = generate_thumbnails(['room-1.jpg', 'room-1.jpg', 'missing.jpg'], self.directory)
+
+        self.assertEqual((len(written), skipped), (2, []))
+        with Image.open(self.directory / thumbnail_path('room-1.jpg', 400, 'webp')) as thumbnail:
+            self.assertEqual(thumbnail.size, (400, 200))
+        with Image.open(self.directory / thumbnail_path('room-1.jpg', 800, 'webp')) as thumbnail:
+            self.assertEqual(thumbnail.size, (600, 300))
+        self.assertEqual(generate_thumbnails(['room-1.jpg'], self.directory), ([], []))
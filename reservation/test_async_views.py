@@ -0,0 +1,139 @@
+"""
+Module containing Django test cases for the asynchronous views.
+
+The views are routed by this module's own URL configuration, which replaces the synchronous pages of
+reservation.urls with their asynchronous versions, like the ASYNC_VIEWS setting does.
+
+Classes:
+- AsyncRoomsViewTest: Test case for the asynchronous index, rooms and search views.
+- AsyncMyReservationViewTest: Test case for the asynchronous my_reservation view.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from datetime import date
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import path
+from reservation import async_views, urls
+from reservation.models import DormRoom, RoomReservation
+from reservation.search import normalize_filters, search_page, search_last_modified, search_etag
+
+ASYNC_PAGES = [
+    path('', async_views.index, name='index'),
+    path('my_reservation', async_views.my_reservation_view, name='myreservation'),
+    path('search', async_views.search_view, name='search'),
+    path('rooms', async_views.rooms, name='rooms'),
+]
+urlpatterns = ASYNC_PAGES + [pattern for pattern in urls.urlpatterns
+                             if pattern.name not in {page.name for page in ASYNC_PAGES}]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncRoomsViewTest(TestCase):
+    """
+        Test case for the asynchronous index, rooms and search views.
+
+        Methods:
+        - setUpTestData: Create six rooms in two cities.
+        - test_index: Test if the index page shows five rooms.
+        - test_rooms_paginated: Test if the rooms page is paginated by room ID.
+        - test_search_matches_sync_search: Test if the results and the ETag equal those of the synchronous search.
+        - test_search_shows_logout_to_users: Test if the navbar of a logged-in user offers to log out.
+        - test_search_not_modified: Test if a conditional request for an unchanged result gets 304.
+        - test_search_post_redirects_to_get: Test if a submitted search form is redirected to the GET URL.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(6):
+            DormRoom.objects.create(city=['Kraków', 'Poznań'][index % 2], street=f'Długa {index}',
+                                    room_type='single', mini_kitchenette=False, private_bathroom=False,
+                                    price=300 + index * 100)
+
+    async def test_index(self):
+        response = await self.async_client.get('/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['room_data']), 5)
+
+    async def test_rooms_paginated(self):
+        room_ids = [room_id async for room_id in DormRoom.objects.order_by('id').values_list('id', flat=True)]
+
+        response = await self.async_client.get('/rooms', {'page_size': 4})
+        next_response = await self.async_client.get('/rooms', {'page_size': 4, 'after': room_ids[3]})
+
+        self.assertEqual([room.id for room in response.context['room_data']], room_ids[:4])
+        self.assertContains(response, f'?page_size=4&amp;after={room_ids[3]}')
+        self.assertEqual([room.id for room in next_response.context['room_data']], room_ids[4:])
+
+    async def test_search_matches_sync_search(self):
+        params = {'city': 'Kraków', 'sort': '-price'}
+        filters = normalize_filters(params)
+
+        response = await self.async_client.get('/search', params)
+
+        page = await sync_to_async(search_page)(filters)
+        last_modified = await sync_to_async(search_last_modified)(filters)
+        self.assertEqual([room.id for room in response.context['room_data']], page.object_list)
+        self.assertEqual(response['ETag'], search_etag(filters, page, last_modified,
+                                                       variant=('city=Krak%C3%B3w&sort=-price', False)))
+
+    async def test_search_shows_logout_to_users(self):
+        user = await User.objects.acreate(username='student')
+        await sync_to_async(self.async_client.force_login)(user)
+
+        response = await self.async_client.get('/search', {'city': 'Poznań'})
+
+        self.assertContains(response, 'Log out')
+        self.assertIn('Cookie', response['Vary'])
+
+    async def test_search_not_modified(self):
+        response = await self.async_client.get('/search', {'city': 'Poznań'})
+        cached = await self.async_client.get('/search', {'city': 'Poznań'},
+                                             headers={'If-None-Match': response['ETag']})
+
+        self.assertEqual(cached.status_code, 304)
+
+    async def test_search_post_redirects_to_get(self):
+        response = await self.async_client.post('/search', {'city': 'Kraków', 'price': ''})
+
+        self.assertRedirects(response, '/search?city=Krak%C3%B3w', fetch_redirect_response=False)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncMyReservationViewTest(TestCase):
+    """
+        Test case for the asynchronous my_reservation view.
+
+        Methods:
+        - setUp: Create a user with an open and a closed reservation.
+        - test_authenticated_user: Test if the open and the closed reservations are listed separately.
+        - test_unauthenticated_user_redirect: Test if an anonymous user is redirected to the login page.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='student', password='testpassword')
+        room = DormRoom.objects.create(city='Kraków', street='Długa 1', room_type='double', mini_kitchenette=True,
+                                       private_bathroom=True, price=500)
+        self.open = RoomReservation.objects.create(user=self.user, room=room, check_in_date=date(2030, 7, 1),
+                                                   check_out_date=date(2030, 7, 5))
+        self.closed = RoomReservation.objects.create(user=self.user, room=room, check_in_date=date(2020, 7, 1),
+                                                     check_out_date=date(2020, 7, 5), is_open=False)
+
+    async def test_authenticated_user(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+
+        response = await self.async_client.get('/my_reservation')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['open_reservations'], [self.open])
+        self.assertEqual(response.context['closed_reservations'], [self.closed])
+        self.assertContains(response, 'Długa 1')
+
+    async def test_unauthenticated_user_redirect(self):
+        response = await self.async_client.get('/my_reservation')
+
+        self.assertRedirects(response, '/login', fetch_redirect_response=False)
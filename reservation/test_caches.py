@@ -0,0 +1,51 @@
+"""
+Module containing Django test cases for the cache settings.
+
+Classes:
+- CacheSettingsTest: Test case for building the cache settings from a cache URL.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from dormitory.caches import cache_settings
+
+
+class CacheSettingsTest(SimpleTestCase):
+    """
+        Test case for building the cache settings from a cache URL.
+
+        Methods:
+        - test_local_backends: Test if locmem and file URLs keep the entry limit.
+        - test_server_backends: Test if Redis gets the whole URL and Memcached the address.
+        - test_unsupported_url: Test if an unknown scheme or a bare location is rejected.
+        - test_shared_cache: Test if a cache shared by several processes must be Redis or Memcached.
+        """
+
+    def test_local_backends(self):
+        self.assertEqual(cache_settings('locmem://'), {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': '',
+            'OPTIONS': {'MAX_ENTRIES': 1000},
+        })
+        self.assertEqual(cache_settings('file:///var/cache/dormitory')['LOCATION'], '/var/cache/dormitory')
+
+    def test_server_backends(self):
+        redis = cache_settings('redis://cache:6379/1')
+        memcached = cache_settings('memcached://cache:11211')
+
+        self.assertEqual(redis['LOCATION'], 'redis://cache:6379/1')
+        self.assertNotIn('OPTIONS', redis)
+        self.assertEqual(memcached['LOCATION'], 'cache:11211')
+
+    def test_unsupported_url(self):
+        for url in ('mongodb://cache', '/var/cache'):
+            with self.assertRaises(ValueError):
+                cache_settings(url)
+
+    def test_shared_cache(self):
+        self.assertEqual(cache_settings('redis://cache:6379/1', shared=True)['LOCATION'], 'redis://cache:6379/1')
+        for url in ('', 'locmem://', 'file:///tmp/dormitory-cache'):
+            with self.assertRaises(ImproperlyConfigured):
+                cache_settings(url, shared=True)
@@ -0,0 +1,78 @@
+"""
+Module containing Django test cases for the cached room cards.
+
+Classes:
+- RoomCardsTest: Test case for rendering room cards from the card cache.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.template.loader import render_to_string
+from django.test import TestCase
+from reservation.cards import render_room_cards
+from reservation.models import DormRoom
+
+
+class RoomCardsTest(TestCase):
+    """
+        Test case for rendering room cards from the card cache.
+
+        Methods:
+        - setUp: Clear the card cache and create two rooms.
+        - replace_card(room, html): Replace the cached card of a room, keeping its stamp.
+        - test_renders_cards_in_order: Test if the cards match the card template and follow the room order.
+        - test_warm_cards_come_from_cache: Test if cached cards are reused instead of rendered again.
+        - test_edit_invalidates_own_card: Test if editing a room re-renders its card only.
+        - test_outdated_card_is_rendered: Test if a card cached for an older version of the room is not used.
+        """
+
+    def setUp(self):
+        self.cache = caches[settings.ROOM_CARD_CACHE_ALIAS]
+        self.cache.clear()
+        self.krakow = DormRoom.objects.create(city='Kraków', street='Długa 1', room_type='single',
+                                              mini_kitchenette=True, private_bathroom=True, price=500.00)
+        self.poznan = DormRoom.objects.create(city='Poznań', street='Półwiejska 2', room_type='double',
+                                              mini_kitchenette=False, private_bathroom=False, price=400.00)
+
+    def replace_card(self, room, html):
+        key = f'room_card:{room.id}'
+        self.cache.set(key, (self.cache.get(key)[0], html))
+
+    def test_renders_cards_in_order(self):
+        html = render_room_cards([self.poznan, self.krakow])
+
+        self.assertEqual(html, render_to_string('room_card.html', {'room': self.poznan}) +
+                         render_to_string('room_card.html', {'room': self.krakow}))
+        self.assertLess(html.index('Poznań'), html.index('Kraków'))
+
+    def test_warm_cards_come_from_cache(self):
+        render_room_cards([self.krakow, self.poznan])
+        self.replace_card(self.poznan, '<div>cached</div>')
+
+        html = render_room_cards(DormRoom.objects.order_by('id'))
+
+        self.assertTrue(html.endswith('<div>cached</div>'))
+
+    def test_edit_invalidates_own_card(self):
+        render_room_cards([self.krakow, self.poznan])
+        self.replace_card(self.krakow, '<div>krakow</div>')
+        self.replace_card(self.poznan, '<div>poznan</div>')
+
+        self.krakow.street = 'Krupnicza 3'
+        self.krakow.save()
+        html = render_room_cards(DormRoom.objects.order_by('id'))
+
+        self.assertIn('Krupnicza 3', html)
+        self.assertNotIn('<div>krakow</div>', html)
+        self.assertTrue(html.endswith('<div>poznan</div>'))
+
+    def test_outdated_card_is_rendered(self):
+        self.cache.set(f'room_card:{self.krakow.id}', ('2000-01-01T00:00:00+00:00', '<div>old</div>'))
+
+        html = render_room_cards([self.krakow])
+
+        self.assertNotIn('<div>old</div>', html)
+        self.assertIn('Długa 1', html)
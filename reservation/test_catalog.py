@@ -0,0 +1,137 @@
+"""
+Module containing Django test cases for the in-memory room catalog snapshot.
+
+Classes:
+- CatalogSnapshotTest: Test case for filtering rooms with the CatalogSnapshot class.
+- CatalogSnapshotViewsTest: Test case for the views reading the catalog from the snapshot.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from reservation.catalog import CatalogSnapshot, get_snapshot
+from reservation.models import DormRoom
+from reservation.search import normalize_filters, filter_rooms, sort_rooms, catalog_snapshot, search_paginator
+
+
+class CatalogSnapshotTest(TestCase):
+    """
+        Test case for filtering rooms with the CatalogSnapshot class.
+
+        Methods:
+        - setUpTestData: Create a small catalog covering every filter value.
+        - test_filters_match_database: Test if mask filtering returns the same rooms in the same order as the ORM.
+        - test_pages_match_database: Test if paging the snapshot rows returns the same pages and cursors as paging
+          in the database.
+        - test_unsupported_filters: Test if keyword and date searches and the city order are left to the
+          database.
+        - test_refresh_on_room_change: Test if saving a room makes the next snapshot include it.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        DormRoom.objects.bulk_create(
+            DormRoom(city=['Warszawa', 'Kraków', 'Poznań'][i % 3], room_type=['single', 'double', 'triple'][i % 4 % 3],
+                     mini_kitchenette=i % 2 == 0, private_bathroom=i % 5 == 0, price=[300, 400, 500, 700][i % 4])
+            for i in range(60)
+        )
+
+    def test_filters_match_database(self):
+        snapshot = CatalogSnapshot.from_database(version=0)
+        searches = [
+            {},
+            {'city': 'Kraków'},
+            {'city': 'Gdańsk'},
+            {'room_type': 'Double', 'mini_kitchenette': 'Yes'},
+            {'private_bathroom': 'No', 'price': '500 PLN'},
+            {'city': 'Poznań', 'room_type': 'Triple', 'mini_kitchenette': 'No', 'price': '700 PLN'},
+            {'min_price': '400 PLN', 'max_price': '500 PLN', 'sort': 'price'},
+            {'min_price': '500 PLN', 'sort': '-price'},
+            {'max_price': '400 PLN', 'sort': 'capacity'},
+            {'min_price': '399.999', 'max_price': '500.001', 'sort': '-price'},
+            {'guests': '2', 'city': 'Kraków'},
+        ]
+
+        for params in searches:
+            filters = normalize_filters(params)
+            with self.subTest(params=params):
+                self.assertEqual(snapshot.filter_ids(filters),
+                                 list(sort_rooms(filter_rooms(filters), filters.sort).values_list('id', flat=True)))
+
+    def test_pages_match_database(self):
+        snapshot = CatalogSnapshot.from_database(version=0)
+
+        for params in ({'city': 'Kraków'}, {'sort': 'price'}, {'max_price': '500 PLN', 'sort': '-price'},
+                       {'guests': '2', 'sort': 'capacity'}):
+            filters = normalize_filters(params)
+            paginator = search_paginator(filters, page_size=7)
+            rows = snapshot.filter_rows(filters)
+            cursor = None
+            with self.subTest(params=params):
+                while True:
+                    page = paginator.paginate_rows(rows, after=cursor)
+                    expected = paginator.paginate_keys(filter_rooms(filters), after=cursor)
+                    self.assertEqual((page.object_list, page.next_cursor, page.previous_cursor),
+                                     (expected.object_list, expected.next_cursor, expected.previous_cursor))
+                    if not page.has_next():
+                        break
+                    cursor = page.next_cursor
+
+    def test_unsupported_filters(self):
+        self.assertFalse(CatalogSnapshot.supports(normalize_filters({'keyword': 'kra'})))
+        self.assertFalse(CatalogSnapshot.supports(normalize_filters({'arrival_departure': '2024-07-01 to 2024-07-05'})))
+        self.assertFalse(CatalogSnapshot.supports(normalize_filters({'city': 'Łódź', 'sort': 'city'})))
+        self.assertTrue(CatalogSnapshot.supports(normalize_filters({'city': 'Kraków'})))
+
+    def test_refresh_on_room_change(self):
+        cache.clear()
+        before = catalog_snapshot()
+        room = DormRoom.objects.create(city='Gdańsk', room_type='single', mini_kitchenette=True,
+                                       private_bathroom=True, price=500.00)
+        after = catalog_snapshot()
+
+        self.assertIsNot(before, after)
+        self.assertIn(room.id, after.sorted_ids)
+        self.assertIs(get_snapshot(after.version), after)
+
+
+@override_settings(CATALOG_SNAPSHOT=True)
+class CatalogSnapshotViewsTest(TestCase):
+    """
+        Test case for the views reading the catalog from the snapshot.
+
+        Methods:
+        - setUp: Set up initial data for testing.
+        - test_search_view_uses_snapshot: Test if a catalog-only search is answered from the snapshot.
+        - test_rooms_view_uses_snapshot: Test if the rooms page is paginated over the snapshot IDs.
+        - test_index_view_uses_snapshot: Test if the index page samples rooms from the snapshot.
+        """
+
+    def setUp(self):
+        cache.clear()
+        for i in range(6):
+            DormRoom.objects.create(city='City', room_type='single', mini_kitchenette=i % 2 == 0,
+                                    private_bathroom=True, price=500.00)
+        catalog_snapshot()
+
+    def test_search_view_uses_snapshot(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('search'), {'mini_kitchenette': 'Yes'})
+
+        self.assertEqual(len(response.context['room_data']), 3)
+
+    def test_rooms_view_uses_snapshot(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('rooms'), {'page_size': 4})
+
+        self.assertEqual(len(response.context['room_data']), 4)
+        self.assertTrue(response.context['page'].has_next())
+
+    def test_index_view_uses_snapshot(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('index'))
+
+        self.assertEqual(len(response.context['room_data']), 5)
@@ -0,0 +1,143 @@
+"""
+Module containing Django test cases for the management commands of the application.
+
+Classes:
+- SeedRoomsCommandTest: Test case for the seed_rooms command.
+- ReservationTransferCommandTest: Test case for the import_reservations and export_reservations commands.
+- CloseExpiredReservationsCommandTest: Test case for the close_expired_reservations command.
+- GenerateDataCommandTest: Test case for the generate_data command.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import os
+import tempfile
+from io import StringIO
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from reservation.models import DormRoom, RoomReservation
+from reservation.management.commands.seed_rooms import INITIAL_ROOMS
+
+
+class SeedRoomsCommandTest(TestCase):
+    """
+        Test case for the seed_rooms command.
+
+        Methods:
+        - test_seeds_empty_catalog: Test if the command inserts the default rooms into an empty catalog.
+        - test_keeps_existing_catalog: Test if the command leaves an existing catalog untouched.
+        """
+
+    def test_seeds_empty_catalog(self):
+        with self.assertNumQueries(2):
+            call_command('seed_rooms', stdout=StringIO())
+
+        self.assertEqual(DormRoom.objects.count(), len(INITIAL_ROOMS))
+
+    def test_keeps_existing_catalog(self):
+        DormRoom.objects.create(city='City', room_type='single', private_bathroom=True, mini_kitchenette=True,
+                                price=500.00)
+
+        call_command('seed_rooms', stdout=StringIO())
+
+        self.assertEqual(DormRoom.objects.count(), 1)
+
+
+class ReservationTransferCommandTest(TestCase):
+    """
+        Test case for the import_reservations and export_reservations commands.
+
+        Methods:
+        - setUp: Create a user and a room, and a temporary directory for the files.
+        - test_import_jsonl_file: Test if a JSON Lines file is imported and rejected rows are reported.
+        - test_export_then_import: Test if an exported CSV file is imported back into an empty table.
+        - test_import_missing_file: Test if a missing input file is reported as a command error.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='student', password='testpassword')
+        self.room = DormRoom.objects.create(city='City', room_type='double', private_bathroom=True,
+                                            mini_kitchenette=True, price=500.00)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_import_jsonl_file(self):
+        path = os.path.join(self.directory, 'reservations.jsonl')
+        with open(path, 'w', encoding='utf-8') as stream:
+            stream.write(f'{{"username": "student", "room_id": {self.room.id}, "check_in_date": "2030-09-01", '
+                         f'"check_out_date": "2031-06-30", "number_of_people": 2}}\n')
+            stream.write(f'{{"username": "student", "room_id": {self.room.id}, "check_in_date": "2030-10-01", '
+                         f'"check_out_date": "2030-10-02", "number_of_people": 1}}\n')
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command('import_reservations', path, stdout=stdout, stderr=stderr)
+
+        self.assertEqual(RoomReservation.objects.count(), 1)
+        self.assertIn('Imported 1 reservations, rejected 1 rows', stdout.getvalue())
+        self.assertIn('Line 2: room already taken', stderr.getvalue())
+
+    def test_export_then_import(self):
+        RoomReservation.objects.create(user=self.user, room=self.room, check_in_date='2030-09-01',
+                                       check_out_date='2030-09-05')
+        path = os.path.join(self.directory, 'reservations.csv')
+
+        call_command('export_reservations', path, stdout=StringIO())
+        RoomReservation.objects.all().delete()
+        call_command('import_reservations', path, '--chunk-size', '1', stdout=StringIO(), stderr=StringIO())
+
+        self.assertEqual(RoomReservation.objects.get().check_in_date.isoformat(), '2030-09-01')
+
+    def test_import_missing_file(self):
+        with self.assertRaises(CommandError):
+            call_command('import_reservations', os.path.join(self.directory, 'missing.csv'), stdout=StringIO())
+
+
+class CloseExpiredReservationsCommandTest(TestCase):
+    """
+        Test case for the close_expired_reservations command.
+
+        Methods:
+        - test_reports_closed_rows: Test if the command closes ended stays and reports the rate.
+        """
+
+    def test_reports_closed_rows(self):
+        user = User.objects.create_user(username='student', password='testpassword')
+        room = DormRoom.objects.create(city='City', room_type='double', private_bathroom=True,
+                                       mini_kitchenette=True, price=500.00)
+        RoomReservation.objects.create(user=user, room=room, check_in_date='2020-09-01', check_out_date='2020-09-05')
+        stdout = StringIO()
+
+        call_command('close_expired_reservations', stdout=stdout)
+
+        self.assertFalse(RoomReservation.objects.get().is_open)
+        self.assertIn('Closed 1 expired reservations', stdout.getvalue())
+        self.assertIn('rows/s', stdout.getvalue())
+
+
+class GenerateDataCommandTest(TestCase):
+    """
+        Test case for the generate_data command.
+
+        Methods:
+        - test_generates_data: Test if the command writes the requested rows and reports them.
+        - test_rejects_unknown_room_type: Test if an unknown room type is reported as a command error.
+        """
+
+    def test_generates_data(self):
+        stdout = StringIO()
+
+        call_command('generate_data', '--rooms', '12', '--users', '3', '--reservations', '50',
+                     '--cities', 'Gdańsk, Kraków', stdout=stdout)
+
+        self.assertEqual(DormRoom.objects.count(), 12)
+        self.assertEqual(set(DormRoom.objects.values_list('city', flat=True)), {'Gdańsk', 'Kraków'})
+        self.assertEqual(RoomReservation.objects.count(), 50)
+        self.assertIn('Generated 12 rooms, 3 users and 50 reservations', stdout.getvalue())
+
+    def test_rejects_unknown_room_type(self):
+        with self.assertRaisesMessage(CommandError, 'Unknown room types: suite.'):
+            call_command('generate_data', '--room-types', 'single,suite', stdout=StringIO())
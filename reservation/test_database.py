@@ -0,0 +1,76 @@
+"""
+Module containing Django test cases for the database connection settings.
+
+Classes:
+- DatabaseSettingsTest: Test case for building the connection settings from environment variables.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from unittest import mock
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+from dormitory.database import database_settings, replica_settings
+
+
+class DatabaseSettingsTest(SimpleTestCase):
+    """
+        Test case for building the connection settings from environment variables.
+
+        Methods:
+        - test_defaults: Test if connections persist for a minute and are health-checked by default.
+        - test_environment: Test if the connection parameters and the maximum age are read from the environment.
+        - test_no_reuse: Test if connections can be closed after every request.
+        - test_pool: Test if the pool sizes are passed to the backend and persistent connections are turned off.
+        - test_pool_unsupported: Test if the pool mode is refused when it cannot be honoured.
+        - test_unknown_mode: Test if an unknown mode is rejected.
+        - test_replicas: Test if the replicas copy the default settings with their own hosts.
+        """
+
+    def test_defaults(self):
+        settings = database_settings({})
+
+        self.assertEqual(settings['NAME'], 'dorm_db')
+        self.assertEqual(settings['CONN_MAX_AGE'], 60)
+        self.assertTrue(settings['CONN_HEALTH_CHECKS'])
+        self.assertNotIn('OPTIONS', settings)
+
+    def test_environment(self):
+        settings = database_settings({'DORMITORY_DB_NAME': 'dorm', 'DORMITORY_DB_HOST': 'db',
+                                      'DORMITORY_DB_CONN_MAX_AGE': '300', 'DORMITORY_DB_HEALTH_CHECKS': '0'})
+
+        self.assertEqual((settings['NAME'], settings['HOST'], settings['PORT']), ('dorm', 'db', '5432'))
+        self.assertEqual(settings['CONN_MAX_AGE'], 300)
+        self.assertFalse(settings['CONN_HEALTH_CHECKS'])
+
+    def test_no_reuse(self):
+        self.assertEqual(database_settings({'DORMITORY_DB_CONNECTIONS': 'none'})['CONN_MAX_AGE'], 0)
+
+    @mock.patch('dormitory.database.pool_supported', return_value=True)
+    def test_pool(self, pool_supported):
+        settings = database_settings({'DORMITORY_DB_CONNECTIONS': 'pool', 'DORMITORY_DB_POOL_MAX_SIZE': '20',
+                                      'DORMITORY_DB_HEALTH_CHECKS': '0'})
+
+        self.assertEqual(settings['CONN_MAX_AGE'], 0)
+        self.assertEqual(settings['OPTIONS'], {'pool': {'min_size': 2, 'max_size': 20, 'timeout': 10.0}})
+
+    @mock.patch('dormitory.database.pool_supported', return_value=False)
+    def test_pool_unsupported(self, pool_supported):
+        with self.assertRaises(ImproperlyConfigured):
+            database_settings({'DORMITORY_DB_CONNECTIONS': 'pool'})
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            database_settings({'DORMITORY_DB_CONNECTIONS': 'pgbouncer'})
+
+    def test_replicas(self):
+        default = database_settings({'DORMITORY_DB_NAME': 'dorm'})
+        replicas = replica_settings(default, {'DORMITORY_DB_REPLICAS': 'db-a, db-b:6432,'})
+
+        self.assertEqual(list(replicas), ['replica1', 'replica2'])
+        self.assertEqual((replicas['replica2']['NAME'], replicas['replica2']['HOST'], replicas['replica2']['PORT']),
+                         ('dorm', 'db-b', '6432'))
+        self.assertEqual(replicas['replica1']['PORT'], '5432')
+        self.assertEqual(replicas['replica1']['TEST'], {'MIRROR': 'default'})
+        self.assertEqual(replica_settings(default, {}), {})
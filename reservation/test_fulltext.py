@@ -0,0 +1,158 @@
+"""
+Module containing Django test cases for the keyword search over room cities and streets.
+
+Classes:
+- FoldTextTest: Test case for folding texts to lowercase without accents.
+- KeywordMatchTest: Test case for matching rooms by keyword on the current database backend.
+- KeywordIndexTest: Query plan check for the keyword index (PostgreSQL only).
+- RestoreSearchTriggersTest: Test case for restoring the keyword index triggers after migrations (SQLite only).
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from unittest import skipUnless
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from reservation.fulltext import fold_text, keyword_terms, restore_search_triggers, SEARCH_FTS_TRIGGERS
+from reservation.models import DormRoom
+
+
+class FoldTextTest(SimpleTestCase):
+    """
+        Test case for folding texts to lowercase without accents.
+
+        Methods:
+        - test_fold_text: Test if accents, strokes and case are removed.
+        - test_keyword_terms: Test if a keyword is split into folded terms without punctuation.
+        """
+
+    def test_fold_text(self):
+        self.assertEqual(fold_text('Kraków'), 'krakow')
+        self.assertEqual(fold_text('Łódź, ul. Żółkiewskiego'), 'lodz, ul. zolkiewskiego')
+
+    def test_keyword_terms(self):
+        self.assertEqual(keyword_terms(' Nowy  Świat, 12 '), ['nowy', 'swiat', '12'])
+        self.assertEqual(keyword_terms('"*&'), [])
+        self.assertEqual(keyword_terms(None), [])
+
+
+class KeywordMatchTest(TestCase):
+    """
+        Test case for matching rooms by keyword on the current database backend.
+
+        Methods:
+        - setUp: Create rooms in two cities.
+        - matching_ids(keyword): Return the sorted IDs of the rooms matching a keyword.
+        - test_accent_insensitive: Test if a keyword without accents matches a city with accents.
+        - test_street_and_prefix: Test if every term must match the start of a word in the city or street.
+        - test_bulk_created_rooms: Test if rooms inserted with bulk_create are searchable.
+        - test_edited_room: Test if editing the street of a room updates what it is found by.
+        - test_no_terms: Test if a keyword without letters or digits matches nothing.
+        - test_expanding_fold: Test if a city and street that grow when folded, such as ß to ss, are stored whole.
+        """
+
+    def setUp(self):
+        self.krakow = DormRoom.objects.create(city='Kraków', street='Długa', room_type='single',
+                                              mini_kitchenette=True, private_bathroom=True, price=500.00)
+        self.warszawa = DormRoom.objects.create(city='Warszawa', street='Nowy Świat', room_type='double',
+                                                mini_kitchenette=False, private_bathroom=True, price=700.00)
+
+    def matching_ids(self, keyword):
+        return sorted(DormRoom.objects.matching(keyword).values_list('id', flat=True))
+
+    def test_accent_insensitive(self):
+        self.assertEqual(self.matching_ids('krakow'), [self.krakow.id])
+        self.assertEqual(self.matching_ids('KRAKÓW'), [self.krakow.id])
+        self.assertEqual(self.matching_ids('swiat'), [self.warszawa.id])
+
+    def test_street_and_prefix(self):
+        self.assertEqual(self.matching_ids('krak dlu'), [self.krakow.id])
+        self.assertEqual(self.matching_ids('krak swiat'), [])
+        self.assertEqual(self.matching_ids('akow'), [])
+
+    def test_bulk_created_rooms(self):
+        DormRoom.objects.bulk_create([DormRoom(city='Poznań', street='Półwiejska', room_type='triple',
+                                               mini_kitchenette=False, private_bathroom=False, price=300.00)])
+
+        self.assertEqual(DormRoom.objects.matching('polwiejska').get().city, 'Poznań')
+
+    def test_edited_room(self):
+        self.warszawa.street = 'Krucza'
+        self.warszawa.save(update_fields=['street'])
+
+        self.assertEqual(self.matching_ids('krucza'), [self.warszawa.id])
+        self.assertEqual(self.matching_ids('swiat'), [])
+
+    def test_no_terms(self):
+        self.assertEqual(self.matching_ids('!?'), [])
+
+    def test_expanding_fold(self):
+        room = DormRoom.objects.create(city='ß' * 20, street='ﬃ' * 30, room_type='single', mini_kitchenette=True,
+                                       private_bathroom=True, price=500.00)
+
+        self.assertEqual(len(room.search_text), 131)
+        self.assertEqual(self.matching_ids('ssss'), [room.id])
+
+
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN checks require PostgreSQL')
+class KeywordIndexTest(TestCase):
+    """
+        Query plan check for the keyword index on a catalog of 100 000 rooms.
+
+        Methods:
+        - setUpTestData(): Seeds 100 000 rooms on numbered streets.
+        - tearDownClass(): Re-analyzes the emptied room table.
+        - test_keyword_uses_gin_index(): Tests that a keyword search is answered by the GIN index.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO reservation_dormroom "
+                "(city, street, room_type, mini_kitchenette, private_bathroom, price, image_name, updated_at, "
+                "search_text, beds) "
+                "SELECT 'Kraków', 'Street ' || i, 'single', false, false, 500, 'room-1.jpg', now(), "
+                "'krakow street ' || i, 1 "
+                "FROM generate_series(0, 99999) i"
+            )
+            cursor.execute('ANALYZE reservation_dormroom')
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE reservation_dormroom')
+
+    def test_keyword_uses_gin_index(self):
+        plan = DormRoom.objects.matching('street 4217').explain()
+
+        self.assertIn('dormroom_search_text_gin_idx', plan)
+        self.assertNotIn('Seq Scan', plan)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'The keyword index triggers only exist on SQLite')
+class RestoreSearchTriggersTest(TestCase):
+    """
+        Test case for restoring the keyword index triggers after migrations (SQLite only).
+
+        Methods:
+        - test_restores_dropped_triggers: Test if dropped triggers are re-created and the index is rebuilt.
+        - test_triggers_present: Test if nothing is done when every trigger exists.
+        """
+
+    def test_restores_dropped_triggers(self):
+        with connection.cursor() as cursor:
+            for trigger in SEARCH_FTS_TRIGGERS:
+                cursor.execute(f'DROP TRIGGER {trigger}')
+        room = DormRoom.objects.create(city='Gdańsk', street='Długa', room_type='single', mini_kitchenette=True,
+                                       private_bathroom=True, price=500.00)
+
+        self.assertTrue(restore_search_triggers())
+        self.assertEqual(DormRoom.objects.matching('gdansk').get(), room)
+        room.delete()
+        self.assertFalse(DormRoom.objects.matching('gdansk').exists())
+
+    def test_triggers_present(self):
+        self.assertFalse(restore_search_triggers())
@@ -0,0 +1,256 @@
+"""
+Module containing Django test cases for the per-night bed inventory.
+
+Classes:
+- RoomInventoryTestCase: Test case for taking, releasing and rebuilding the beds of a room's nights.
+- BookRoomInventoryTestCase: Test case for booking rooms by the bed through the inventory.
+- InventoryAvailabilityTestCase: Test case for searching and showing the availability of rooms sold by the bed.
+- BookRoomInventoryConcurrencyTestCase: Test case for parallel bookings of the last beds of a room.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from io import StringIO
+from threading import Barrier
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.urls import reverse
+from reservation.inventory import beds_free, take_beds, release_beds, rebuild_room
+from reservation.models import DormRoom, RoomNight, RoomReservation
+from reservation.services import book_room, BookingError, ROOM_TAKEN_MESSAGE, ROOM_TOO_SMALL_MESSAGE
+
+
+class RoomInventoryTestCase(TestCase):
+    """
+        Test case for taking, releasing and rebuilding the beds of a room's nights.
+
+        Methods:
+        - setUp(): Prepares a triple room.
+        - test_take_beds(): Tests that every night of the stay loses the taken beds.
+        - test_take_beds_on_full_night(): Tests that a stay with one full night reports failure.
+        - test_release_beds(): Tests that released beds are given back, up to the room's beds.
+        - test_rebuild_room(): Tests that a rebuilt inventory counts the people of open reservations only.
+        - test_rebuild_command(): Tests that the command rebuilds the given rooms.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='triple', mini_kitchenette=True,
+                                            private_bathroom=True, price=500.00)
+        self.start = date(2030, 7, 1)
+
+    def day(self, offset):
+        return self.start + timedelta(days=offset)
+
+    def free_nights(self):
+        return dict(RoomNight.objects.filter(room=self.room).values_list('night', 'beds_free'))
+
+    def test_take_beds(self):
+        self.assertTrue(take_beds(self.room, self.day(0), self.day(2), 2))
+
+        self.assertEqual(self.free_nights(), {self.day(0): 1, self.day(1): 1, self.day(2): 1})
+        self.assertEqual(beds_free(self.room, self.day(2), self.day(5)), 1)
+        self.assertEqual(beds_free(self.room, self.day(3), self.day(5)), 3)
+
+    def test_take_beds_on_full_night(self):
+        take_beds(self.room, self.day(2), self.day(2), 3)
+
+        with transaction.atomic():
+            self.assertFalse(take_beds(self.room, self.day(0), self.day(3), 1))
+            transaction.set_rollback(True)
+
+        self.assertEqual(self.free_nights(), {self.day(2): 0})
+
+    def test_release_beds(self):
+        take_beds(self.room, self.day(0), self.day(1), 2)
+
+        release_beds(self.room, self.day(1), self.day(1), 3)
+
+        self.assertEqual(self.free_nights(), {self.day(0): 1, self.day(1): 3})
+
+    def test_rebuild_room(self):
+        RoomReservation.objects.bulk_create([
+            RoomReservation(user=self.user, room=self.room, check_in_date=self.day(0), check_out_date=self.day(1),
+                            number_of_people=2),
+            RoomReservation(user=self.user, room=self.room, check_in_date=self.day(1), check_out_date=self.day(2)),
+            RoomReservation(user=self.user, room=self.room, check_in_date=self.day(0), check_out_date=self.day(2),
+                            is_open=False),
+        ])
+        take_beds(self.room, self.day(5), self.day(5), 1)
+
+        self.assertEqual(rebuild_room(self.room), 3)
+        self.assertEqual(self.free_nights(), {self.day(0): 1, self.day(1): 0, self.day(2): 2})
+
+    def test_rebuild_command(self):
+        RoomReservation.objects.bulk_create([
+            RoomReservation(user=self.user, room=self.room, check_in_date=self.day(0), check_out_date=self.day(1)),
+        ])
+        stdout = StringIO()
+
+        call_command('rebuild_inventory', self.room.id, stdout=stdout)
+
+        self.assertEqual(self.free_nights(), {self.day(0): 2, self.day(1): 2})
+        self.assertIn('Rebuilt inventory of 1 rooms, 2 booked nights.', stdout.getvalue())
+
+
+@override_settings(BOOKING_INVENTORY=True)
+class BookRoomInventoryTestCase(TestCase):
+    """
+        Test case for booking rooms by the bed through the inventory.
+
+        Methods:
+        - setUp(): Prepares a double room.
+        - test_book_by_the_bed(): Tests that a double room takes two single bookings and refuses a third.
+        - test_book_too_many_people(): Tests that a booking above the room capacity is rejected.
+        - test_refused_booking_keeps_inventory(): Tests that a refused booking leaves the free beds unchanged.
+        - test_deleted_reservation_releases_beds(): Tests that deleting a reservation gives its beds back.
+        - test_closed_reservation_releases_beds(): Tests that closing a reservation gives its beds back.
+        - test_room_type_change_rebuilds(): Tests that a room with more beds can take more bookings.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='double', mini_kitchenette=True,
+                                            private_bathroom=True, price=400.00)
+        self.start = date(2030, 7, 1)
+
+    def book(self, first_day, last_day, number_of_people=1):
+        return book_room(RoomReservation(user=self.user, room=self.room, number_of_people=number_of_people,
+                                         check_in_date=self.start + timedelta(days=first_day),
+                                         check_out_date=self.start + timedelta(days=last_day)))
+
+    def test_book_by_the_bed(self):
+        self.book(0, 3)
+        self.book(2, 4)
+
+        with self.assertRaisesMessage(BookingError, ROOM_TAKEN_MESSAGE):
+            self.book(3, 3)
+        self.book(4, 6)
+        self.assertEqual(RoomReservation.objects.count(), 3)
+
+    def test_book_too_many_people(self):
+        with self.assertRaisesMessage(BookingError, ROOM_TOO_SMALL_MESSAGE):
+            self.book(0, 1, number_of_people=3)
+        self.assertFalse(RoomNight.objects.exists())
+
+    def test_refused_booking_keeps_inventory(self):
+        self.book(2, 2, number_of_people=2)
+
+        with self.assertRaises(BookingError):
+            self.book(0, 4)
+
+        self.assertEqual(beds_free(self.room, self.start, self.start + timedelta(days=1)), 2)
+        self.assertEqual(beds_free(self.room, self.start, self.start + timedelta(days=4)), 0)
+
+    def test_deleted_reservation_releases_beds(self):
+        reservation = self.book(0, 1, number_of_people=2)
+
+        reservation.delete()
+
+        self.assertEqual(beds_free(self.room, self.start, self.start + timedelta(days=1)), 2)
+
+    def test_closed_reservation_releases_beds(self):
+        reservation = self.book(0, 1, number_of_people=2)
+
+        reservation.is_open = False
+        reservation.save()
+
+        self.book(0, 1, number_of_people=2)
+
+    def test_room_type_change_rebuilds(self):
+        self.book(0, 1, number_of_people=2)
+
+        self.room.room_type = 'triple'
+        self.room.save()
+
+        self.book(1, 1)
+        with self.assertRaises(BookingError):
+            self.book(1, 1)
+
+
+@override_settings(BOOKING_INVENTORY=True)
+class InventoryAvailabilityTestCase(TestCase):
+    """
+        Test case for searching and showing the availability of rooms sold by the bed.
+
+        Methods:
+        - setUp(): Prepares a double room with one bed taken on the first two nights.
+        - test_available_between(): Tests that a partly booked room is found for as many guests as it has beds free.
+        - test_calendar(): Tests that the calendar only marks the nights without a free bed as occupied.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='double', mini_kitchenette=True,
+                                            private_bathroom=True, price=400.00)
+        self.start = date(2030, 7, 1)
+        book_room(RoomReservation(user=self.user, room=self.room, number_of_people=1,
+                                  check_in_date=self.start, check_out_date=self.start + timedelta(days=1)))
+
+    def test_available_between(self):
+        end = self.start + timedelta(days=3)
+
+        self.assertQuerySetEqual(DormRoom.objects.available_between(self.start, end), [self.room])
+        self.assertFalse(DormRoom.objects.available_between(self.start, end, beds=2).exists())
+        self.assertTrue(DormRoom.objects.available_between(end, end, beds=2).exists())
+
+        book_room(RoomReservation(user=self.user, room=self.room, number_of_people=1,
+                                  check_in_date=self.start + timedelta(days=1), check_out_date=end))
+        self.assertFalse(DormRoom.objects.available_between(self.start, end).exists())
+
+    def test_calendar(self):
+        book_room(RoomReservation(user=self.user, room=self.room, number_of_people=1,
+                                  check_in_date=self.start + timedelta(days=1),
+                                  check_out_date=self.start + timedelta(days=2)))
+
+        response = self.client.get(reverse('room_availability', args=[self.room.id]),
+                                   {'start': self.start.isoformat(), 'days': 4})
+
+        self.assertEqual(response.json()['occupied'], [(self.start + timedelta(days=1)).isoformat()])
+
+
+@skipUnlessDBFeature('has_select_for_update')
+@override_settings(BOOKING_INVENTORY=True)
+class BookRoomInventoryConcurrencyTestCase(TransactionTestCase):
+    """
+        Test case for parallel bookings of the last beds of a room.
+
+        Methods:
+        - setUp(): Prepares a triple room.
+        - test_parallel_bookings(): Tests that exactly three of many simultaneous single-bed bookings succeed.
+        """
+
+    workers = 16
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='triple', mini_kitchenette=True,
+                                            private_bathroom=True, price=500.00)
+        self.start = date(2030, 7, 1)
+
+    def test_parallel_bookings(self):
+        barrier = Barrier(self.workers)
+
+        def attempt(offset):
+            reservation = RoomReservation(user=self.user, room=self.room,
+                                          check_in_date=self.start + timedelta(days=offset % 3),
+                                          check_out_date=self.start + timedelta(days=5))
+            try:
+                barrier.wait()
+                book_room(reservation)
+                return True
+            except BookingError:
+                return False
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(attempt, range(self.workers)))
+
+        self.assertEqual(results.count(True), 3)
+        self.assertEqual(min(RoomNight.objects.filter(room=self.room).values_list('beds_free', flat=True)), 0)
@@ -0,0 +1,214 @@
+"""
+Module containing Django test cases for the per-view request and SQL statistics.
+
+Classes:
+- ViewStatTest: Test case for the histograms and their Prometheus text format.
+- ViewStatsMiddlewareTest: Test case for recording requests and serving the statistics.
+- TopViewsCommandTest: Test case for the top_views command.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+from urllib.error import URLError
+from asgiref.sync import iscoroutinefunction
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, RequestFactory, override_settings
+from django.urls import reverse
+from reservation.middleware import ViewStatsMiddleware
+from reservation.metrics import ViewStat, QueryRecorder, view_stats, render_exposition, parse_exposition
+from reservation.models import DormRoom
+
+
+class ViewStatTest(SimpleTestCase):
+    """
+        Test case for the histograms and their Prometheus text format.
+
+        Methods:
+        - make_stat: Build the statistics of four requests.
+        - test_record: Test if requests land in their buckets and totals.
+        - test_quantile: Test if quantiles are interpolated inside the buckets.
+        - test_exposition_round_trip: Test if parsing the rendered text gives back the same statistics.
+        """
+
+    def make_stat(self):
+        stat = ViewStat()
+        stat.record(0.004, 0, 0.0, 0)
+        stat.record(0.02, 3, 0.01, 0)
+        stat.record(0.03, 3, 0.02, 1)
+        stat.record(20, 500, 15.0, 2)
+        return stat
+
+    def test_record(self):
+        stat = self.make_stat()
+
+        self.assertEqual(stat.requests, 4)
+        self.assertEqual(stat.request_buckets, [1, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 1])
+        self.assertEqual(stat.query_buckets, [1, 0, 0, 2, 0, 0, 0, 0, 0, 1])
+        self.assertEqual((stat.queries, stat.slow_queries), (506, 3))
+        self.assertAlmostEqual(stat.query_seconds, 15.03)
+
+    def test_quantile(self):
+        stat = self.make_stat()
+
+        self.assertAlmostEqual(stat.quantile(0.25), 0.005)
+        self.assertAlmostEqual(stat.quantile(0.5), 0.025)
+        self.assertEqual(stat.quantile(1), 10)
+        self.assertIsNone(ViewStat().quantile(0.5))
+
+    def test_exposition_round_trip(self):
+        stats = {'search': self.make_stat(), 'odd "name"': ViewStat()}
+
+        text = render_exposition(stats)
+        parsed = parse_exposition(text)
+
+        self.assertIn('dormitory_view_request_seconds_bucket{view="search",le="0.005"} 1', text)
+        self.assertIn('dormitory_view_request_seconds_count{view="search"} 4', text)
+        self.assertEqual(parsed.keys(), stats.keys())
+        self.assertEqual(parsed['search'].__dict__, stats['search'].__dict__)
+
+
+class ViewStatsMiddlewareTest(TestCase):
+    """
+        Test case for recording requests and serving the statistics.
+
+        Methods:
+        - setUp: Start from empty statistics.
+        - test_records_view: Test if a request is counted under its URL name with its queries.
+        - test_unresolved_request: Test if requests without a URL name are counted together.
+        - test_records_async_view: Test if the queries of an async view are counted.
+        - test_async_capable: Test if the middleware is a coroutine function in an async middleware chain.
+        - test_metrics_view: Test if the metrics view serves the statistics in the Prometheus text format.
+        - test_metrics_view_other_address: Test if other addresses cannot read the statistics.
+        - test_metrics_view_token: Test if only the holders of the token can read the statistics once it is set.
+        - test_slow_query_log: Test if queries above the threshold are logged with the view name.
+        """
+
+    def setUp(self):
+        view_stats.reset()
+        self.addCleanup(view_stats.reset)
+
+    def test_records_view(self):
+        DormRoom.objects.create(city='Kraków', room_type='single', mini_kitchenette=False, private_bathroom=False,
+                                price=300)
+
+        self.client.get(reverse('rooms'))
+        self.client.get(reverse('rooms'))
+
+        stat = view_stats.snapshot()['rooms']
+        self.assertEqual(stat.requests, 2)
+        self.assertGreater(stat.queries, 0)
+        self.assertGreater(stat.request_seconds, stat.query_seconds)
+
+    def test_unresolved_request(self):
+        self.client.get('/no-such-page')
+
+        self.assertEqual(view_stats.snapshot()['unresolved'].requests, 1)
+
+    @override_settings(ROOT_URLCONF='reservation.test_async_views')
+    async def test_records_async_view(self):
+        await DormRoom.objects.acreate(city='Kraków', room_type='single', mini_kitchenette=False,
+                                       private_bathroom=False, price=300)
+
+        response = await self.async_client.get('/rooms')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(view_stats.snapshot()['rooms'].queries, 0)
+
+    def test_async_capable(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        self.assertTrue(iscoroutinefunction(ViewStatsMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(ViewStatsMiddleware(lambda request: HttpResponse())))
+
+    def test_metrics_view(self):
+        self.client.get(reverse('about'))
+
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        self.assertEqual(parse_exposition(response.content.decode())['about'].requests, 1)
+
+    @override_settings(METRICS_ALLOWED_IPS=['10.0.0.1'])
+    def test_metrics_view_other_address(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 404)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_metrics_view_token(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 404)
+        self.assertEqual(self.client.get(reverse('metrics'), headers={'Authorization': 'Bearer wrong'}).status_code,
+                         404)
+        self.assertEqual(self.client.get(reverse('metrics'), headers={'Authorization': 'Bearer secret'}).status_code,
+                         200)
+
+    def test_slow_query_log(self):
+        request = RequestFactory().get('/rooms')
+        request.resolver_match = type('Match', (), {'view_name': 'rooms'})()
+        recorder = QueryRecorder(request, 0.0)
+
+        with self.assertLogs('reservation.sql', 'WARNING') as logs, connection.execute_wrapper(recorder):
+            DormRoom.objects.count()
+
+        self.assertEqual((recorder.queries, recorder.slow_queries), (1, 1))
+        self.assertIn('Slow query in rooms', logs.output[0])
+
+
+class TopViewsCommandTest(SimpleTestCase):
+    """
+        Test case for the top_views command.
+
+        Methods:
+        - write_metrics: Save the statistics of two views to a temporary file.
+        - test_sorted_by_sql_time: Test if views are listed by SQL time by default.
+        - test_sort_and_limit: Test if another total and a limit can be chosen.
+        - test_unreadable_url: Test if an unreadable URL is reported as a command error.
+        - test_token: Test if the metrics view is asked with the token of the settings.
+        """
+
+    def write_metrics(self):
+        rooms, search = ViewStat(), ViewStat()
+        rooms.record(0.05, 40, 0.04, 0)
+        search.record(0.02, 2, 0.001, 0)
+        search.record(0.03, 2, 0.001, 0)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / 'metrics.txt'
+        path.write_text(render_exposition({'rooms': rooms, 'search': search}))
+        return path.as_uri()
+
+    def top_views(self, *args):
+        stdout = StringIO()
+        call_command('top_views', '--url', self.write_metrics(), *args, stdout=stdout)
+        return stdout.getvalue().splitlines()
+
+    def test_sorted_by_sql_time(self):
+        lines = self.top_views()
+
+        self.assertEqual([line.split()[0] for line in lines[1:]], ['rooms', 'search'])
+        self.assertEqual(lines[1].split()[4], '40.0')
+
+    def test_sort_and_limit(self):
+        lines = self.top_views('--sort', 'requests', '--limit', '1')
+
+        self.assertEqual([line.split()[:2] for line in lines[1:]], [['search', '2']])
+
+    def test_unreadable_url(self):
+        with self.assertRaises(CommandError):
+            call_command('top_views', '--url', Path(os.devnull, 'missing').as_uri(), stdout=StringIO())
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_token(self):
+        with mock.patch('reservation.management.commands.top_views.urlopen',
+                        side_effect=URLError('refused')) as urlopen, self.assertRaises(CommandError):
+            call_command('top_views', stdout=StringIO())
+
+        self.assertEqual(urlopen.call_args.args[0].get_header('Authorization'), 'Bearer secret')
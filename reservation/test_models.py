@@ -4,15 +4,21 @@ Module containing Django test cases for room reservations in the application.
 Classes:
 - DormRoomTestCase: Test case for the DormRoom model.
 - RoomReservationTestCase: Test case for the RoomReservation model.
+- RoomReservationIndexTestCase: Query plan checks for the reservation indexes (PostgreSQL only).
+- DormRoomSearchIndexTestCase: Query plan checks for the room search indexes (PostgreSQL only).
 
 Author: [ASF]
 Creation Date: [13.11.2023]
 """
 
+from unittest import skipUnless
 from django.test import TestCase
+from django.db import connection
 from django.contrib.auth.models import User
 from reservation.models import DormRoom, RoomReservation
-from datetime import datetime, timedelta
+from reservation.search import normalize_filters, search_queryset
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 
 
 class DormRoomTestCase(TestCase):
@@ -22,9 +28,14 @@ class DormRoomTestCase(TestCase):
         Methods:
         - setUp(): Prepares data for testing.
         - test_get_beds(): Tests the get_beds method.
+        - test_beds_follow_room_type(): Tests that the stored bed count is kept in sync with the room type.
         - test_get_bathroom_type(): Tests the get_bathroom_type method.
         - test_get_mini_kitchenette(): Tests the get_mini_kitchenette method.
         - test_is_available(): Tests the is_available method for room reservation availability.
+        - test_is_not_available_when_overlapping(): Tests that an overlapping open reservation blocks the room.
+        - test_available_between(): Tests the set-based availability lookup on the DormRoom queryset.
+        - test_random_sample(): Tests that random_sample returns distinct rooms, at most the requested number.
+        - test_arandom_sample(): Tests that arandom_sample picks rooms the same way with the async ORM.
         """
 
     def setUp(self):
@@ -35,6 +46,15 @@ class DormRoomTestCase(TestCase):
     def test_get_beds(self):
         self.assertEqual(self.room.get_beds(), 1)
 
+    def test_beds_follow_room_type(self):
+        self.room.room_type = 'triple'
+        self.room.save(update_fields=['room_type'])
+        DormRoom.objects.bulk_create([DormRoom(city='TestCity', room_type='double', mini_kitchenette=False,
+                                               private_bathroom=False, price=400.00)])
+
+        self.assertEqual(DormRoom.objects.get(id=self.room.id).beds, 3)
+        self.assertEqual(DormRoom.objects.get(room_type='double').beds, 2)
+
     def test_get_bathroom_type(self):
         self.assertEqual(self.room.get_bathroom_type(), 'Private')
 
@@ -46,6 +66,50 @@ class DormRoomTestCase(TestCase):
         end_date = start_date + timedelta(days=7)
         self.assertTrue(self.room.is_available(start_date, end_date))
 
+    def test_is_not_available_when_overlapping(self):
+        start_date = datetime.now().date()
+        RoomReservation.objects.create(user=self.user, room=self.room, check_in_date=start_date + timedelta(days=2),
+                                       check_out_date=start_date + timedelta(days=10))
+        self.assertFalse(self.room.is_available(start_date, start_date + timedelta(days=3)))
+        self.assertTrue(self.room.is_available(start_date, start_date + timedelta(days=1)))
+
+    def test_available_between(self):
+        start_date = datetime.now().date()
+        taken_room = DormRoom.objects.create(city='TestCity', room_type='double', mini_kitchenette=False,
+                                             private_bathroom=False, price=400.00)
+        RoomReservation.objects.create(user=self.user, room=taken_room, check_in_date=start_date,
+                                       check_out_date=start_date + timedelta(days=7))
+        RoomReservation.objects.create(user=self.user, room=self.room, check_in_date=start_date,
+                                       check_out_date=start_date + timedelta(days=7), is_open=False)
+
+        available = DormRoom.objects.available_between(start_date + timedelta(days=3), start_date + timedelta(days=5))
+
+        self.assertQuerysetEqual(available, [self.room])
+
+    def test_random_sample(self):
+        DormRoom.objects.bulk_create(
+            DormRoom(city='TestCity', room_type='double', mini_kitchenette=False, private_bathroom=False, price=400.00)
+            for _ in range(9)
+        )
+        DormRoom.objects.filter(id__in=DormRoom.objects.order_by('id').values('id')[2:6]).delete()
+
+        rooms = DormRoom.objects.random_sample(5)
+
+        self.assertEqual(len(rooms), 5)
+        self.assertEqual(len({room.id for room in rooms}), 5)
+        self.assertEqual(len(DormRoom.objects.random_sample(10)), 6)
+
+    async def test_arandom_sample(self):
+        await DormRoom.objects.abulk_create(
+            DormRoom(city='TestCity', room_type='double', mini_kitchenette=False, private_bathroom=False, price=400.00)
+            for _ in range(9)
+        )
+
+        rooms = await DormRoom.objects.arandom_sample(5)
+
+        self.assertEqual(len({room.id for room in rooms}), 5)
+        self.assertEqual(len(await DormRoom.objects.arandom_sample(20)), 10)
+
 
 class RoomReservationTestCase(TestCase):
     """
@@ -68,3 +132,144 @@ class RoomReservationTestCase(TestCase):
 
     def test_is_open_reservation(self):
         self.assertTrue(self.reservation.is_open_reservation())
+
+
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN checks require PostgreSQL')
+class RoomReservationIndexTestCase(TestCase):
+    """
+        Query plan checks for the reservation indexes on a table of 100 000 reservations.
+
+        Methods:
+        - setUpTestData(): Seeds 200 rooms with 500 weekly reservations each.
+        - tearDownClass(): Re-analyzes the emptied room and reservation tables.
+        - test_overlap_query_uses_index(): Tests that the room overlap check is answered by an index scan.
+        - test_available_between_uses_index(): Tests that the availability subquery is answered by an index scan.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', password='testpassword')
+        DormRoom.objects.bulk_create(
+            DormRoom(city='TestCity', room_type='single', mini_kitchenette=False, private_bathroom=False,
+                     price=500.00)
+            for _ in range(200)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO reservation_roomreservation "
+                "(user_id, room_id, check_in_date, check_out_date, is_open, number_of_people, updated_at) "
+                "SELECT %s, room.id, DATE '2000-01-01' + week * 7, DATE '2000-01-01' + week * 7 + 5, week >= 400, 1, "
+                "now() "
+                "FROM reservation_dormroom room CROSS JOIN generate_series(0, 499) week",
+                [cls.user.id]
+            )
+            cursor.execute('ANALYZE reservation_dormroom')
+            cursor.execute('ANALYZE reservation_roomreservation')
+        cls.room = DormRoom.objects.order_by('id').first()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        # Table statistics survive the rollback of the seeded rows, refresh them for the following tests.
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE reservation_dormroom')
+            cursor.execute('ANALYZE reservation_roomreservation')
+
+    def test_overlap_query_uses_index(self):
+        start_date = date(2000, 1, 1) + timedelta(days=450 * 7)
+        plan = RoomReservation.objects.overlapping(start_date, start_date + timedelta(days=3)).filter(
+            room=self.room).explain()
+
+        self.assertIn('Index', plan)
+        self.assertNotIn('Seq Scan on reservation_roomreservation', plan)
+
+    def test_available_between_uses_index(self):
+        start_date = date(2000, 1, 1) + timedelta(days=450 * 7)
+        plan = DormRoom.objects.available_between(start_date, start_date + timedelta(days=3)).explain()
+
+        self.assertIn('reservation_room_stay_idx', plan)
+
+
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN checks require PostgreSQL')
+class DormRoomSearchIndexTestCase(TestCase):
+    """
+        Query plan checks for the room search indexes on a catalog of 200 000 rooms.
+
+        Methods:
+        - setUpTestData(): Seeds 200 000 rooms across four cities, three room types and four prices.
+        - tearDownClass(): Re-analyzes the emptied room table.
+        - explain_search(params, after=None): Returns the plan of the query a search runs for a result page on a
+          cache miss.
+        - test_price_sort_uses_index(): Tests that sorting the whole catalog by price reads the price index.
+        - test_filtered_price_range_uses_index(): Tests that a city, type and price range search is ordered by the
+          composite index.
+        - test_descending_price_sort_uses_index(): Tests that a descending price sort scans the index backwards.
+        - test_deep_price_page_uses_index(): Tests that a page deep into a price sort starts the index scan at the
+          cursor.
+        - test_city_sort_uses_index(): Tests that sorting by city reads the city index.
+        - test_guests_capacity_sort_uses_index(): Tests that a guest count sorted by capacity reads the beds index.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO reservation_dormroom "
+                "(city, street, room_type, mini_kitchenette, private_bathroom, price, image_name, updated_at, "
+                "search_text, beds) "
+                "SELECT (ARRAY['Warszawa', 'Kraków', 'Poznań', 'Szczecin'])[i % 4 + 1], 'street', "
+                "(ARRAY['single', 'double', 'triple'])[i % 3 + 1], i % 2 = 0, i % 5 = 0, "
+                "(ARRAY[300, 400, 500, 700])[i / 7 % 4 + 1], 'room-1.jpg', now(), '', i % 3 + 1 "
+                "FROM generate_series(0, 199999) i"
+            )
+            cursor.execute('ANALYZE reservation_dormroom')
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        # Table statistics survive the rollback of the seeded rows, refresh them for the following tests.
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE reservation_dormroom')
+
+    def explain_search(self, params, after=None):
+        return search_queryset(normalize_filters(params), after=after).explain()
+
+    def test_price_sort_uses_index(self):
+        plan = self.explain_search({'sort': 'price'})
+
+        self.assertIn('dormroom_price_idx', plan)
+        self.assertNotIn('Sort', plan)
+
+    def test_filtered_price_range_uses_index(self):
+        plan = self.explain_search({'city': 'Kraków', 'room_type': 'Double', 'min_price': '400 PLN',
+                                    'max_price': '500 PLN', 'sort': 'price'})
+
+        self.assertIn('dormroom_city_type_price_idx', plan)
+        self.assertNotIn('Sort', plan)
+        self.assertNotIn('Seq Scan', plan)
+
+    def test_descending_price_sort_uses_index(self):
+        plan = self.explain_search({'city': 'Poznań', 'sort': '-price'})
+
+        self.assertIn('Scan Backward', plan)
+        self.assertIn('dormroom_city_price_idx', plan)
+        self.assertNotIn('Sort', plan)
+
+    def test_deep_price_page_uses_index(self):
+        plan = self.explain_search({'sort': '-price'}, after=(Decimal('400.00'), 100000))
+
+        self.assertIn('dormroom_price_idx', plan)
+        self.assertIn('Index Cond', plan)
+        self.assertNotIn('Sort', plan)
+
+    def test_city_sort_uses_index(self):
+        plan = self.explain_search({'sort': 'city'})
+
+        self.assertIn('dormroom_city_idx', plan)
+        self.assertNotIn('Sort', plan)
+
+    def test_guests_capacity_sort_uses_index(self):
+        plan = self.explain_search({'guests': '2', 'sort': 'capacity'})
+
+        self.assertIn('dormroom_beds_idx', plan)
+        self.assertNotIn('Sort', plan)
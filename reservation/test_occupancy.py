@@ -0,0 +1,125 @@
+"""
+Module containing Django test cases for the occupancy bitmaps of the availability calendar.
+
+Classes:
+- RoomOccupancyTestCase: Test case for keeping the bitmaps in sync with reservations.
+- RoomAvailabilityViewTest: Test case for the room availability JSON view.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from datetime import date, timedelta
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from reservation.models import DormRoom, RoomReservation, RoomOccupancy
+from reservation.occupancy import room_calendar, rebuild_room
+
+
+class RoomOccupancyTestCase(TestCase):
+    """
+        Test case for keeping the occupancy bitmaps in sync with reservations.
+
+        Methods:
+        - setUp(): Prepares data for testing.
+        - test_new_reservation_marks_days(): Tests that saving a reservation marks its days as occupied.
+        - test_closed_reservation_is_ignored(): Tests that closed reservations do not occupy days.
+        - test_deleted_reservation_frees_days(): Tests that deleting a reservation frees only its own days.
+        - test_updated_reservation_moves_days(): Tests that changing the dates of a reservation moves its days.
+        - test_rebuild_room(): Tests that a bitmap rebuilt from scratch matches the incremental one.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='single', mini_kitchenette=True,
+                                            private_bathroom=True, price=500.00)
+        self.start = date(2024, 7, 1)
+
+    def reserve(self, first_day, last_day, **kwargs):
+        return RoomReservation.objects.create(user=self.user, room=self.room,
+                                              check_in_date=self.start + timedelta(days=first_day),
+                                              check_out_date=self.start + timedelta(days=last_day), **kwargs)
+
+    def occupied_days(self):
+        return [day for day, occupied in enumerate(room_calendar(self.room.id, self.start, 30)) if occupied]
+
+    def test_new_reservation_marks_days(self):
+        self.reserve(2, 4)
+
+        self.assertEqual(self.occupied_days(), [2, 3, 4])
+
+    def test_closed_reservation_is_ignored(self):
+        self.reserve(2, 4, is_open=False)
+
+        self.assertEqual(self.occupied_days(), [])
+
+    def test_deleted_reservation_frees_days(self):
+        first = self.reserve(2, 4)
+        self.reserve(4, 6, is_open=True)
+
+        first.delete()
+
+        self.assertEqual(self.occupied_days(), [4, 5, 6])
+
+    def test_updated_reservation_moves_days(self):
+        reservation = self.reserve(2, 4)
+        reservation.check_in_date = self.start + timedelta(days=10)
+        reservation.check_out_date = self.start + timedelta(days=11)
+        reservation.save()
+
+        self.assertEqual(self.occupied_days(), [10, 11])
+
+    def test_rebuild_room(self):
+        self.reserve(2, 4)
+        self.reserve(20, 25)
+        incremental = bytes(RoomOccupancy.objects.get(room=self.room).bitmap)
+
+        RoomOccupancy.objects.all().delete()
+        rebuild_room(self.room.id)
+
+        self.assertEqual(bytes(RoomOccupancy.objects.get(room=self.room).bitmap), incremental)
+        self.assertEqual(self.occupied_days(), [2, 3, 4, 20, 21, 22, 23, 24, 25])
+
+
+class RoomAvailabilityViewTest(TestCase):
+    """
+        Test case for the room availability JSON view.
+
+        Methods:
+        - setUp: Set up initial data for testing.
+        - test_availability_window: Test if the view splits the requested window into free and occupied days.
+        - test_availability_reads_one_bitmap: Test if the view answers from the bitmap without scanning reservations.
+        - test_availability_unknown_room: Test if the view returns 404 for a missing room.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='City', room_type='double', private_bathroom=True,
+                                            mini_kitchenette=True, price=400.00)
+        RoomReservation.objects.create(user=self.user, room=self.room, check_in_date=date(2024, 7, 2),
+                                       check_out_date=date(2024, 7, 3))
+        self.url = reverse('room_availability', args=[self.room.id])
+
+    def test_availability_window(self):
+        response = self.client.get(self.url, {'start': '2024-07-01', 'days': 5})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'room': self.room.id,
+            'start': '2024-07-01',
+            'end': '2024-07-05',
+            'occupied': ['2024-07-02', '2024-07-03'],
+            'free': ['2024-07-01', '2024-07-04', '2024-07-05'],
+        })
+
+    def test_availability_reads_one_bitmap(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()['free']), 365)
+
+    def test_availability_unknown_room(self):
+        response = self.client.get(reverse('room_availability', args=[self.room.id + 1]))
+
+        self.assertEqual(response.status_code, 404)
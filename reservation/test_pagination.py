@@ -0,0 +1,140 @@
+"""
+Module containing Django test cases for keyset pagination in the application.
+
+Classes:
+- KeysetPaginatorTest: Test case for the KeysetPaginator class.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from decimal import Decimal
+from django.test import TestCase, RequestFactory
+from reservation.models import DormRoom
+from reservation.pagination import KeysetPaginator
+
+
+class KeysetPaginatorTest(TestCase):
+    """
+        Test case for the KeysetPaginator class.
+
+        Methods:
+        - setUpTestData: Create seven rooms.
+        - test_first_page: Test if the first page has a next cursor but no previous cursor.
+        - test_next_page: Test if the page after a cursor starts right after it.
+        - test_previous_page: Test if the page before a cursor ends right before it.
+        - test_descending_key: Test if a descending key pages from the newest object.
+        - test_paginate_request: Test if cursors and page size are read from the query string.
+        - test_composite_key: Test if a composite key pages by its values, both ways, reading only the key columns.
+        - test_composite_key_orders_by_leading_field: Test if rows are ordered by the leading field first and pages
+          continue across equal leading values.
+        - test_paginate_rows: Test if a list of key rows in key order is paged by bisection.
+        - test_composite_cursor_in_query_string: Test if composite cursors are read from and written to the query
+          string, and invalid ones are ignored.
+        - test_apaginate_request: Test if the async ORM variant returns the same pages and links.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        DormRoom.objects.bulk_create(
+            DormRoom(city='City', room_type='single', private_bathroom=True, mini_kitchenette=True, price=500.00)
+            for _ in range(7)
+        )
+        cls.ids = list(DormRoom.objects.order_by('id').values_list('id', flat=True))
+        cls.cheap_price = Decimal('500.00')
+
+    def test_first_page(self):
+        page = KeysetPaginator(page_size=3).paginate(DormRoom.objects.all())
+
+        self.assertEqual([room.id for room in page], self.ids[:3])
+        self.assertEqual(page.next_cursor, self.ids[2])
+        self.assertFalse(page.has_previous())
+
+    def test_next_page(self):
+        page = KeysetPaginator(page_size=3).paginate(DormRoom.objects.all(), after=self.ids[5])
+
+        self.assertEqual([room.id for room in page], self.ids[6:])
+        self.assertFalse(page.has_next())
+        self.assertEqual(page.previous_cursor, self.ids[6])
+
+    def test_previous_page(self):
+        page = KeysetPaginator(page_size=3).paginate(DormRoom.objects.all(), before=self.ids[3])
+
+        self.assertEqual([room.id for room in page], self.ids[:3])
+        self.assertFalse(page.has_previous())
+        self.assertEqual(page.next_cursor, self.ids[2])
+
+    def test_descending_key(self):
+        paginator = KeysetPaginator(page_size=3, key='-id')
+        first_page = paginator.paginate(DormRoom.objects.all())
+        second_page = paginator.paginate(DormRoom.objects.all(), after=first_page.next_cursor)
+
+        self.assertEqual([room.id for room in first_page], self.ids[:-4:-1])
+        self.assertEqual([room.id for room in second_page], self.ids[-4:-7:-1])
+
+    def test_paginate_request(self):
+        request = RequestFactory().get('/rooms', {'after': self.ids[1], 'page_size': 2, 'city': 'City'})
+
+        with self.assertNumQueries(1):
+            page = KeysetPaginator().paginate_request(DormRoom.objects.all(), request)
+
+        self.assertEqual([room.id for room in page], self.ids[2:4])
+        self.assertIn(f'after={self.ids[3]}', page.next_query)
+        self.assertIn(f'before={self.ids[2]}', page.previous_query)
+        self.assertIn('city=City', page.next_query)
+
+    def test_composite_key(self):
+        paginator = KeysetPaginator(page_size=3, key=('-price', '-id'))
+        first_page = paginator.paginate_keys(DormRoom.objects.all())
+        second_page = paginator.paginate_keys(DormRoom.objects.all(), after=first_page.next_cursor)
+        previous_page = paginator.paginate_keys(DormRoom.objects.all(), before=second_page.previous_cursor)
+
+        self.assertEqual(first_page.object_list, self.ids[:-4:-1])
+        self.assertEqual(first_page.next_cursor, (self.cheap_price, self.ids[4]))
+        self.assertEqual(second_page.object_list, self.ids[-4:-7:-1])
+        self.assertEqual(previous_page.object_list, first_page.object_list)
+        self.assertFalse(previous_page.has_previous())
+
+    def test_composite_key_orders_by_leading_field(self):
+        DormRoom.objects.filter(id__in=self.ids[:2]).update(price=900)
+        paginator = KeysetPaginator(page_size=4, key=('price', 'id'))
+
+        first_page = paginator.paginate(DormRoom.objects.all())
+        last_page = paginator.paginate(DormRoom.objects.all(), after=first_page.next_cursor)
+
+        self.assertEqual([room.id for room in first_page], self.ids[2:6])
+        self.assertEqual([room.id for room in last_page], [self.ids[6]] + self.ids[:2])
+
+    def test_paginate_rows(self):
+        rows = [(self.cheap_price, room_id) for room_id in self.ids[::-1]]
+        paginator = KeysetPaginator(page_size=3, key=('-price', '-id'))
+
+        second_page = paginator.paginate_rows(rows, after=rows[2])
+        first_page = paginator.paginate_rows(rows, before=second_page.previous_cursor)
+
+        self.assertEqual(second_page.object_list, self.ids[-4:-7:-1])
+        self.assertEqual(second_page.next_cursor, rows[5])
+        self.assertEqual(first_page.object_list, self.ids[:-4:-1])
+        self.assertFalse(first_page.has_previous())
+
+    def test_composite_cursor_in_query_string(self):
+        request = RequestFactory().get('/search', {'after': f'{self.cheap_price},{self.ids[1]}', 'page_size': 2})
+        paginator = KeysetPaginator(key=('price', 'id'))
+
+        page = paginator.paginate_request(DormRoom.objects.all(), request)
+        invalid = paginator.read_request(RequestFactory().get('/search', {'after': 'cheap,1'}), DormRoom)
+
+        self.assertEqual([room.id for room in page], self.ids[2:4])
+        self.assertIn(f'after=500.00%2C{self.ids[3]}', page.next_query)
+        self.assertIsNone(invalid[1])
+
+    async def test_apaginate_request(self):
+        request = RequestFactory().get('/rooms', {'before': self.ids[4], 'page_size': 2})
+
+        page = await KeysetPaginator().apaginate_request(DormRoom.objects.all(), request)
+        ids_page = await KeysetPaginator().apaginate_request(DormRoom.objects.all(), request, ids=self.ids)
+
+        for result in (page, ids_page):
+            self.assertEqual([room.id for room in result], self.ids[2:4])
+            self.assertIn(f'after={self.ids[3]}', result.next_query)
+            self.assertIn(f'before={self.ids[2]}', result.previous_query)
@@ -0,0 +1,260 @@
+"""
+Module containing Django test cases for routing reads to the read replicas.
+
+Classes:
+- ReadReplicaRouterTest: Test case for choosing the database of each read.
+- ReplicaHealthTest: Test case for skipping the replicas that refuse connections.
+- PrimaryPinMiddlewareTest: Test case for running the middleware in sync and async middleware chains.
+- ReplicaRoutingTest: Test case for the reads of requests, with a second connection standing in for a replica.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from datetime import timedelta
+from unittest import mock
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.test.client import AsyncClientHandler
+from django.urls import reverse
+from django.utils import timezone
+from reservation.models import DormRoom, RoomReservation
+from reservation.middleware import PrimaryPinMiddleware
+from reservation.routers import ReadReplicaRouter, replica_health, use_primary, use_replica
+
+
+@override_settings(DATABASE_REPLICAS=['replica1', 'replica2'])
+class ReadReplicaRouterTest(SimpleTestCase):
+    """
+        Test case for choosing the database of each read.
+
+        Methods:
+        - setUp: Create a router with every replica available.
+        - test_round_robin: Test if the reads of each request go to one replica, the replicas taking turns.
+        - test_replica_down_during_request: Test if a request moves to another replica when its replica fails.
+        - test_writes_and_other_apps: Test if writes and the models of other apps use the primary.
+        - test_pinned: Test if reads inside use_primary() go to the primary.
+        - test_transaction: Test if reads inside a transaction go to the primary.
+        - test_failover: Test if unavailable replicas are skipped, down to the primary.
+        - test_no_replicas: Test if the router leaves every read to the primary without replicas.
+        - test_migrate: Test if migrations only run on the primary.
+        """
+
+    def setUp(self):
+        self.router = ReadReplicaRouter()
+        available = mock.patch.object(replica_health, 'available', return_value=True)
+        self.available = available.start()
+        self.addCleanup(available.stop)
+
+    def test_round_robin(self):
+        requests = []
+        for _ in range(3):
+            with use_replica():
+                requests.append([self.router.db_for_read(model) for model in (DormRoom, RoomReservation, DormRoom)])
+
+        self.assertEqual(requests, [['replica1'] * 3, ['replica2'] * 3, ['replica1'] * 3])
+
+    def test_replica_down_during_request(self):
+        with use_replica():
+            self.assertEqual(self.router.db_for_read(DormRoom), 'replica1')
+            self.available.side_effect = lambda alias: alias != 'replica1'
+
+            self.assertEqual([self.router.db_for_read(DormRoom) for _ in range(2)], ['replica2'] * 2)
+
+    def test_writes_and_other_apps(self):
+        self.assertEqual(self.router.db_for_write(DormRoom), DEFAULT_DB_ALIAS)
+        self.assertIsNone(self.router.db_for_read(User))
+        self.assertIsNone(self.router.db_for_read(Session))
+
+    def test_pinned(self):
+        with use_primary():
+            self.assertEqual(self.router.db_for_read(RoomReservation), DEFAULT_DB_ALIAS)
+
+        self.assertEqual(self.router.db_for_read(RoomReservation), 'replica1')
+
+    def test_transaction(self):
+        with mock.patch.object(connections[DEFAULT_DB_ALIAS], 'in_atomic_block', True):
+            self.assertEqual(self.router.db_for_read(DormRoom), DEFAULT_DB_ALIAS)
+
+    def test_failover(self):
+        self.available.side_effect = lambda alias: alias != 'replica1'
+        self.assertEqual([self.router.db_for_read(DormRoom) for _ in range(3)], ['replica2'] * 3)
+
+        self.available.side_effect = None
+        self.available.return_value = False
+        self.assertEqual(self.router.db_for_read(DormRoom), DEFAULT_DB_ALIAS)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas(self):
+        self.assertIsNone(self.router.db_for_read(DormRoom))
+        self.available.assert_not_called()
+
+    def test_migrate(self):
+        self.assertTrue(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'reservation'))
+        self.assertFalse(self.router.allow_migrate('replica2', 'reservation'))
+
+
+@override_settings(REPLICA_RETRY_SECONDS=30)
+class ReplicaHealthTest(SimpleTestCase):
+    """
+        Test case for skipping the replicas that refuse connections.
+
+        Methods:
+        - setUp: Replace the connections with one that cannot connect.
+        - test_refused: Test if a refused replica is skipped without connecting again.
+        - test_retry: Test if a refused replica is tried again after REPLICA_RETRY_SECONDS.
+        """
+
+    def setUp(self):
+        self.connection = mock.Mock()
+        self.connection.ensure_connection.side_effect = OperationalError('connection refused')
+        patcher = mock.patch('reservation.routers.connections', {'replica1': self.connection})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        replica_health.reset()
+        self.addCleanup(replica_health.reset)
+
+    def test_refused(self):
+        with self.assertLogs('reservation.replicas', 'WARNING'):
+            self.assertFalse(replica_health.available('replica1'))
+        self.assertFalse(replica_health.available('replica1'))
+
+        self.assertEqual(self.connection.ensure_connection.call_count, 1)
+
+    def test_retry(self):
+        with self.assertLogs('reservation.replicas', 'WARNING'):
+            replica_health.available('replica1')
+        self.connection.ensure_connection.side_effect = None
+
+        with mock.patch('reservation.routers.time.monotonic', return_value=replica_health.down_until['replica1']):
+            self.assertTrue(replica_health.available('replica1'))
+        self.assertTrue(replica_health.available('replica1'))
+
+
+class PrimaryPinMiddlewareTest(SimpleTestCase):
+    """
+        Test case for running the middleware in sync and async middleware chains.
+
+        Methods:
+        - test_async_capable: Test if the middleware is a coroutine function in an async middleware chain.
+        - test_async_chain_not_adapted: Test if no middleware of the project needs adapting in an async chain.
+        """
+
+    def test_async_capable(self):
+        async def get_response(request):
+            return HttpResponse()
+
+        self.assertTrue(iscoroutinefunction(PrimaryPinMiddleware(get_response)))
+        self.assertFalse(iscoroutinefunction(PrimaryPinMiddleware(lambda request: HttpResponse())))
+
+    @override_settings(DEBUG=True)
+    def test_async_chain_not_adapted(self):
+        # Django only logs the adapted handlers in DEBUG mode.
+        with self.assertNoLogs('django.request', 'DEBUG'):
+            AsyncClientHandler().load_middleware(is_async=True)
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTest(TransactionTestCase):
+    """
+        Test case for the reads of requests, with a second connection standing in for a replica.
+
+        The 'replica' alias is a second connection to the test database, so it holds the same rows and the
+        queries it runs can be counted apart from those of the primary. It is added after the test database is set
+        up, so the test runner neither creates nor checks it.
+
+        Methods:
+        - setUpClass: Add the replica connection.
+        - tearDownClass: Close and remove the replica connection.
+        - setUp: Create a user with a room and log in.
+        - queries: Count the queries run on each database during a request.
+        - test_reads_from_replica: Test if the read-only pages read the rooms from the replica.
+        - test_async_reads_from_replica: Test if the async views read from the replica through the async chain.
+        - test_read_your_writes: Test if the pages read from the primary for a while after a booking.
+        - test_unavailable_replica: Test if the pages read from the primary when the replica refuses connections.
+        - test_anonymous_pages_not_varied: Test if pages without a session cookie do not vary by cookie.
+        """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        default = connections[DEFAULT_DB_ALIAS].settings_dict
+        connections.settings['replica'] = {**default, 'TEST': {**default['TEST'], 'MIRROR': DEFAULT_DB_ALIAS}}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+
+    def setUp(self):
+        replica_health.reset()
+        self.addCleanup(replica_health.reset)
+        self.room = DormRoom.objects.create(city='Kraków', room_type='single', mini_kitchenette=False,
+                                            private_bathroom=False, price=300)
+        self.user = User.objects.create_user(username='reader', password='password')
+        self.client.force_login(self.user)
+
+    def queries(self, method, url, data=None, client=None):
+        counts = {DEFAULT_DB_ALIAS: 0, 'replica': 0}
+
+        def counter(alias):
+            def count(execute, sql, params, many, context):
+                counts[alias] += 1
+                return execute(sql, params, many, context)
+            return count
+
+        with connections[DEFAULT_DB_ALIAS].execute_wrapper(counter(DEFAULT_DB_ALIAS)), \
+                connections['replica'].execute_wrapper(counter('replica')):
+            if client is None:
+                response = getattr(self.client, method)(url, data)
+            else:
+                async def request():
+                    return await getattr(client, method)(url, data)
+
+                response = async_to_sync(request)()
+        self.assertLess(response.status_code, 400)
+        return counts
+
+    def test_reads_from_replica(self):
+        for url in [reverse('rooms'), reverse('search') + '?city=Kraków', reverse('myreservation')]:
+            self.assertGreater(self.queries('get', url)['replica'], 0, url)
+
+    @override_settings(ROOT_URLCONF='reservation.test_async_views')
+    def test_async_reads_from_replica(self):
+        for url in ['/rooms', '/search?city=Kraków']:
+            counts = self.queries('get', url, client=self.async_client)
+            self.assertGreater(counts['replica'], 0, url)
+
+    def test_read_your_writes(self):
+        check_in_date = timezone.now().date() + timedelta(days=10)
+        booking = {'room': self.room.id, 'check_in_date': check_in_date.isoformat(),
+                   'check_out_date': (check_in_date + timedelta(days=2)).isoformat(), 'number_of_people': 1}
+
+        self.queries('post', reverse('reservation', args=[self.room.id]), booking)
+
+        self.assertEqual(self.queries('get', reverse('myreservation'))['replica'], 0)
+        with override_settings(REPLICA_PIN_SECONDS=0):
+            self.client.post(reverse('reservation', args=[self.room.id]), {**booking, 'number_of_people': 9})
+        self.assertGreater(self.queries('get', reverse('myreservation'))['replica'], 0)
+
+    def test_unavailable_replica(self):
+        connections['replica'].close()
+        with mock.patch.object(connections['replica'], 'ensure_connection', side_effect=OperationalError), \
+                self.assertLogs('reservation.replicas', 'WARNING'):
+            counts = self.queries('get', reverse('rooms'))
+
+        self.assertEqual(counts['replica'], 0)
+        self.assertGreater(counts[DEFAULT_DB_ALIAS], 0)
+
+    def test_anonymous_pages_not_varied(self):
+        self.client.logout()
+
+        response = self.client.get(reverse('room_availability', args=[self.room.id]))
+
+        self.assertNotIn('Cookie', response.get('Vary', ''))
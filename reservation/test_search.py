@@ -0,0 +1,190 @@
+"""
+Module containing Django test cases for the room search and its result cache.
+
+Classes:
+- NormalizeFiltersTest: Test case for turning form input into normalized search filters.
+- SearchCacheTest: Test case for caching and invalidating search results.
+- SearchPriceAndSortTest: Test case for price ranges and result ordering.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from reservation.models import DormRoom, RoomReservation
+from reservation.search import normalize_filters, search_page, search_cache_stats, search_cache_accessed
+
+
+class NormalizeFiltersTest(TestCase):
+    """
+        Test case for turning form input into normalized search filters.
+
+        Methods:
+        - test_equal_forms_give_equal_filters: Test if differently spelled but equivalent forms normalize equally.
+        - test_invalid_values_are_ignored: Test if unknown choices and malformed values become None.
+        - test_legacy_price_is_upper_bound: Test if the old single price parameter becomes the maximum price.
+        """
+
+    def test_equal_forms_give_equal_filters(self):
+        first = normalize_filters({'keyword': ' Kraków ', 'room_type': 'Double', 'price': '400 PLN',
+                                   'mini_kitchenette': 'Yes', 'arrival_departure': '2024-07-01 to 2024-07-10'})
+        second = normalize_filters({'keyword': 'kraków', 'room_type': 'double', 'price': '400',
+                                    'mini_kitchenette': 'Yes', 'private_bathroom': '',
+                                    'arrival_departure': '2024-07-01 to 2024-07-10'})
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.max_price, Decimal('400'))
+        self.assertEqual((first.start_date, first.end_date), (date(2024, 7, 1), date(2024, 7, 10)))
+
+    def test_invalid_values_are_ignored(self):
+        filters = normalize_filters({'room_type': 'Quad', 'price': 'cheap', 'arrival_departure': 'soon',
+                                     'private_bathroom': 'Maybe', 'sort': 'rating'})
+
+        self.assertEqual(filters, normalize_filters({}))
+
+    def test_legacy_price_is_upper_bound(self):
+        filters = normalize_filters({'price': '500 PLN', 'sort': 'price'})
+
+        self.assertEqual(filters, normalize_filters({'max_price': '500', 'sort': 'price'}))
+        self.assertIsNone(filters.min_price)
+
+
+class SearchCacheTest(TestCase):
+    """
+        Test case for caching and invalidating search results.
+
+        Methods:
+        - setUp: Set up initial data for testing.
+        - test_repeated_search_is_cached: Test if a repeated search is answered without a query.
+        - test_room_write_invalidates: Test if saving a room invalidates cached results.
+        - test_reservation_write_invalidates_date_searches_only: Test if saving a reservation invalidates only
+          searches with dates.
+        - test_stats_hook: Test if lookups are counted and reported through the search_cache_accessed signal.
+        """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='City', room_type='single', private_bathroom=True,
+                                            mini_kitchenette=True, price=500.00)
+        self.filters = normalize_filters({'city': 'City'})
+        self.date_filters = normalize_filters({'city': 'City', 'arrival_departure': '2024-07-01 to 2024-07-10'})
+
+    def test_repeated_search_is_cached(self):
+        self.assertEqual(search_page(self.filters).object_list, [self.room.id])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(search_page(self.filters).object_list, [self.room.id])
+
+    def test_room_write_invalidates(self):
+        search_page(self.filters)
+        other_room = DormRoom.objects.create(city='City', room_type='double', private_bathroom=False,
+                                             mini_kitchenette=False, price=400.00)
+
+        self.assertEqual(search_page(self.filters).object_list, [self.room.id, other_room.id])
+
+    def test_reservation_write_invalidates_date_searches_only(self):
+        search_page(self.filters)
+        search_page(self.date_filters)
+        RoomReservation.objects.create(user=self.user, room=self.room, check_in_date=date(2024, 7, 5),
+                                       check_out_date=date(2024, 7, 6))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(search_page(self.filters).object_list, [self.room.id])
+        self.assertEqual(search_page(self.date_filters).object_list, [])
+
+    def test_stats_hook(self):
+        events = []
+
+        def listener(sender, hit, **kwargs):
+            events.append(hit)
+
+        search_cache_accessed.connect(listener)
+        self.addCleanup(search_cache_accessed.disconnect, listener)
+        before = search_cache_stats()
+
+        search_page(self.filters)
+        search_page(self.filters)
+        after = search_cache_stats()
+
+        self.assertEqual(events, [False, True])
+        self.assertEqual(after['hits'] - before['hits'], 1)
+        self.assertEqual(after['misses'] - before['misses'], 1)
+        self.assertGreater(after['hit_ratio'], 0)
+
+
+class SearchPriceAndSortTest(TestCase):
+    """
+        Test case for price ranges and result ordering.
+
+        Methods:
+        - setUpTestData: Create rooms with different prices, cities and types.
+        - test_price_range: Test if the price range is inclusive on both ends.
+        - test_guests: Test if only rooms with enough beds for the guests are returned.
+        - test_sort_orders: Test if each sort order returns the rooms in the expected order.
+        - test_sorted_results_are_cached_separately: Test if the same filters with another sort are not served the
+          cached order.
+        - test_sorted_pages: Test if sorted results are paged forwards and backwards with the sort column cursor.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.cheap = DormRoom.objects.create(city='Szczecin', room_type='triple', private_bathroom=False,
+                                            mini_kitchenette=False, price=300.00)
+        cls.middle = DormRoom.objects.create(city='Kraków', room_type='single', private_bathroom=True,
+                                             mini_kitchenette=True, price=500.00)
+        cls.expensive = DormRoom.objects.create(city='Warszawa', room_type='double', private_bathroom=True,
+                                                mini_kitchenette=True, price=700.00)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_price_range(self):
+        filters = normalize_filters({'min_price': '300 PLN', 'max_price': '500 PLN'})
+
+        self.assertEqual(search_page(filters).object_list, [self.cheap.id, self.middle.id])
+        self.assertEqual(search_page(normalize_filters({'min_price': '600'})).object_list,
+                         [self.expensive.id])
+
+    def test_guests(self):
+        self.assertEqual(search_page(normalize_filters({'guests': '2'})).object_list,
+                         [self.cheap.id, self.expensive.id])
+        self.assertEqual(search_page(normalize_filters({'guests': '3', 'sort': 'price'})).object_list,
+                         [self.cheap.id])
+
+    def test_sort_orders(self):
+        expected = {
+            'price': [self.cheap, self.middle, self.expensive],
+            '-price': [self.expensive, self.middle, self.cheap],
+            'city': [self.middle, self.cheap, self.expensive],
+            'capacity': [self.middle, self.expensive, self.cheap],
+        }
+
+        for sort, rooms in expected.items():
+            with self.subTest(sort=sort):
+                self.assertEqual(search_page(normalize_filters({'sort': sort})).object_list,
+                                 [room.id for room in rooms])
+
+    def test_sorted_results_are_cached_separately(self):
+        search_page(normalize_filters({}))
+
+        self.assertEqual(search_page(normalize_filters({'sort': '-price'})).object_list,
+                         [self.expensive.id, self.middle.id, self.cheap.id])
+
+    def test_sorted_pages(self):
+        for sort, rooms in (('-price', [self.expensive, self.middle, self.cheap]),
+                            ('city', [self.middle, self.cheap, self.expensive])):
+            with self.subTest(sort=sort):
+                filters = normalize_filters({'sort': sort})
+                first_page = search_page(filters, page_size=2)
+                last_page = search_page(filters, after=first_page.next_cursor, page_size=2)
+                previous_page = search_page(filters, before=last_page.previous_cursor, page_size=2)
+
+                self.assertEqual(first_page.object_list, [room.id for room in rooms[:2]])
+                self.assertEqual(last_page.object_list, [rooms[2].id])
+                self.assertFalse(last_page.has_next())
+                self.assertEqual(previous_page.object_list, first_page.object_list)
@@ -0,0 +1,141 @@
+"""
+Module containing Django test cases for the booking service of the application.
+
+Classes:
+- BookRoomTestCase: Test case for the book_room service.
+- BookRoomConcurrencyTestCase: Test case for parallel bookings of the same room.
+- CloseExpiredReservationsTestCase: Test case for closing ended stays in batches.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Barrier
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from reservation.models import DormRoom, RoomReservation
+from reservation.services import book_room, close_expired_reservations, BookingError, ROOM_TAKEN_MESSAGE, \
+    ROOM_TOO_SMALL_MESSAGE
+
+
+class BookRoomTestCase(TestCase):
+    """
+        Test case for the book_room service.
+
+        Methods:
+        - setUp(): Prepares data for testing.
+        - test_book_free_room(): Tests that a free room is booked.
+        - test_book_taken_room(): Tests that an overlapping open reservation rejects the booking.
+        - test_book_too_many_people(): Tests that a booking above the room capacity is rejected.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='double', mini_kitchenette=True,
+                                            private_bathroom=True, price=400.00)
+        self.today = timezone.now().date()
+
+    def make_reservation(self, number_of_people=1):
+        return RoomReservation(user=self.user, room=self.room, check_in_date=self.today,
+                               check_out_date=self.today + timedelta(days=3), number_of_people=number_of_people)
+
+    def test_book_free_room(self):
+        reservation = book_room(self.make_reservation())
+
+        self.assertIsNotNone(reservation.pk)
+
+    def test_book_taken_room(self):
+        book_room(self.make_reservation())
+
+        with self.assertRaisesMessage(BookingError, ROOM_TAKEN_MESSAGE):
+            book_room(self.make_reservation())
+        self.assertEqual(RoomReservation.objects.count(), 1)
+
+    def test_book_too_many_people(self):
+        with self.assertRaisesMessage(BookingError, ROOM_TOO_SMALL_MESSAGE):
+            book_room(self.make_reservation(number_of_people=3))
+        self.assertFalse(RoomReservation.objects.exists())
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class BookRoomConcurrencyTestCase(TransactionTestCase):
+    """
+        Test case for parallel bookings of the same room.
+
+        Methods:
+        - setUp(): Prepares data for testing.
+        - test_parallel_bookings(): Tests that exactly one of many simultaneous bookings succeeds.
+        """
+
+    workers = 16
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='single', mini_kitchenette=True,
+                                            private_bathroom=True, price=500.00)
+        self.today = timezone.now().date()
+
+    def test_parallel_bookings(self):
+        barrier = Barrier(self.workers)
+
+        def attempt(offset):
+            reservation = RoomReservation(user=self.user, room=self.room,
+                                          check_in_date=self.today + timedelta(days=offset % 3),
+                                          check_out_date=self.today + timedelta(days=5))
+            try:
+                barrier.wait()
+                book_room(reservation)
+                return True
+            except BookingError:
+                return False
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(attempt, range(self.workers)))
+
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(RoomReservation.objects.filter(room=self.room).count(), 1)
+
+
+class CloseExpiredReservationsTestCase(TestCase):
+    """
+        Test case for closing ended stays in batches.
+
+        Methods:
+        - setUp(): Creates five ended and two current open reservations.
+        - test_closes_in_batches(): Tests that ended stays are closed batch by batch and current stays are kept.
+        - test_resumes_after_interruption(): Tests that a run stopped after one batch is finished by the next run.
+        """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpassword')
+        self.room = DormRoom.objects.create(city='TestCity', room_type='double', mini_kitchenette=True,
+                                            private_bathroom=True, price=400.00)
+        self.today = timezone.now().date()
+        RoomReservation.objects.bulk_create(
+            RoomReservation(user=self.user, room=self.room, check_in_date=self.today + timedelta(days=offset - 8),
+                            check_out_date=self.today + timedelta(days=offset - 5))
+            for offset in range(7)
+        )
+
+    def test_closes_in_batches(self):
+        with CaptureQueriesContext(connection) as queries:
+            batches = list(close_expired_reservations(batch_size=2))
+
+        self.assertEqual(batches, [2, 2, 1])
+        self.assertEqual([query['sql'].split()[0] for query in queries if 'SAVEPOINT' not in query['sql']],
+                         ['UPDATE'] * 4)
+        self.assertEqual(RoomReservation.objects.filter(is_open=True).count(), 2)
+        self.assertFalse(RoomReservation.objects.filter(is_open=True, check_out_date__lt=self.today).exists())
+
+    def test_resumes_after_interruption(self):
+        next(close_expired_reservations(batch_size=3))
+
+        self.assertEqual(sum(close_expired_reservations(batch_size=3)), 2)
+        self.assertEqual(RoomReservation.objects.filter(is_open=False).count(), 5)
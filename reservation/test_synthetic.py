@@ -0,0 +1,127 @@
+"""
+Module containing Django test cases for the synthetic data generator.
+
+Classes:
+- GenerateStaysTest: Test case for the generated reservation histories.
+- GenerateTest: Test case for writing a synthetic data set to the database.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import random
+from collections import Counter, defaultdict
+from datetime import date
+from unittest import skipUnless
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from reservation.inventory import beds_free
+from reservation.models import DormRoom, RoomReservation
+from reservation.synthetic import generate, generate_stays
+
+
+class GenerateStaysTest(SimpleTestCase):
+    """
+        Test case for the generated reservation histories.
+
+        Methods:
+        - make_stays: Generate the stays of twenty rooms over two years.
+        - test_count_and_capacity: Test if every room gets its share and no stay exceeds the beds.
+        - test_stays_do_not_overlap: Test if the stays of a room never share a day.
+        - test_seasonal_peaks: Test if busy months get more stays than quiet ones.
+        - test_deterministic: Test if the same seed gives the same stays.
+        """
+
+    def make_stays(self, seed=0):
+        rooms = [(room_id, room_id % 3 + 1) for room_id in range(1, 21)]
+        return list(generate_stays(rooms, [1, 2, 3], 2005, date(2024, 1, 1), 730, date(2025, 1, 1),
+                                   random.Random(seed)))
+
+    def test_count_and_capacity(self):
+        stays = self.make_stays()
+
+        self.assertEqual(len(stays), 2005)
+        self.assertEqual(sorted(Counter(stay.room_id for stay in stays).values()), [100] * 15 + [101] * 5)
+        self.assertTrue(all(1 <= stay.number_of_people <= stay.room_id % 3 + 1 for stay in stays))
+        self.assertTrue(all(stay.is_open == (stay.check_out_date >= date(2025, 1, 1)) for stay in stays))
+
+    def test_stays_do_not_overlap(self):
+        by_room = defaultdict(list)
+        for stay in self.make_stays():
+            by_room[stay.room_id].append((stay.check_in_date, stay.check_out_date))
+
+        for stays in by_room.values():
+            for (_, check_out_date), (check_in_date, _) in zip(stays, stays[1:]):
+                self.assertGreater(check_in_date, check_out_date)
+
+    def test_seasonal_peaks(self):
+        months = Counter(stay.check_in_date.month for stay in self.make_stays())
+
+        self.assertGreater(months[9], months[12] * 1.5)
+
+    def test_deterministic(self):
+        fields = lambda stays: [(stay.room_id, stay.user_id, stay.check_in_date, stay.check_out_date,
+                                 stay.number_of_people) for stay in stays]
+
+        self.assertEqual(fields(self.make_stays(seed=7)), fields(self.make_stays(seed=7)))
+        self.assertNotEqual(fields(self.make_stays(seed=7)), fields(self.make_stays(seed=8)))
+
+
+class GenerateTest(TestCase):
+    """
+        Test case for writing a synthetic data set to the database.
+
+        Methods:
+        - rows: Return the generated rooms and reservations without their IDs.
+        - test_generate: Test if the rooms, users and reservations are written and users are reused.
+        - test_reproducible: Test if generating again on an empty database gives the same rows.
+        - test_copy: Test if reservations written with COPY equal those written with bulk_create.
+        - test_rebuilds_inventory: Test if the open stays take their beds in the inventory.
+        """
+
+    def rows(self):
+        rooms = list(DormRoom.objects.order_by('id').values_list('city', 'street', 'room_type', 'price', 'beds'))
+        reservations = list(RoomReservation.objects.order_by('id').values_list(
+            'user__username', 'room__street', 'check_in_date', 'check_out_date', 'number_of_people', 'is_open'))
+        return rooms, reservations
+
+    def test_generate(self):
+        result = generate(30, 5, 300, cities=['Kraków'], room_types=['double'], batch_size=64)
+
+        self.assertEqual(tuple(result), (30, 5, 300))
+        self.assertEqual(set(DormRoom.objects.values_list('city', 'room_type', 'beds')), {('Kraków', 'double', 2)})
+        self.assertEqual(User.objects.filter(username__startswith='synthetic').count(), 5)
+        self.assertEqual(generate(1, 5, 10).users, 0)
+
+    def test_reproducible(self):
+        generate(20, 4, 200, seed=3)
+        first = self.rows()
+        RoomReservation.objects.all().delete()
+        DormRoom.objects.all().delete()
+
+        generate(20, 4, 200, seed=3)
+
+        self.assertEqual(self.rows(), first)
+
+    @skipUnless(connection.vendor == 'postgresql', 'COPY needs PostgreSQL')
+    def test_copy(self):
+        generate(20, 4, 200, seed=3)
+        expected = self.rows()
+        RoomReservation.objects.all().delete()
+        DormRoom.objects.all().delete()
+
+        generate(20, 4, 200, seed=3, use_copy=True, batch_size=50)
+
+        self.assertEqual(self.rows(), expected)
+
+    @override_settings(BOOKING_INVENTORY=True)
+    def test_rebuilds_inventory(self):
+        generate(5, 2, 50, start=timezone.now().date(), days=60)
+
+        stays = RoomReservation.objects.filter(is_open=True).select_related('room')
+        self.assertTrue(stays.exists())
+        for stay in stays:
+            self.assertEqual(beds_free(stay.room, stay.check_in_date, stay.check_out_date),
+                             stay.room.beds - stay.number_of_people)
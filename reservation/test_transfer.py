@@ -0,0 +1,210 @@
+"""
+Module containing Django test cases for the bulk import and export of reservations.
+
+Classes:
+- StaySetTest: Test case for the overlap checks of the StaySet class.
+- ImportReservationsTest: Test case for validating and inserting reservations in chunks.
+- ExportReservationsTest: Test case for streaming reservations to CSV and JSON Lines.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import io
+import json
+from datetime import date
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from reservation.inventory import beds_free
+from reservation.models import DormRoom, RoomReservation
+from reservation.occupancy import room_calendar
+from reservation.search import normalize_filters, search_page
+from reservation.transfer import StaySet, read_rows, import_reservations, export_reservations
+
+TODAY = date(2024, 6, 1)
+
+
+class StaySetTest(SimpleTestCase):
+    """
+        Test case for the overlap checks of the StaySet class.
+
+        Methods:
+        - test_overlaps: Test if stays sharing at least one day overlap and adjacent stays do not.
+        """
+
+    def test_overlaps(self):
+        stays = StaySet([(date(2024, 7, 10), date(2024, 7, 20)), (date(2024, 7, 1), date(2024, 7, 5))])
+
+        self.assertTrue(stays.overlaps(date(2024, 7, 5), date(2024, 7, 6)))
+        self.assertTrue(stays.overlaps(date(2024, 6, 1), date(2024, 8, 1)))
+        self.assertTrue(stays.overlaps(date(2024, 7, 12), date(2024, 7, 13)))
+        self.assertFalse(stays.overlaps(date(2024, 7, 6), date(2024, 7, 9)))
+        self.assertFalse(stays.overlaps(date(2024, 6, 1), date(2024, 6, 30)))
+        self.assertFalse(stays.overlaps(date(2024, 7, 21), date(2024, 7, 30)))
+
+
+class ImportReservationsTest(TestCase):
+    """
+        Test case for validating and inserting reservations in chunks.
+
+        Methods:
+        - setUpTestData: Create a user, a single room and a double room with one open reservation.
+        - rows(*records): Return the records as numbered import rows.
+        - record(room, check_in_date, check_out_date, number_of_people, username): Return one import record.
+        - test_imports_valid_rows: Test if valid rows are inserted and open stays are marked in the calendar.
+        - test_rejects_invalid_rows: Test if invalid rows are reported by line and the others are still imported.
+        - test_rejects_non_scalar_values: Test if JSON lists and objects in a row reject the row, not the import.
+        - test_overlaps_across_chunks: Test if a row overlapping a row of an earlier chunk is rejected.
+        - test_failure_keeps_committed_chunks_consistent: Test if the chunks committed before a failure are in
+          the calendar and the search results.
+        - test_queries_per_chunk: Test if the query count depends on the number of chunks, not of rows.
+        - test_rebuilds_inventory: Test if imported open stays take their beds in the inventory.
+        - test_read_rows: Test if CSV and JSON Lines streams yield numbered rows.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='student', password='testpassword')
+        cls.single = DormRoom.objects.create(city='City', room_type='single', private_bathroom=True,
+                                             mini_kitchenette=True, price=500.00)
+        cls.double = DormRoom.objects.create(city='City', room_type='double', private_bathroom=True,
+                                             mini_kitchenette=True, price=400.00)
+        RoomReservation.objects.create(user=cls.user, room=cls.double, check_in_date=date(2024, 7, 1),
+                                       check_out_date=date(2024, 7, 10))
+
+    def rows(self, *records):
+        return [(number, record) for number, record in enumerate(records, start=1)]
+
+    def record(self, room, check_in_date, check_out_date, number_of_people=1, username='student'):
+        return {'username': username, 'room_id': str(room.id), 'check_in_date': check_in_date,
+                'check_out_date': check_out_date, 'number_of_people': str(number_of_people)}
+
+    def test_imports_valid_rows(self):
+        result = import_reservations(self.rows(
+            self.record(self.single, '2024-07-01', '2024-07-03'),
+            self.record(self.double, '2024-07-11', '2024-07-12', number_of_people=2),
+            self.record(self.single, '2024-05-01', '2024-05-03'),
+        ), today=TODAY)
+
+        self.assertEqual(result, (3, []))
+        self.assertEqual(RoomReservation.objects.filter(is_open=False).count(), 1)
+        self.assertEqual(room_calendar(self.single.id, date(2024, 6, 30), 5), [False, True, True, True, False])
+
+    def test_rejects_invalid_rows(self):
+        result = import_reservations(self.rows(
+            self.record(self.double, '2024-07-05', '2024-07-06'),
+            self.record(self.single, '2024-08-01', '2024-08-02', number_of_people=2),
+            self.record(self.single, '2024-08-05', '2024-08-02'),
+            self.record(self.single, '2024-08-01', '2024-08-02', username='nobody'),
+            {'username': 'student', 'room_id': 'x'},
+            self.record(self.single, '2024-08-01', '2024-08-02'),
+            self.record(self.single, '2024-08-02', '2024-08-04'),
+        ), today=TODAY)
+
+        self.assertEqual(result.imported, 1)
+        self.assertEqual([line for line, _ in result.rejected], [5, 1, 2, 3, 4, 7])
+        self.assertEqual(dict(result.rejected)[1], 'room already taken')
+
+    def test_rejects_non_scalar_values(self):
+        result = import_reservations(self.rows(
+            {**self.record(self.single, '2024-08-01', '2024-08-02'), 'room_id': [self.single.id]},
+            {**self.record(self.single, '2024-08-01', '2024-08-02'), 'number_of_people': {}},
+            self.record(self.single, '2024-08-01', '2024-08-02'),
+        ), today=TODAY)
+
+        self.assertEqual(result.imported, 1)
+        self.assertEqual([line for line, _ in result.rejected], [1, 2])
+        self.assertTrue(all(reason.startswith('invalid value') for _, reason in result.rejected))
+
+    def test_overlaps_across_chunks(self):
+        result = import_reservations(self.rows(
+            self.record(self.single, '2024-07-01', '2024-07-03'),
+            self.record(self.single, '2024-07-03', '2024-07-04'),
+        ), chunk_size=1, today=TODAY)
+
+        self.assertEqual(result.imported, 1)
+        self.assertEqual(result.rejected, [(2, 'room already taken')])
+
+    def test_failure_keeps_committed_chunks_consistent(self):
+        cache.clear()
+        filters = normalize_filters({'arrival_departure': '2024-07-01 to 2024-07-03'})
+        self.assertIn(self.single.id, search_page(filters).object_list)
+
+        def rows():
+            yield from self.rows(self.record(self.single, '2024-07-01', '2024-07-03'))
+            raise OSError('connection lost')
+
+        with self.assertRaises(OSError):
+            import_reservations(rows(), chunk_size=1, today=TODAY)
+
+        self.assertEqual(room_calendar(self.single.id, date(2024, 7, 1), 3), [True, True, True])
+        self.assertNotIn(self.single.id, search_page(filters).object_list)
+
+    def test_queries_per_chunk(self):
+        records = [self.record(self.single, f'2024-{month:02d}-01', f'2024-{month:02d}-02')
+                   for month in range(7, 13)]
+
+        # Users, locked rooms, open stays and one insert in a savepoint, then the occupancy rebuild of the room.
+        with self.assertNumQueries(14):
+            result = import_reservations(self.rows(*records), chunk_size=len(records), today=TODAY)
+
+        self.assertEqual(result.imported, len(records))
+
+    @override_settings(BOOKING_INVENTORY=True)
+    def test_rebuilds_inventory(self):
+        import_reservations(self.rows(
+            self.record(self.double, '2024-08-01', '2024-08-03', number_of_people=2),
+            self.record(self.single, '2024-08-02', '2024-08-02'),
+        ), today=TODAY)
+
+        self.assertEqual(beds_free(self.double, date(2024, 8, 3), date(2024, 8, 4)), 0)
+        self.assertEqual(beds_free(self.double, date(2024, 7, 1), date(2024, 7, 10)), 1)
+        self.assertEqual(beds_free(self.single, date(2024, 8, 1), date(2024, 8, 2)), 0)
+
+    def test_read_rows(self):
+        csv_rows = list(read_rows(io.StringIO('username,room_id\nstudent,1\nstudent,2\n'), 'csv'))
+        jsonl_rows = list(read_rows(io.StringIO('{"room_id": 1}\n\n[1]\n'), 'jsonl'))
+
+        self.assertEqual(csv_rows, [(2, {'username': 'student', 'room_id': '1'}),
+                                    (3, {'username': 'student', 'room_id': '2'})])
+        self.assertEqual(jsonl_rows, [(1, {'room_id': 1}), (3, None)])
+
+
+class ExportReservationsTest(TestCase):
+    """
+        Test case for streaming reservations to CSV and JSON Lines.
+
+        Methods:
+        - setUpTestData: Create a user, a room and two reservations.
+        - test_export_jsonl: Test if every reservation is written as one JSON object per line.
+        - test_round_trip: Test if an exported CSV file can be imported again.
+        """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='student', password='testpassword')
+        cls.room = DormRoom.objects.create(city='City', room_type='single', private_bathroom=True,
+                                           mini_kitchenette=True, price=500.00)
+        for month in (7, 8):
+            RoomReservation.objects.create(user=cls.user, room=cls.room, check_in_date=date(2024, month, 1),
+                                           check_out_date=date(2024, month, 5))
+
+    def test_export_jsonl(self):
+        stream = io.StringIO()
+
+        self.assertEqual(export_reservations(stream, 'jsonl', chunk_size=1), 2)
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([record['check_in_date'] for record in records], ['2024-07-01', '2024-08-01'])
+        self.assertEqual(records[0]['username'], 'student')
+
+    def test_round_trip(self):
+        stream = io.StringIO()
+        export_reservations(stream, 'csv')
+        RoomReservation.objects.all().delete()
+
+        stream.seek(0)
+        result = import_reservations(read_rows(stream, 'csv'), today=TODAY)
+
+        self.assertEqual(result, (2, []))
+        self.assertEqual(RoomReservation.objects.filter(room=self.room, is_open=True).count(), 2)
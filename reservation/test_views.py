@@ -17,6 +17,8 @@ Creation Date: [21.11.2023]
 """
 
 from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase, Client
 from django.utils import timezone
 from django.template import TemplateDoesNotExist
@@ -36,6 +38,8 @@ class IndexViewTests(TestCase):
     - setUp: Set up initial data for testing.
     - test_index_view_uses_correct_template: Test if the index view uses the correct template.
     - test_index_view_returns_five_random_rooms: Test if the index view returns five random rooms.
+    - test_index_view_with_few_rooms: Test if the index view shows every room when there are fewer than five.
+    - test_index_view_does_not_seed_rooms: Test if the index view leaves an empty catalog empty.
     """
 
     def setUp(self):
@@ -79,6 +83,21 @@ class IndexViewTests(TestCase):
         for room in room_data:
             self.assertIsInstance(room, DormRoom)
 
+    def test_index_view_with_few_rooms(self):
+        DormRoom.objects.filter(image_name__in=['room-1.jpg', 'room-2.jpg', 'room-3.jpg']).delete()
+
+        response = self.client.get(reverse('index'))
+
+        self.assertEqual(len(response.context['room_data']), 3)
+
+    def test_index_view_does_not_seed_rooms(self):
+        DormRoom.objects.all().delete()
+
+        response = self.client.get(reverse('index'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(DormRoom.objects.exists())
+
 
 class AboutViewTests(TestCase):
     """
@@ -154,13 +173,17 @@ class MyReservationViewTests(TestCase):
         - setUp: Set up initial data for testing.
         - test_authenticated_user_view: Test if the myreservation view displays reservations for authenticated users.
         - test_unauthenticated_user_redirect: Test if unauthenticated users are redirected to the login page.
+        - test_query_count_does_not_grow_with_reservations: Test if rooms are fetched together with the reservations.
+        - test_open_reservations_paginated: Test if open reservations are paged by check-in date with their own
+          cursors.
         - tearDown: Clean up data after testing.
         """
 
     def setUp(self):
         self.user = User.objects.create_user(username='testuser', password='testpassword')
         self.today = timezone.now().date()
-        self.room_id = 1
+        self.room_id = DormRoom.objects.create(city='City', room_type='single', private_bathroom=True,
+                                               mini_kitchenette=True, price=500.00).id
         check_in_date = self.today - timedelta(days=2)
         check_out_date_open = self.today + timedelta(days=5)
         check_out_date_closed = self.today - timedelta(days=1)
@@ -176,7 +199,8 @@ class MyReservationViewTests(TestCase):
             user=self.user,
             room_id=self.room_id,
             check_in_date=check_in_date,
-            check_out_date=check_out_date_closed
+            check_out_date=check_out_date_closed,
+            is_open=False
         )
 
         self.client = Client()
@@ -199,6 +223,43 @@ class MyReservationViewTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertRedirects(response, reverse('login'))
 
+    def test_query_count_does_not_grow_with_reservations(self):
+        room = DormRoom.objects.create(city='City', room_type='single', private_bathroom=True,
+                                       mini_kitchenette=True, price=500.00)
+        self.client.force_login(self.user)
+        url = reverse('myreservation')
+
+        with self.assertNumQueries(4):
+            self.client.get(url)
+
+        RoomReservation.objects.bulk_create(
+            RoomReservation(user=self.user, room=room, check_in_date=self.today - timedelta(days=offset + 2),
+                            check_out_date=self.today + timedelta(days=(-1) ** offset * offset),
+                            is_open=offset % 2 == 0)
+            for offset in range(200)
+        )
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context['closed_reservations']), settings.PAGE_SIZE)
+        self.assertTrue(response.context['page'].has_next())
+        self.assertEqual(len(response.context['open_reservations']), settings.PAGE_SIZE)
+        self.assertTrue(response.context['open_page'].has_next())
+
+    def test_open_reservations_paginated(self):
+        later = RoomReservation.objects.create(user=self.user, room_id=self.room_id, check_in_date=self.today,
+                                               check_out_date=self.today + timedelta(days=3))
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('myreservation'), {'open_page_size': 1})
+        next_response = self.client.get(reverse('myreservation') + '?' + response.context['open_page'].next_query)
+
+        self.assertEqual(response.context['open_reservations'], [self.open_reservation])
+        self.assertContains(response, 'aria-label="Next"', count=1)
+        self.assertEqual(next_response.context['open_reservations'], [later])
+        self.assertFalse(next_response.context['open_page'].has_next())
+        self.assertEqual(next_response.context['closed_reservations'], [self.closed_reservation])
+
     def tearDown(self):
         self.user.delete()
         self.open_reservation.delete()
@@ -401,9 +462,19 @@ class SearchViewTest(TestCase):
         - test_search_view_post: Test if searching by keyword returns results (POST).
         - test_search_view_post_no_results: Test if searching with no results returns an empty list (POST).
         - test_search_view_post_with_filters: Test if searching with filters returns results (POST).
+        - test_search_view_post_dates_excludes_taken_rooms: Test if rooms booked for the dates are left out (POST).
+        - test_search_view_post_dates_query_count: Test if the date search query count does not grow with rooms.
+        - test_search_view_next_page_keeps_filters: Test if the link to the next result page keeps the filters.
+        - test_search_view_post_redirects_to_get: Test if a submitted search form is redirected to the GET URL.
+        - test_search_view_not_modified: Test if a repeated search with a matching ETag gets 304 Not Modified.
+        - test_search_view_etag_changes_with_availability: Test if a new reservation changes the ETag of a date search.
+        - test_search_view_deleted_room: Test if deleting a room changes the result even for If-Modified-Since.
+        - test_search_view_navbar_follows_login: Test if the navbar, the ETag and Vary: Cookie follow the login.
+        - test_search_view_price_range_sorted_pages: Test if a price range sorted by price pages in price order.
         """
 
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(username='testuser', password='testpassword')
 
         self.room = DormRoom.objects.create(id=1, city='City', room_type='single', private_bathroom=True,
@@ -415,14 +486,14 @@ class SearchViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
 
     def test_search_view_post(self):
-        response = self.client.post(reverse('search'), data={'keyword': 'City'})
+        response = self.client.post(reverse('search'), data={'keyword': 'City'}, follow=True)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn('room_data', response.context)
         self.assertIn(self.room, response.context['room_data'])
 
     def test_search_view_post_no_results(self):
-        response = self.client.post(reverse('search'), data={'keyword': 'NonExistentCity'})
+        response = self.client.post(reverse('search'), data={'keyword': 'NonExistentCity'}, follow=True)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn('room_data', response.context)
@@ -437,12 +508,116 @@ class SearchViewTest(TestCase):
             'mini_kitchenette': 'Yes',
             'private_bathroom': 'Yes',
             'price': '500 PLN',
-        })
+        }, follow=True)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn('room_data', response.context)
         self.assertIn(self.room, response.context['room_data'])
 
+    def test_search_view_post_dates_excludes_taken_rooms(self):
+        taken_room = DormRoom.objects.create(id=2, city='City', room_type='single', private_bathroom=True,
+                                             mini_kitchenette=True, price=500.00, image_name='room-2.jpg')
+        RoomReservation.objects.create(user=self.user, room=taken_room, check_in_date='2023-11-28',
+                                       check_out_date='2023-12-02')
+
+        response = self.client.post(reverse('search'), data={'arrival_departure': '2023-12-01 to 2023-12-05'}, follow=True)
+
+        self.assertIn(self.room, response.context['room_data'])
+        self.assertNotIn(taken_room, response.context['room_data'])
+
+    def test_search_view_post_dates_query_count(self):
+        data = {'arrival_departure': '2023-12-01 to 2023-12-05', 'city': 'City'}
+        with self.assertNumQueries(4):
+            self.client.get(reverse('search'), data=data)
+
+        DormRoom.objects.bulk_create(
+            DormRoom(city='City', room_type='single', private_bathroom=True, mini_kitchenette=True, price=500.00)
+            for _ in range(20)
+        )
+        cache.clear()
+        with self.assertNumQueries(4):
+            self.client.get(reverse('search'), data=data)
+
+
+    def test_search_view_next_page_keeps_filters(self):
+        DormRoom.objects.create(id=2, city='City', room_type='single', private_bathroom=True,
+                                mini_kitchenette=True, price=500.00, image_name='room-2.jpg')
+
+        response = self.client.post(reverse('search'), data={'city': 'City', 'page_size': 1}, follow=True)
+
+        self.assertEqual(response.context['room_data'], [self.room])
+        self.assertIn('city=City', response.context['page'].next_query)
+
+        response = self.client.get(reverse('search'), {'city': 'City', 'page_size': 1, 'after': self.room.id})
+
+        self.assertEqual([room.id for room in response.context['room_data']], [2])
+
+
+    def test_search_view_post_redirects_to_get(self):
+        response = self.client.post(reverse('search'), data={'keyword': 'City', 'city': '', 'room_type': 'Single'})
+
+        self.assertRedirects(response, reverse('search') + '?keyword=City&room_type=Single')
+
+    def test_search_view_not_modified(self):
+        response = self.client.get(reverse('search'), {'city': 'City'})
+
+        response = self.client.get(reverse('search'), {'city': 'City'}, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_search_view_etag_changes_with_availability(self):
+        data = {'arrival_departure': '2023-12-01 to 2023-12-05'}
+        etag = self.client.get(reverse('search'), data)['ETag']
+
+        RoomReservation.objects.create(user=self.user, room=self.room, check_in_date='2023-12-02',
+                                       check_out_date='2023-12-03')
+        response = self.client.get(reverse('search'), data, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(self.room, response.context['room_data'])
+
+    def test_search_view_deleted_room(self):
+        other = DormRoom.objects.create(city='City', room_type='double', mini_kitchenette=False,
+                                        private_bathroom=False, price=400.00)
+        response = self.client.get(reverse('search'), {'city': 'City'})
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        other.delete()
+        response = self.client.get(reverse('search'), {'city': 'City'}, HTTP_IF_NONE_MATCH=response['ETag'],
+                                   HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['room_data'], [self.room])
+
+    def test_search_view_navbar_follows_login(self):
+        anonymous = self.client.get(reverse('search'), {'city': 'City'})
+        self.client.force_login(self.user)
+        logged_in = self.client.get(reverse('search'), {'city': 'City'})
+
+        self.assertContains(anonymous, 'Log in')
+        self.assertNotContains(anonymous, 'Log out')
+        self.assertContains(logged_in, 'Log out')
+        self.assertNotEqual(anonymous['ETag'], logged_in['ETag'])
+        for response in [anonymous, logged_in]:
+            self.assertIn('Cookie', response['Vary'])
+        self.assertFalse(anonymous.cookies)
+
+    def test_search_view_price_range_sorted_pages(self):
+        cheap_room = DormRoom.objects.create(id=2, city='City', room_type='double', private_bathroom=False,
+                                             mini_kitchenette=False, price=300.00, image_name='room-2.jpg')
+        DormRoom.objects.create(id=3, city='City', room_type='double', private_bathroom=False,
+                                mini_kitchenette=False, price=700.00, image_name='room-3.jpg')
+        data = {'min_price': '300 PLN', 'max_price': '500 PLN', 'sort': 'price', 'page_size': 1}
+
+        response = self.client.get(reverse('search'), data)
+
+        self.assertEqual(response.context['room_data'], [cheap_room])
+        response = self.client.get(reverse('search') + '?' + response.context['page'].next_query)
+
+        self.assertEqual(response.context['room_data'], [self.room])
+        self.assertFalse(response.context['page'].has_next())
+
 
 class RoomsViewTest(TestCase):
     """
@@ -454,6 +629,7 @@ class RoomsViewTest(TestCase):
        - setUp: Set up initial data for testing.
        - test_rooms_view_get: Test if the rooms view is accessible and returns room data (GET).
        - test_rooms_view_no_rooms: Test if the rooms view handles no available rooms gracefully (GET).
+       - test_rooms_view_paginated: Test if the rooms view renders one page at a time with a link to the next (GET).
        """
 
     def setUp(self):
@@ -477,3 +653,17 @@ class RoomsViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn('room_data', response.context)
         self.assertEqual(len(response.context['room_data']), 0)
+
+    def test_rooms_view_paginated(self):
+        first_room = DormRoom.objects.order_by('id').first()
+
+        response = self.client.get(reverse('rooms'), {'page_size': 1})
+
+        self.assertEqual(response.context['room_data'], [first_room])
+        self.assertContains(response, f'?page_size=1&amp;after={first_room.id}')
+
+        response = self.client.get(reverse('rooms'), {'page_size': 1, 'after': first_room.id})
+
+        self.assertEqual(len(response.context['room_data']), 1)
+        self.assertNotIn(first_room, response.context['room_data'])
+        self.assertFalse(response.context['page'].has_next())
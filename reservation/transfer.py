@@ -0,0 +1,234 @@
+"""
+Module containing the bulk import and export of room reservations.
+
+Classes:
+- StaySet: Open stays of one room, sorted by check-in date, for overlap checks without queries.
+- ImportResult: Counts and rejected rows of an import.
+
+Functions:
+- read_rows(stream, file_format): Yields the line number and fields of each reservation in a CSV or JSONL stream.
+- import_reservations(rows, chunk_size, today): Validates and inserts reservations chunk by chunk.
+- export_reservations(stream, file_format, queryset, chunk_size): Writes reservations to a CSV or JSONL stream.
+
+Rows are read lazily and handled `chunk_size` at a time. Each chunk runs in its own transaction: the rooms it
+touches are locked with select_for_update, like in the booking service, their open stays are loaded into one
+StaySet per room with a single query, and every row is checked for its dates, the room capacity and overlaps
+against that set before the valid rows are written with one bulk_create. Rejected rows are reported with
+their line number and the rest of the chunk is still imported. As bulk_create bypasses the model signals, the
+occupancy bitmaps of the rooms a chunk touched, and their bed inventory with BOOKING_INVENTORY, are rebuilt in
+the chunk's transaction, and the cached searches are invalidated once it commits, so an import failing partway
+leaves the committed chunks fully visible.
+
+Exports read the reservations with `.iterator(chunk_size=...)` and write them row by row, so memory use does
+not grow with the table.
+
+Author: [ASF]
+Creation Date: [18.10.2026]
+"""
+
+import csv
+import json
+from bisect import bisect_right, insort
+from collections import namedtuple
+from datetime import date
+from itertools import islice
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from reservation.models import DormRoom, RoomReservation
+from reservation import inventory, occupancy, search
+
+FORMATS = ('csv', 'jsonl')
+FIELDS = ['id', 'username', 'room_id', 'check_in_date', 'check_out_date', 'number_of_people', 'is_open']
+IMPORT_FIELDS = ['username', 'room_id', 'check_in_date', 'check_out_date', 'number_of_people']
+
+ImportResult = namedtuple('ImportResult', ['imported', 'rejected'])
+
+
+class StaySet:
+    """
+    Open stays of one room, sorted by check-in date.
+
+    Stays are inclusive date ranges, as in RoomReservationQuerySet.overlapping(). The set relies on the stays it
+    holds not overlapping each other, which the booking service and the importer guarantee, so a new stay only
+    has to be compared with the stay starting closest before its check-out date.
+
+    Methods:
+    - overlaps(check_in_date, check_out_date): Whether the stay overlaps a stay of the set.
+    - add(check_in_date, check_out_date): Adds a stay to the set.
+    """
+
+    def __init__(self, stays=()):
+        self.stays = sorted(stays)
+
+    def overlaps(self, check_in_date, check_out_date):
+        index = bisect_right(self.stays, (check_out_date, date.max))
+        return index > 0 and self.stays[index - 1][1] >= check_in_date
+
+    def add(self, check_in_date, check_out_date):
+        insort(self.stays, (check_in_date, check_out_date))
+
+
+def read_rows(stream, file_format):
+    """
+    Yields the reservations of a CSV file with a header row or of a JSON Lines file.
+
+    Parameters:
+    - stream: text file object
+    - file_format: 'csv' or 'jsonl'
+
+    Returns:
+    - Iterator of (line number, dict of fields) tuples; a line that is not valid JSON yields None as its fields.
+    """
+
+    if file_format == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+def _parse(row):
+    if row is None:
+        raise ValueError('not a JSON object')
+    missing = [field for field in IMPORT_FIELDS if row.get(field) in (None, '')]
+    if missing:
+        raise ValueError(f'missing {", ".join(missing)}')
+    try:
+        check_in_date = date.fromisoformat(str(row['check_in_date']))
+        check_out_date = date.fromisoformat(str(row['check_out_date']))
+        room_id = int(row['room_id'])
+        number_of_people = int(row['number_of_people'])
+    except (TypeError, ValueError) as error:
+        # JSON Lines rows may hold lists or objects where a number or date is expected.
+        raise ValueError(f'invalid value: {error}')
+    return str(row['username']), room_id, check_in_date, check_out_date, number_of_people
+
+
+def _import_chunk(chunk, users, today):
+    rejected = []
+    parsed = []
+    for line_number, row in chunk:
+        try:
+            parsed.append((line_number, _parse(row)))
+        except ValueError as error:
+            rejected.append((line_number, str(error)))
+
+    missing_users = {fields[0] for _, fields in parsed} - users.keys()
+    if missing_users:
+        users.update(User.objects.filter(username__in=missing_users).values_list('username', 'id'))
+
+    room_ids = sorted({fields[1] for _, fields in parsed})
+    reservations = []
+    with transaction.atomic():
+        rooms = DormRoom.objects.select_for_update().filter(id__in=room_ids).order_by('id').only('beds').in_bulk()
+        stay_sets = {room_id: StaySet() for room_id in rooms}
+        open_stays = RoomReservation.objects.filter(room_id__in=rooms, is_open=True)
+        for room_id, check_in_date, check_out_date in open_stays.values_list('room_id', 'check_in_date',
+                                                                             'check_out_date'):
+            stay_sets[room_id].add(check_in_date, check_out_date)
+
+        for line_number, (username, room_id, check_in_date, check_out_date, number_of_people) in parsed:
+            if username not in users:
+                rejected.append((line_number, f'unknown user {username}'))
+            elif room_id not in rooms:
+                rejected.append((line_number, f'unknown room {room_id}'))
+            elif check_out_date < check_in_date:
+                rejected.append((line_number, 'check-out date before check-in date'))
+            elif not 1 <= number_of_people <= rooms[room_id].beds:
+                rejected.append((line_number, 'room is too small for the specified number of guests'))
+            elif stay_sets[room_id].overlaps(check_in_date, check_out_date):
+                rejected.append((line_number, 'room already taken'))
+            else:
+                is_open = check_out_date >= today
+                if is_open:
+                    stay_sets[room_id].add(check_in_date, check_out_date)
+                reservations.append(RoomReservation(user_id=users[username], room_id=room_id,
+                                                    check_in_date=check_in_date, check_out_date=check_out_date,
+                                                    number_of_people=number_of_people, is_open=is_open))
+
+        RoomReservation.objects.bulk_create(reservations)
+        for room_id in sorted({reservation.room_id for reservation in reservations if reservation.is_open}):
+            occupancy.rebuild_room(room_id)
+            if settings.BOOKING_INVENTORY:
+                inventory.rebuild_room(rooms[room_id])
+
+    if reservations:
+        search.invalidate_reservations()
+    return reservations, rejected
+
+
+def import_reservations(rows, chunk_size=2000, today=None):
+    """
+    Validates and inserts reservations, one transaction per chunk of rows.
+
+    Parameters:
+    - rows: iterable of (line number, dict of fields) tuples, such as read_rows() returns
+    - chunk_size: int, number of rows validated and inserted together
+    - today: date deciding which stays are still open, defaults to the current date
+
+    Returns:
+    - ImportResult with the number of inserted reservations and a list of (line number, reason) tuples.
+    """
+
+    today = today or timezone.now().date()
+    rows = iter(rows)
+    users = {}
+    imported = 0
+    rejected = []
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        reservations, chunk_rejected = _import_chunk(chunk, users, today)
+        imported += len(reservations)
+        rejected += chunk_rejected
+
+    return ImportResult(imported, rejected)
+
+
+def export_reservations(stream, file_format, queryset=None, chunk_size=2000):
+    """
+    Writes reservations to a stream without loading them all into memory.
+
+    Parameters:
+    - stream: text file object
+    - file_format: 'csv' or 'jsonl'
+    - queryset: RoomReservation queryset to export, defaults to every reservation
+    - chunk_size: int, number of rows fetched from the database at a time
+
+    Returns:
+    - Number of exported reservations.
+    """
+
+    queryset = RoomReservation.objects.all() if queryset is None else queryset
+    rows = queryset.order_by('id').values_list('id', 'user__username', 'room_id', 'check_in_date',
+                                               'check_out_date', 'number_of_people', 'is_open')
+
+    writer = None
+    if file_format == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(FIELDS)
+
+    count = 0
+    for row in rows.iterator(chunk_size=chunk_size):
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            record = dict(zip(FIELDS, row))
+            record['check_in_date'] = record['check_in_date'].isoformat()
+            record['check_out_date'] = record['check_out_date'].isoformat()
+            stream.write(json.dumps(record) + '\n')
+        count += 1
+    return count
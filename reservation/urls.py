@@ -14,21 +14,31 @@ URL Patterns:
 - 'contact' : Contact page.
 - 'search' : Room search page.
 - 'rooms' : All rooms page.
+- 'room/<int:room_id>/availability' : Room availability calendar (JSON).
+- 'metrics' : Per-view request and SQL statistics (Prometheus text format).
+
+With the ASYNC_VIEWS setting enabled, the index, reservations, search and rooms pages are served by the
+asynchronous views of reservation.async_views.
 """
 
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+read_views = async_views if settings.ASYNC_VIEWS else views
 
 
 urlpatterns = [
-    path('', views.index, name='index'),
+    path('', read_views.index, name='index'),
     path('about', views.about_view, name='about'),
     path('reservation/<int:room_id>/', views.reservation_view, name='reservation'),
-    path('my_reservation', views.my_reservation_view, name='myreservation'),
+    path('my_reservation', read_views.my_reservation_view, name='myreservation'),
     path('register', views.register, name='register'),
     path('login', views.login, name='login'),
     path('logout', views.logout, name='logout'),
     path('contact', views.contact_view, name='contact'),
-    path('search', views.search_view, name='search'),
-    path('rooms', views.rooms, name='rooms'),
+    path('search', read_views.search_view, name='search'),
+    path('rooms', read_views.rooms, name='rooms'),
+    path('room/<int:room_id>/availability', views.room_availability_view, name='room_availability'),
+    path('metrics', views.metrics_view, name='metrics'),
 ]
@@ -11,7 +11,9 @@ Views:
 - logout(request): Handles the user logout process.
 - contact_view(request): Renders the contact page.
 - search_view(request): Handles room search based on user input.
-- rooms(request): Renders the page with all available rooms.
+- rooms(request): Renders the page with all available rooms, paginated by room ID.
+- room_availability_view(request, room_id): Returns the free and occupied days of a room as JSON.
+- metrics_view(request): Returns the per-view request and SQL statistics in the Prometheus text format.
 
 The module uses the DormRoom and RoomReservation models from the 'reservation' app, forms, and HTML templates
 for user interaction. Additionally, it includes helper functions for processing reservation-related data.
@@ -20,15 +22,26 @@ Author: [ASF]
 Creation Date: [13.11.2023]
 """
 
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse, Http404
 from django.shortcuts import render, redirect
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import urlencode
 from django.contrib.auth.models import User, auth
 from django.contrib import messages
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare
 from reservation.forms import RoomReservationForm
 from reservation.models import DormRoom, RoomReservation
+from reservation.services import book_room, BookingError
+from reservation.pagination import KeysetPaginator
+from reservation import inventory, occupancy
+from reservation.metrics import view_stats, render_exposition
+from reservation.search import (normalize_filters, search_paginator, search_page, search_last_modified,
+                                search_etag, catalog_snapshot)
+from datetime import datetime, timedelta
 from random import sample
-import decimal
-from datetime import datetime
 
 
 def index(request):
@@ -42,89 +55,13 @@ def index(request):
     - Rendered HTML page with a random selection of rooms.
     """
 
-    initial_data = [
-        {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 500.00, 'image_name': 'room-1.jpg'},
-        {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 500.00, 'image_name': 'room-2.jpg'},
-        {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': True,
-         'price': 700.00, 'image_name': 'room-3.jpg'},
-        {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': True,
-         'price': 700.00, 'image_name': 'room-4.jpg'},
-        {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': True,
-         'private_bathroom': True,
-         'price': 700.00, 'image_name': 'room-5.jpg'},
-        {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'double', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 400.00, 'image_name': 'room-6.jpg'},
-        {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'double', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 400.00, 'image_name': 'room-7.jpg'},
-        {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 500.00, 'image_name': 'room-8.jpg'},
-        {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'double', 'mini_kitchenette': True,
-         'private_bathroom': False,
-         'price': 400.00, 'image_name': 'room-9.jpg'},
-        {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'triple', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 300.00, 'image_name': 'room-10.jpg'},
-        {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': True,
-         'price': 700.00, 'image_name': 'room-11.jpg'},
-        {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'double', 'mini_kitchenette': False,
-         'private_bathroom': True,
-         'price': 400.00, 'image_name': 'room-12.jpg'},
-        {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 500.00, 'image_name': 'room-13.jpg'},
-        {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 500.00, 'image_name': 'room-14.jpg'},
-        {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': True,
-         'private_bathroom': True,
-         'price': 700.00, 'image_name': 'room-15.jpg'},
-        {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': True,
-         'private_bathroom': True,
-         'price': 700.00, 'image_name': 'room-16.jpg'},
-        {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 500.00, 'image_name': 'room-17.jpg'},
-        {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'single', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 500.00, 'image_name': 'room-18.jpg'},
-        {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'double', 'mini_kitchenette': True,
-         'private_bathroom': True,
-         'price': 400.00, 'image_name': 'room-19.jpg'},
-        {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'double', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 400.00, 'image_name': 'room-20.jpg'},
-        {'city': 'Poznań', 'street': 'Stary Rynek', 'room_type': 'triple', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 300.00, 'image_name': 'room-21.jpg'},
-        {'city': 'Warszawa', 'street': 'Nowy Świat', 'room_type': 'triple', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 300.00, 'image_name': 'room-22.jpg'},
-        {'city': 'Kraków', 'street': 'Krupnicza', 'room_type': 'triple', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 300.00, 'image_name': 'room-23.jpg'},
-        {'city': 'Szczecin', 'street': 'Krzywoustego', 'room_type': 'triple', 'mini_kitchenette': False,
-         'private_bathroom': False,
-         'price': 300.00, 'image_name': 'room-24.jpg'},
-    ]
-
-    if not DormRoom.objects.exists():
-
-        for data in initial_data:
-            room = DormRoom(**data)
-            room.save()
-
-    all_rooms = list(DormRoom.objects.all())
-    random_rooms = sample(all_rooms, 5)
+    if settings.CATALOG_SNAPSHOT:
+        room_ids = catalog_snapshot().sorted_ids
+        picked = sample(room_ids, min(5, len(room_ids)))
+        rooms_by_id = DormRoom.objects.in_bulk(picked)
+        random_rooms = [rooms_by_id[room_id] for room_id in picked if room_id in rooms_by_id]
+    else:
+        random_rooms = DormRoom.objects.random_sample(5)
 
     return render(request, 'index.html', {'room_data': random_rooms})
 
@@ -151,16 +88,22 @@ def my_reservation_view(request):
         - request: HttpRequest object
 
         Returns:
-        - Rendered HTML page displaying the user's open and closed reservations.
+        - Rendered HTML page displaying one page of the user's open reservations, by check-in date, and one page of
+          closed reservations, newest first; each list has its own cursors in the query string. Reservations are
+          split by their is_open flag, which the close_expired_reservations command clears once the stay has ended.
         """
 
     if request.user.is_authenticated:
-        today = timezone.now().date()
-        open_reservations = RoomReservation.objects.filter(user=request.user, check_out_date__gte=today)
-        closed_reservations = RoomReservation.objects.filter(user=request.user, check_out_date__lt=today)
+        reservations = RoomReservation.objects.filter(user=request.user).select_related('room')
+        open_page = KeysetPaginator(key=('check_in_date', 'id'), prefix='open_').paginate_request(
+            reservations.filter(is_open=True), request)
+        page = KeysetPaginator(key='-id').paginate_request(reservations.filter(is_open=False), request)
 
         return render(request, 'my_reservation.html',
-                      {'open_reservations': open_reservations, 'closed_reservations': closed_reservations})
+                      {'open_reservations': open_page.object_list,
+                       'open_page': open_page,
+                       'closed_reservations': page.object_list,
+                       'page': page})
     else:
         return redirect('login')
 
@@ -175,12 +118,14 @@ def reservation_view(request, room_id):
         Returns:
         - If the user is authenticated:
           - If the request method is POST:
-            - If the form is valid, save the reservation and redirect to 'myreservation' page.
+            - If the form is valid, book the reservation through the booking service and redirect to 'myreservation'
+              page.
               - If the room is already reserved for the selected dates, display an error message.
               - If the number of students is greater than number of beds, display an error message.
             - If the form is invalid, re-render the reservation page with the form and room details.
           - If the request method is GET, render the reservation page with an empty reservation form
-            and details of the selected room, along with the user's open and closed reservations.
+            and details of the selected room, along with one page each of the user's open and closed reservations,
+            newest first.
         - If the user is not authenticated, redirect to the 'login' page.
         """
 
@@ -203,17 +148,12 @@ def reservation_view(request, room_id):
                 else:
                     reservation.is_open = True
 
-                if reservation.number_of_people > room.get_beds():
-                    messages.error(request, 'Room is too small for the specified number of guests')
-                    return render(request, 'reservation.html', {'form': form, 'room': room})
-
-                if RoomReservation.objects.filter(room=room, is_open=True,
-                                                  check_in_date__lte=reservation.check_out_date,
-                                                  check_out_date__gte=reservation.check_in_date).exists():
-                    messages.error(request, 'Room already taken')
+                try:
+                    book_room(reservation)
+                except BookingError as error:
+                    messages.error(request, str(error))
                     return render(request, 'reservation.html', {'form': form, 'room': room})
 
-                reservation.save()
                 return redirect('myreservation')
 
             else:
@@ -223,12 +163,16 @@ def reservation_view(request, room_id):
         else:
             form = RoomReservationForm()
 
-        open_reservations = RoomReservation.objects.filter(user=request.user, is_open=True)
-        closed_reservations = RoomReservation.objects.filter(user=request.user, is_open=False)
+        reservations = RoomReservation.objects.filter(user=request.user).select_related('room')
+        open_page = KeysetPaginator(key='-id', prefix='open_').paginate_request(reservations.filter(is_open=True),
+                                                                               request)
+        closed_page = KeysetPaginator(key='-id', prefix='closed_').paginate_request(
+            reservations.filter(is_open=False), request)
 
         return render(request, 'reservation.html',
-                      {'form': form, 'room': room, 'open_reservations': open_reservations,
-                       'closed_reservations': closed_reservations})
+                      {'form': form, 'room': room, 'open_reservations': open_page.object_list,
+                       'open_page': open_page, 'closed_reservations': closed_page.object_list,
+                       'closed_page': closed_page})
 
     else:
         return redirect('login')
@@ -328,68 +272,51 @@ def search_view(request):
     """
        View for handling room search based on user input.
 
+       Filters are read from the query string, so result pages can be bookmarked and cached. A submitted search
+       form (POST) is redirected to the equivalent GET URL. Responses carry an ETag, and a conditional request
+       for an unchanged result is answered with 304 Not Modified without rendering. There is no Last-Modified
+       header: deleting a room does not move the latest modification time, while it changes the ETag.
+       Matching room IDs come one page at a time from the search result cache, see reservation.search, in the
+       order selected by the `sort` parameter.
+       The navbar shows Log in or Log out, so the ETag also covers whether the visitor is logged in, and reading
+       the session makes the response vary on Cookie.
+
        Parameters:
        - request: HttpRequest object
 
        Returns:
-       - Rendered HTML search results page.
+       - Redirect to the GET search URL for POST requests.
+       - Rendered HTML search results page, or an empty 304 response.
        """
 
-    filtered_data = DormRoom.objects.all()
-
-    keyword = request.POST.get('keyword')
-    arrival_departure = request.POST.get('arrival_departure')
-    city = request.POST.get('city')
-    room_type = request.POST.get('room_type')
-    mini_kitchenette = request.POST.get('mini_kitchenette')
-    private_bathroom = request.POST.get('private_bathroom')
-    price = request.POST.get('price')
-
-    if keyword:
-        keyword = keyword.lower()
-        filtered_data = filtered_data.filter(city__icontains=keyword)
-
-    if arrival_departure:
-        start_date, end_date = map(lambda x: datetime.strptime(x.strip(), '%Y-%m-%d'), arrival_departure.split(' to '))
-        filtered_data = DormRoom.objects.filter(
-            id__in=[room.id for room in filtered_data if room.is_available(start_date, end_date)])
-
-    if city:
-        filtered_data = filtered_data.filter(city=city)
-
-    if room_type:
-        if room_type == 'Single':
-            filtered_data = filtered_data.filter(room_type='single')
-        elif room_type == 'Double':
-            filtered_data = filtered_data.filter(room_type='double')
-        elif room_type == 'Triple':
-            filtered_data = filtered_data.filter(room_type='triple')
-
-    if mini_kitchenette:
-        if mini_kitchenette == 'Yes':
-            filtered_data = filtered_data.filter(mini_kitchenette=True)
-        elif mini_kitchenette == 'No':
-            filtered_data = filtered_data.filter(mini_kitchenette=False)
-
-    if private_bathroom:
-        if private_bathroom == 'Yes':
-            filtered_data = filtered_data.filter(private_bathroom=True)
-        elif private_bathroom == 'No':
-            filtered_data = filtered_data.filter(private_bathroom=False)
-
-    if price:
-        if price == 'Unlimited':
-            filtered_data = filtered_data.all()
-        else:
-            price = decimal.Decimal(price.replace(' PLN', '').replace(',', ''))
-            filtered_data = filtered_data.filter(price=price)
+    if request.method == 'POST':
+        params = request.POST.copy()
+        params.pop('csrfmiddlewaretoken', None)
+        query = urlencode({name: value for name, value in params.items() if value})
+        return redirect(f"{reverse('search')}?{query}")
+
+    filters = normalize_filters(request.GET)
+    paginator = search_paginator(filters)
+    params, after, before = paginator.read_request(request, DormRoom)
+    page = search_page(filters, after, before, paginator.page_size)
+
+    last_modified = search_last_modified(filters)
+    etag = search_etag(filters, page, last_modified,
+                       variant=(request.GET.urlencode(), request.user.is_authenticated))
 
-    return render(request, 'search.html', {'room_data': filtered_data})
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        page = paginator.link(paginator.load(page, DormRoom.objects.all()), params)
+        response = render(request, 'search.html', {'room_data': page.object_list, 'page': page})
+
+    response['ETag'] = etag
+    patch_cache_control(response, no_cache=True)
+    return response
 
 
 def rooms(request):
     """
-        View for rendering the rooms page with all available rooms.
+        View for rendering the rooms page with all available rooms, one keyset-paginated page at a time.
 
         Parameters:
         - request: HttpRequest object
@@ -397,6 +324,68 @@ def rooms(request):
         Returns:
         - Rendered HTML rooms page.
         """
-    all_rooms = list(DormRoom.objects.all())
-    return render(request, 'rooms.html', {'room_data': all_rooms})
+    room_ids = catalog_snapshot().sorted_ids if settings.CATALOG_SNAPSHOT else None
+    page = KeysetPaginator().paginate_request(DormRoom.objects.all(), request, ids=room_ids)
+    return render(request, 'rooms.html', {'room_data': page.object_list, 'page': page})
+
+
+def room_availability_view(request, room_id):
+    """
+        View returning the availability calendar of a room as JSON.
+
+        Parameters:
+        - request: HttpRequest object; the optional 'start' (YYYY-MM-DD, default today) and 'days' (default 365)
+          query parameters select the date window
+        - room_id: int, ID of the room
+
+        Returns:
+        - JSON response with the window bounds and the lists of free and occupied days; with BOOKING_INVENTORY a
+          day is only occupied when no bed of the room is free.
+        """
+
+    if not DormRoom.objects.filter(id=room_id).exists():
+        raise Http404('Room does not exist')
+
+    try:
+        start_date = datetime.strptime(request.GET['start'], '%Y-%m-%d').date()
+    except (KeyError, ValueError):
+        start_date = timezone.now().date()
+    try:
+        days = max(1, min(int(request.GET.get('days', settings.AVAILABILITY_DAYS)), settings.MAX_AVAILABILITY_DAYS))
+    except ValueError:
+        days = settings.AVAILABILITY_DAYS
+
+    dates = [start_date + timedelta(days=day) for day in range(days)]
+    room_calendar = inventory.room_calendar if settings.BOOKING_INVENTORY else occupancy.room_calendar
+    occupied_days = room_calendar(room_id, start_date, days)
+
+    return JsonResponse({
+        'room': room_id,
+        'start': dates[0].isoformat(),
+        'end': dates[-1].isoformat(),
+        'occupied': [day.isoformat() for day, occupied in zip(dates, occupied_days) if occupied],
+        'free': [day.isoformat() for day, occupied in zip(dates, occupied_days) if not occupied],
+    })
+
+
+def metrics_view(request):
+    """
+        View returning the statistics recorded by ViewStatsMiddleware in this server process.
+
+        Parameters:
+        - request: HttpRequest object; only answered with the METRICS_TOKEN setting as a bearer token or, when
+          no token is set, for the addresses in the METRICS_ALLOWED_IPS setting
+
+        Returns:
+        - Plain text response in the Prometheus text exposition format.
+        """
+
+    if settings.METRICS_TOKEN:
+        allowed = constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {settings.METRICS_TOKEN}')
+    else:
+        allowed = request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS
+    if not allowed:
+        raise Http404('Metrics are not available')
 
+    return HttpResponse(render_exposition(view_stats.snapshot()),
+                        content_type='text/plain; version=0.0.4; charset=utf-8')